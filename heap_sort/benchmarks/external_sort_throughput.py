@@ -0,0 +1,66 @@
+# external_sort_throughput.py
+
+import os
+import random
+import sys
+import tempfile
+import time
+from src.external_sort import external_sort
+
+# Memory budget for every run. The default file sizes are 4 and 16 times it.
+MEMORY_BUDGET = 4 << 20
+
+VARIANTS = {
+    "merge_sort": {},
+    "merge_sort, fan-in 4": {"fan_in": 4},
+    "list.sort": {"sort": list.sort},
+}
+
+
+def write_random_file(path: str, size: int) -> None:
+    """Write size random int64 values to path, one block at a time."""
+    with open(path, "wb") as output:
+        for lo in range(0, size, 1 << 20):
+            output.write(random.randbytes(8 * min(1 << 20, size - lo)))
+
+
+def main():
+    """
+    Time external_sort with a MEMORY_BUDGET budget on binary files of random
+    int64 values (pass value counts as arguments; default 2 * 10^6 and
+    8 * 10^6, i.e. 16 MB and 64 MB files), with the default fan-in, with a
+    fan-in of 4 (more merge passes), and with list.sort forming the runs.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2_000_000, 8_000_000]
+    random.seed(0)
+    print(f"Memory budget: {MEMORY_BUDGET >> 20} MB")
+    print(
+        f"{'File (MB)':<10} {'Variant':<21} {'Runs':<5} {'Passes':<7} "
+        f"{'Time (s)':<9} {'MB/s':<6}"
+    )
+    print("=" * 62)
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, "input.bin")
+        output_path = os.path.join(work_dir, "output.bin")
+        for size in sizes:
+            write_random_file(input_path, size)
+            megabytes = size * 8 / (1 << 20)
+            for name, options in VARIANTS.items():
+                start_time = time.perf_counter()
+                stats = external_sort(
+                    input_path,
+                    output_path,
+                    MEMORY_BUDGET,
+                    temp_dir=work_dir,
+                    **options,
+                )
+                seconds = time.perf_counter() - start_time
+                print(
+                    f"{megabytes:<10.0f} {name:<21} {stats['runs']:<5} "
+                    f"{stats['merge_passes']:<7} {seconds:<9.2f} "
+                    f"{megabytes / seconds:<6.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# heap_sort_variants.py
+
+import random
+import sys
+import time
+from src.heap_sort import heap_sort
+from utils import dataset_utils
+
+
+def recursive_heapify(arr: list, n: int, i: int) -> None:
+    """The original heapify: one recursive call and one swap per level."""
+    largest = i
+    left = 2 * i + 1
+    right = 2 * i + 2
+
+    if left < n and arr[left] > arr[largest]:
+        largest = left
+    if right < n and arr[right] > arr[largest]:
+        largest = right
+
+    if largest != i:
+        arr[i], arr[largest] = arr[largest], arr[i]
+        recursive_heapify(arr, n, largest)
+
+
+def recursive_heap_sort(arr: list) -> None:
+    """The original heap_sort, kept as the baseline."""
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        recursive_heapify(arr, n, i)
+    for i in range(n - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        recursive_heapify(arr, i, 0)
+
+
+VARIANTS = {
+    "recursive": recursive_heap_sort,
+    "hole sift-down": lambda arr: heap_sort(arr, bottom_up=False),
+    "bottom-up": heap_sort,
+    "bottom-up, key=": lambda arr: heap_sort(arr, key=abs),
+    "sorted()": lambda arr: arr.sort(),
+}
+
+
+def time_sort(sort, data: list) -> float:
+    """Seconds to sort a copy of data."""
+    arr = data.copy()
+    start_time = time.perf_counter()
+    sort(arr)
+    return time.perf_counter() - start_time
+
+
+def main():
+    """
+    Time the original recursive heapsort against the iterative hole-based and
+    bottom-up versions (and list.sort for reference) on random, sorted and
+    reverse-sorted data (pass sizes as arguments; default 10^5 and 10^6).
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    random.seed(0)
+    print(f"{'Size':<9} {'Dataset':<8} {'Variant':<16} {'Time (s)':<9} {'Speedup':<8}")
+    print("=" * 54)
+    for size in sizes:
+        datasets = {
+            "Random": dataset_utils.generate_random_dataset(size),
+            "Sorted": dataset_utils.generate_sorted_dataset(size),
+            "Reverse": dataset_utils.generate_reverse_sorted_dataset(size),
+        }
+        for dtype, data in datasets.items():
+            baseline = None
+            for name, sort in VARIANTS.items():
+                seconds = time_sort(sort, data)
+                baseline = baseline or seconds
+                print(
+                    f"{size:<9} {dtype:<8} {name:<16} {seconds:<9.3f} "
+                    f"{baseline / seconds:<8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# heap_streaming.py
+
+import heapq
+import random
+import sys
+import time
+from src.heap_sort import heap_sort, merge_sorted, partial_heap_sort, top_k
+from utils import dataset_utils
+
+K = 100
+RUNS = 16
+
+
+def full_heap_sort_top(arr: list) -> list:
+    """The k largest by a full heap_sort, the baseline for top_k."""
+    heap_sort(arr)
+    return arr[: -K - 1 : -1]
+
+
+def full_heap_sort_merge(runs: list) -> list:
+    """Merge by concatenating the runs and sorting with heap_sort."""
+    merged = [item for run in runs for item in run]
+    heap_sort(merged)
+    return merged
+
+
+TASKS = {
+    f"top {K}": {
+        "heap_sort": full_heap_sort_top,
+        "top_k": lambda arr: top_k(arr, K),
+        "heapq.nlargest": lambda arr: heapq.nlargest(K, arr),
+        "sorted()": lambda arr: sorted(arr)[: -K - 1 : -1],
+    },
+    f"merge {RUNS} runs": {
+        "heap_sort": full_heap_sort_merge,
+        "merge_sorted": lambda runs: list(merge_sorted(*runs)),
+        "heapq.merge": lambda runs: list(heapq.merge(*runs)),
+        "sorted()": lambda runs: sorted(item for run in runs for item in run),
+    },
+    f"first {K} sorted": {
+        "heap_sort": lambda arr: heap_sort(arr),
+        "partial_heap_sort": lambda arr: partial_heap_sort(arr, K),
+        "heapq.nsmallest": lambda arr: heapq.nsmallest(K, arr),
+        "sorted()": lambda arr: sorted(arr)[:K],
+    },
+}
+
+
+def time_call(func, data) -> float:
+    """Seconds to run func on a copy of data."""
+    data = data.copy()
+    start_time = time.perf_counter()
+    func(data)
+    return time.perf_counter() - start_time
+
+
+def main():
+    """
+    Time top_k, merge_sorted and partial_heap_sort against a full heap_sort
+    and their standard library counterparts (pass sizes as arguments; default
+    10^5 and 10^6). The merge task merges RUNS sorted runs of the same total
+    size; the others keep K items.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    random.seed(0)
+    print(f"{'Size':<9} {'Task':<16} {'Variant':<18} {'Time (s)':<9} {'Speedup':<8}")
+    print("=" * 64)
+    for size in sizes:
+        data = dataset_utils.generate_random_dataset(size, upper=size)
+        runs = [sorted(data[i::RUNS]) for i in range(RUNS)]
+        for task, variants in TASKS.items():
+            baseline = None
+            for name, func in variants.items():
+                seconds = time_call(func, runs if task.startswith("merge") else data)
+                baseline = baseline or seconds
+                print(
+                    f"{size:<9} {task:<16} {name:<18} {seconds:<9.3f} "
+                    f"{baseline / seconds:<8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# merge_sort_variants.py
+
+import random
+import sys
+import time
+import tracemalloc
+from src import merge_sort
+from utils import dataset_utils
+
+
+def slicing_merge_sort(arr: list) -> None:
+    """The original merge_sort, which copies both halves at every level."""
+    if len(arr) <= 1:
+        return
+
+    mid = len(arr) // 2
+    left = arr[:mid]
+    right = arr[mid:]
+
+    slicing_merge_sort(left)
+    slicing_merge_sort(right)
+
+    i = j = k = 0
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            arr[k] = left[i]
+            i += 1
+        else:
+            arr[k] = right[j]
+            j += 1
+        k += 1
+    while i < len(left):
+        arr[k] = left[i]
+        i += 1
+        k += 1
+    while j < len(right):
+        arr[k] = right[j]
+        j += 1
+        k += 1
+
+
+VARIANTS = {
+    "slicing": slicing_merge_sort,
+    "adaptive": merge_sort.merge_sort,
+    "adaptive, key=": lambda arr: merge_sort.merge_sort(arr, key=abs),
+    "sorted()": lambda arr: arr.sort(),
+}
+
+
+def time_sort(sort, data: list) -> float:
+    """Seconds to sort a copy of data."""
+    arr = data.copy()
+    start_time = time.perf_counter()
+    sort(arr)
+    return time.perf_counter() - start_time
+
+
+def peak_memory_kb(sort, data: list) -> float:
+    """Peak traced memory while sorting a copy of data, in KB."""
+    arr = data.copy()
+    tracemalloc.start()
+    sort(arr)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    """
+    Compare the original slicing merge sort with the adaptive single-buffer
+    version on random, sorted and reverse-sorted data: time, speedup and peak
+    memory (pass sizes as arguments; default 10^5 and 10^6). Then time the
+    adaptive sort on random data for several insertion sort cutoffs.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    random.seed(0)
+    print(
+        f"{'Size':<9} {'Dataset':<8} {'Variant':<15} {'Time (s)':<9} "
+        f"{'Speedup':<8} {'Memory (KB)':<12}"
+    )
+    print("=" * 66)
+    for size in sizes:
+        datasets = {
+            "Random": dataset_utils.generate_random_dataset(size),
+            "Sorted": dataset_utils.generate_sorted_dataset(size),
+            "Reverse": dataset_utils.generate_reverse_sorted_dataset(size),
+        }
+        for dtype, data in datasets.items():
+            baseline = None
+            for name, sort in VARIANTS.items():
+                seconds = time_sort(sort, data)
+                baseline = baseline or seconds
+                memory_kb = peak_memory_kb(sort, data)
+                print(
+                    f"{size:<9} {dtype:<8} {name:<15} {seconds:<9.3f} "
+                    f"{baseline / seconds:<8.2f} {memory_kb:<12.1f}"
+                )
+
+    data = dataset_utils.generate_random_dataset(sizes[0])
+    default = merge_sort.INSERTION_CUTOFF
+    print(f"\nInsertion cutoff, {sizes[0]} random elements (best of 3)")
+    print(f"{'Cutoff':<8} {'Time (s)':<9}")
+    print("=" * 18)
+    for cutoff in [1, 8, 16, 32, 64, 128]:
+        merge_sort.INSERTION_CUTOFF = cutoff
+        seconds = min(time_sort(merge_sort.merge_sort, data) for _ in range(3))
+        print(f"{cutoff:<8} {seconds:<9.3f}")
+    merge_sort.INSERTION_CUTOFF = default
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# parallel_sort_scaling.py
+
+import os
+import random
+import sys
+import time
+from array import array
+from src.parallel_sort import METHODS, parallel_sort
+from utils import dataset_utils
+
+WORKER_COUNTS = sorted({2, 4, 8, os.cpu_count() or 1} - {1})
+
+
+def time_sort(data: array, max_workers: int, method: str) -> float:
+    """Seconds to sort a copy of data with parallel_sort."""
+    values = array(data.typecode, data)
+    start_time = time.perf_counter()
+    parallel_sort(values, max_workers=max_workers, method=method)
+    return time.perf_counter() - start_time
+
+
+def main():
+    """
+    Time parallel_sort (with merge_sort on each chunk) against the serial
+    merge_sort, for each method and worker count in WORKER_COUNTS, on random
+    int64 arrays (pass sizes as arguments; default 10^4, 10^5 and 10^6).
+    Prints the speedup curve, then the break-even size per method: the
+    smallest size at which some worker count beats the serial sort.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    random.seed(0)
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'Size':<9} {'Method':<7} {'Workers':<8} {'Time (s)':<9} {'Speedup':<8}")
+    print("=" * 44)
+    break_even = {}
+    for size in sizes:
+        data = array(
+            "q", dataset_utils.generate_random_dataset(size, upper=size * 1000)
+        )
+        serial = time_sort(data, 1, "merge")
+        print(f"{size:<9} {'serial':<7} {1:<8} {serial:<9.3f} {1:<8.2f}")
+        for method in METHODS:
+            for workers in WORKER_COUNTS:
+                seconds = time_sort(data, workers, method)
+                print(
+                    f"{size:<9} {method:<7} {workers:<8} {seconds:<9.3f} "
+                    f"{serial / seconds:<8.2f}"
+                )
+                if seconds < serial:
+                    break_even.setdefault(method, size)
+    print()
+    for method in METHODS:
+        size = break_even.get(method)
+        found = f"{size:,}" if size else f"none up to {max(sizes):,}"
+        print(f"Break-even size ({method}): {found}")
+
+
+if __name__ == "__main__":
+    main()
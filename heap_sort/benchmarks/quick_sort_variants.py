@@ -0,0 +1,100 @@
+# quick_sort_variants.py
+
+import random
+import sys
+import time
+from src import quick_sort
+from utils import dataset_utils
+
+
+def lomuto_quick_sort(arr: list) -> None:
+    """The original quick_sort: Lomuto partition, random pivot, both sides recursive."""
+
+    def partition(a, low, high):
+        pivot_index = random.randint(low, high)
+        a[pivot_index], a[high] = a[high], a[pivot_index]
+        pivot = a[high]
+        i = low
+        for j in range(low, high):
+            if a[j] < pivot:
+                a[i], a[j] = a[j], a[i]
+                i += 1
+        a[i], a[high] = a[high], a[i]
+        return i
+
+    def _quick_sort(a, low, high):
+        if low < high:
+            p = partition(a, low, high)
+            _quick_sort(a, low, p - 1)
+            _quick_sort(a, p + 1, high)
+
+    _quick_sort(arr, 0, len(arr) - 1)
+
+
+def time_sort(sort, data: list):
+    """Seconds to sort a copy of data, or the name of the error it raised."""
+    arr = data.copy()
+    start_time = time.perf_counter()
+    try:
+        sort(arr)
+    except RecursionError:
+        return "RecursionError"
+    return time.perf_counter() - start_time
+
+
+class FallbackCounter:
+    """Wraps quick_sort._heap_sort_range to count introsort fallbacks."""
+
+    def __init__(self):
+        self.calls = 0
+        self.heap_sort_range = quick_sort._heap_sort_range
+
+    def __call__(self, a, lo, hi):
+        self.calls += 1
+        self.heap_sort_range(a, lo, hi)
+
+    def __enter__(self):
+        quick_sort._heap_sort_range = self
+        return self
+
+    def __exit__(self, *exc_info):
+        quick_sort._heap_sort_range = self.heap_sort_range
+
+
+def main():
+    """
+    Compare the original Lomuto quicksort with the introsort on random
+    (duplicate-heavy, values 0-1000), sorted, reverse-sorted, all-equal and
+    median-of-three-killer inputs, counting heapsort fallbacks (pass sizes
+    as arguments; default 10^5 and 10^6).
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    random.seed(0)
+    print(
+        f"{'Size':<9} {'Dataset':<8} {'Lomuto (s)':<16} {'Introsort (s)':<14} "
+        f"{'Fallbacks':<10} {'sorted() (s)':<12}"
+    )
+    print("=" * 74)
+    for size in sizes:
+        datasets = {
+            "Random": dataset_utils.generate_random_dataset(size),
+            "Sorted": dataset_utils.generate_sorted_dataset(size),
+            "Reverse": dataset_utils.generate_reverse_sorted_dataset(size),
+            "Equal": [7] * size,
+            "Killer": dataset_utils.generate_quicksort_killer_dataset(size),
+        }
+        for dtype, data in datasets.items():
+            lomuto = time_sort(lomuto_quick_sort, data)
+            with FallbackCounter() as fallbacks:
+                introsort = time_sort(quick_sort.quick_sort, data)
+            builtin = time_sort(list.sort, data)
+            if not isinstance(lomuto, str):
+                lomuto = f"{lomuto:.3f}"
+            print(
+                f"{size:<9} {dtype:<8} {lomuto:<16} {introsort:<14.3f} "
+                f"{fallbacks.calls:<10} {builtin:<12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# typed_sort_engine.py
+
+import random
+import sys
+import time
+from array import array
+from src import typed_sort as typed_sort_module
+from src.heap_sort import heap_sort
+from src.merge_sort import merge_sort
+from src.quick_sort import quick_sort
+from src.typed_sort import typed_sort
+
+# The list-based sorts (and the boxing fallback) take seconds per million
+# elements, so they are only timed up to this size.
+PYTHON_LIMIT = 1_000_000
+
+
+def _list_sort(sort):
+    """Run a list sort on the values of a typed array, boxing them first."""
+
+    def run(values: array) -> None:
+        arr = values.tolist()
+        sort(arr)
+        values[:] = array(values.typecode, arr)
+
+    return run
+
+
+PYTHON_VARIANTS = {
+    "typed_sort, no NumPy": lambda values: typed_sort_module._sort_array(
+        values, typed_sort_module.BLOCK_SIZE
+    ),
+    "heap_sort": _list_sort(heap_sort),
+    "merge_sort": _list_sort(merge_sort),
+    "quick_sort": _list_sort(quick_sort),
+    "sorted()": _list_sort(list.sort),
+}
+
+
+def random_int64(size: int) -> array:
+    """size random int64 values, generated without boxing them."""
+    values = array("q")
+    # randbytes is limited to 2^31 bits per call.
+    for lo in range(0, size, 1 << 20):
+        values.frombytes(random.randbytes(8 * min(1 << 20, size - lo)))
+    return values
+
+
+def time_sort(sort, data: array) -> float:
+    """Seconds to sort a copy of data."""
+    values = array(data.typecode, data)
+    start_time = time.perf_counter()
+    sort(values)
+    return time.perf_counter() - start_time
+
+
+def main():
+    """
+    Time the typed sort engine on int64 arrays against the list-based sorts,
+    which sort the same values boxed in a list (pass sizes as arguments;
+    default 10^6 and 10^7). The list-based sorts are skipped above
+    PYTHON_LIMIT. Without NumPy only the stdlib fallback is timed.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+    random.seed(0)
+    if typed_sort_module.np is None:
+        python_variants = {
+            name: sort for name, sort in PYTHON_VARIANTS.items() if "NumPy" not in name
+        }
+    else:
+        python_variants = PYTHON_VARIANTS
+    print(f"{'Size':<11} {'Variant':<22} {'Time (s)':<9} {'Gap':<8}")
+    print("=" * 52)
+    for size in sizes:
+        data = random_int64(size)
+        sorts = {"typed_sort": typed_sort}
+        if size <= PYTHON_LIMIT:
+            sorts.update(python_variants)
+        baseline = None
+        for name, sort in sorts.items():
+            seconds = time_sort(sort, data)
+            baseline = baseline or seconds
+            print(f"{size:<11} {name:<22} {seconds:<9.3f} {seconds / baseline:<8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,81 +1,255 @@
+import argparse
+import math
 import os
-import csv
-from src import merge_sort, quick_sort, heap_sort
-from utils import dataset_utils, metrics_utils, plot_utils, file_utils
+from src.registry import ALGORITHMS
+from utils import benchmark_utils, dataset_utils, file_utils, plot_utils
 
+# Operation counts (--count-ops) by result key, with their CSV column and
+# plot names.
+COUNT_COLUMNS = {
+    "comparisons": "Comparisons",
+    "moves": "Moves",
+    "allocations": "Allocations",
+    "max_depth": "Max Recursion Depth",
+}
 
-def main():
+
+def parse_args(argv=None):
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the registered sorting algorithms."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[500, 1000, 2000, 5000],
+        help="dataset sizes (up to 10^7; default: 500 1000 2000 5000)",
+    )
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        choices=list(dataset_utils.DATASET_TYPES),
+        default=["Sorted", "Reverse", "Random"],
+        metavar="TYPE",
+        help=(
+            f"dataset types, of {', '.join(dataset_utils.DATASET_TYPES)} "
+            "(default: Sorted Reverse Random)"
+        ),
+    )
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=list(ALGORITHMS),
+        default=list(ALGORITHMS),
+        metavar="NAME",
+        help=f"registered algorithms (default: all of {', '.join(ALGORITHMS)})",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="timed runs per cell (default: 5)"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="untimed runs first (default: 1)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed for random datasets (default: 0)"
+    )
+    parser.add_argument(
+        "--no-gc-control",
+        dest="gc_control",
+        action="store_false",
+        help="leave the garbage collector running during timed runs",
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="measure_memory",
+        action="store_false",
+        help="skip the tracemalloc pass",
+    )
+    parser.add_argument(
+        "--count-ops",
+        dest="count_operations",
+        action="store_true",
+        help="count comparisons, moves, allocations and recursion depth "
+        "in one more, instrumented run per cell",
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="measure every cell in a freshly spawned process",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="cells measured at once, on a process pool (default: 1)",
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="pin each running cell to its own CPU",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.path.join("outputs", "cache"),
+        help="directory of cached cell results (default: outputs/cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache_dir",
+        action="store_const",
+        const=None,
+        help="measure every cell, without reading or writing the cache",
+    )
+    parser.add_argument(
+        "--dataset-dir",
+        default=dataset_utils.DATASET_CACHE_DIR,
+        help="directory of generated datasets (default: outputs/datasets)",
+    )
+    parser.add_argument(
+        "--no-dataset-cache",
+        dest="dataset_dir",
+        action="store_const",
+        const=None,
+        help="generate every dataset in memory instead of caching it",
+    )
+    parser.add_argument(
+        "--no-plots", dest="plots", action="store_false", help="skip the plots"
+    )
+    args = parser.parse_args(argv)
+    if args.repeats < 1 or args.warmup < 0:
+        parser.error("--repeats must be at least 1 and --warmup at least 0")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
+def main(argv=None):
     """
-    Benchmarks Heap Sort, Merge Sort, and Quick Sort on various dataset types and sizes.
-    Saves performance results to CSV files and generates plots.
+    Benchmarks the registered sorting algorithms on various dataset types and sizes.
+
+    Every (algorithm, dataset, size) cell is timed over several runs after
+    warmup runs, with the garbage collector paused, and its peak memory is
+    measured in a separate run under tracemalloc. Cells can run in parallel,
+    and finished cells are cached, so a rerun only measures what changed.
+    Datasets are generated once and memory-mapped from outputs/datasets.
+    With --count-ops, one more run on instrumented input counts the
+    comparisons, moves, allocations and recursion depth of each sort.
+    Reports the median, IQR and minimum time per cell. Saves performance
+    results to CSV files and generates plots. Run with --help for the options.
     """
-    dataset_sizes = [500, 1000, 2000, 5000]
-    dataset_types = ["Sorted", "Reverse", "Random"]
+    args = parse_args(argv)
+    options = benchmark_utils.RunOptions(
+        repeats=args.repeats,
+        warmup=args.warmup,
+        gc_control=args.gc_control,
+        measure_memory=args.measure_memory,
+        count_operations=args.count_operations,
+    )
 
     os.makedirs("outputs", exist_ok=True)
     os.makedirs("img", exist_ok=True)
 
-    for dtype in dataset_types:
+    cells = [
+        benchmark_utils.Cell(algo, dtype, size, args.seed)
+        for dtype in args.datasets
+        for size in args.sizes
+        for algo in args.algorithms
+    ]
+
+    def report(cell, result, cached):
+        status = "cached" if cached else f"{result['median_ms']:.2f} ms"
+        print(f"  {cell.dataset:<16} {cell.size:<9} {cell.algorithm:<12} {status}")
+
+    print(f"Measuring {len(cells)} cells")
+    results = benchmark_utils.run_cells(
+        cells,
+        options,
+        max_workers=args.workers,
+        isolate=args.isolate,
+        pin_cpus=args.pin_cpus,
+        cache_dir=args.cache_dir,
+        on_result=report,
+        dataset_dir=args.dataset_dir,
+    )
+
+    count_columns = COUNT_COLUMNS if args.count_operations else {}
+    for dtype in args.datasets:
         print(f"\nDataset Type: {dtype}")
-        print(f"{'Size':<8} {'Algorithm':<12} {'Time (ms)':<12} {'Memory (KB)':<12}")
-        print("=" * 60)
-
-        results_time = {"Heap Sort": [], "Merge Sort": [], "Quick Sort": []}
-        results_memory = {"Heap Sort": [], "Merge Sort": [], "Quick Sort": []}
-
-        for size in dataset_sizes:
-            if dtype == "Sorted":
-                data = dataset_utils.generate_sorted_dataset(size)
-            elif dtype == "Reverse":
-                data = dataset_utils.generate_reverse_sorted_dataset(size)
-            else:
-                data = dataset_utils.generate_random_dataset(size)
-
-            # Heapsort
-            time_ms, memory_kb = metrics_utils.measure_performance(
-                heap_sort.heap_sort, data.copy()
-            )
-            print(f"{size:<8} {'Heap Sort':<12} {time_ms:<12.2f} {memory_kb:<12.2f}")
-            results_time["Heap Sort"].append(time_ms)
-            results_memory["Heap Sort"].append(memory_kb)
+        header = (
+            f"{'Size':<9} {'Algorithm':<12} {'Median (ms)':<12} {'IQR (ms)':<10} "
+            f"{'Min (ms)':<10} {'Memory (KB)':<12}"
+        )
+        if count_columns:
+            header += f" {'Comparisons':<13} {'Moves':<13}"
+        print(header)
+        print("=" * len(header))
 
-            # Merge Sort
-            time_ms, memory_kb = metrics_utils.measure_performance(
-                merge_sort.merge_sort, data.copy()
-            )
-            print(f"{size:<8} {'Merge Sort':<12} {time_ms:<12.2f} {memory_kb:<12.2f}")
-            results_time["Merge Sort"].append(time_ms)
-            results_memory["Merge Sort"].append(memory_kb)
+        results_time = {algo: [] for algo in args.algorithms}
+        results_memory = {algo: [] for algo in args.algorithms}
+        results_iqr = {algo: [] for algo in args.algorithms}
+        results_min = {algo: [] for algo in args.algorithms}
+        results_counts = {
+            name: {algo: [] for algo in args.algorithms}
+            for name in count_columns.values()
+        }
 
-            # Quick Sort
-            time_ms, memory_kb = metrics_utils.measure_performance(
-                quick_sort.quick_sort, data.copy()
-            )
-            print(f"{size:<8} {'Quick Sort':<12} {time_ms:<12.2f} {memory_kb:<12.2f}")
-            results_time["Quick Sort"].append(time_ms)
-            results_memory["Quick Sort"].append(memory_kb)
+        for size in args.sizes:
+            for algo in args.algorithms:
+                result = results[benchmark_utils.Cell(algo, dtype, size, args.seed)]
+                memory_kb = result["memory_kb"]
+                if memory_kb is None:
+                    memory_kb = math.nan
+                row = (
+                    f"{size:<9} {algo:<12} {result['median_ms']:<12.2f} "
+                    f"{result['iqr_ms']:<10.2f} {result['min_ms']:<10.2f} "
+                    f"{memory_kb:<12.2f}"
+                )
+                counts = {
+                    name: math.nan if result[key] is None else result[key]
+                    for key, name in count_columns.items()
+                }
+                if count_columns:
+                    row += f" {counts['Comparisons']:<13} {counts['Moves']:<13}"
+                print(row)
+                results_time[algo].append(result["median_ms"])
+                results_memory[algo].append(memory_kb)
+                results_iqr[algo].append(result["iqr_ms"])
+                results_min[algo].append(result["min_ms"])
+                for name, count in counts.items():
+                    results_counts[name][algo].append(count)
 
-        csv_filename = f"results_{dtype.lower()}.csv"
+        slug = dtype.lower().replace(" ", "_")
+        csv_filename = f"results_{slug}.csv"
+        extra_columns = {
+            "Time IQR (ms)": results_iqr,
+            "Min Time (ms)": results_min,
+            **results_counts,
+        }
         try:
             file_utils.save_results_to_csv(
                 "outputs",
                 csv_filename,
                 dtype,
-                dataset_sizes,
+                args.sizes,
                 results_time,
                 results_memory,
+                extra_columns=extra_columns,
             )
             print(f"\nResults saved to outputs/{csv_filename}")
         except Exception as e:
             print(f"Failed to save CSV for {dtype}: {e}")
 
+        if not args.plots:
+            continue
         try:
             plot_utils.plot_performance(
-                dataset_sizes,
+                args.sizes,
                 results_time,
                 results_memory,
                 title_suffix=f"({dtype} Data)",
-                output_file=f"img/sorting_performance_{dtype.lower()}.png",
+                output_file=f"img/sorting_performance_{slug}.png",
+                results_counts=results_counts,
             )
         except Exception as e:
             print(f"Failed to plot performance for {dtype}: {e}")
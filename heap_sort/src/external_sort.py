@@ -0,0 +1,172 @@
+import csv
+import os
+import tempfile
+from array import array
+from itertools import islice
+from typing import Iterator, Optional
+from .heap_sort import merge_sorted
+from .merge_sort import merge_sort
+
+FORMATS = ("binary", "csv")
+
+# Estimated bytes per value while a chunk is sorted: the raw value read from
+# disk, a list slot, the boxed Python number, the sort's scratch space and
+# the typed copy written back out.
+BOXED_ITEM_BYTES = 64
+
+# Preferred bytes of read buffer per run during a merge. The fan-in is the
+# number of such buffers (plus one for the output) that fit in the budget;
+# smaller buffers would turn the merge into many tiny reads.
+MERGE_BUFFER = 1 << 16
+
+
+def external_sort(
+    input_path: str,
+    output_path: str,
+    memory_budget: int = 64 << 20,
+    file_format: str = "binary",
+    typecode: str = "q",
+    sort=merge_sort,
+    fan_in: Optional[int] = None,
+    temp_dir: Optional[str] = None,
+) -> dict:
+    """
+    Sort a file of numbers that need not fit in memory.
+
+    1. Run formation: the input is read in chunks of
+       memory_budget // BOXED_ITEM_BYTES values; each chunk is sorted with
+       sort (one of the list sorts in this package) and written to a
+       temporary file as a binary run.
+    2. Merging: up to fan_in runs at a time are merged by a heap-based k-way
+       merge (merge_sorted from heap_sort) into a longer run, until a final merge
+       writes output_path. Each run is read through a buffer of
+       memory_budget // (fan_in + 1) bytes, and the output through one more.
+
+    Args:
+        input_path (str): The file to sort: raw machine values of typecode
+            ("binary"), or one value per line ("csv"; only the first column
+            is read, and blank lines are skipped).
+        output_path (str): Where to write the sorted values, in the same
+            format.
+        memory_budget (int): Approximate bytes of memory to use.
+        file_format (str): "binary" or "csv".
+        typecode (str): array.array typecode of the values, e.g. "q" for
+            int64 or "d" for float64.
+        sort (callable): The list sort used on each chunk.
+        fan_in (Optional[int]): Runs merged at once. By default as many as
+            the budget allows with MERGE_BUFFER bytes per run (at least 2).
+        temp_dir (Optional[str]): Directory for the run files.
+
+    Returns:
+        dict: The number of values, of initial runs and of merge passes.
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"file_format must be one of {', '.join(FORMATS)}")
+    if fan_in is None:
+        fan_in = max(2, memory_budget // MERGE_BUFFER - 1)
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    chunk_items = max(1, memory_budget // BOXED_ITEM_BYTES)
+    itemsize = array(typecode).itemsize
+    buffer_items = max(1, memory_budget // (fan_in + 1) // itemsize)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        runs = []
+        count = 0
+        for chunk in _read_chunks(input_path, file_format, typecode, chunk_items):
+            arr = chunk.tolist()
+            del chunk
+            sort(arr)
+            path = os.path.join(run_dir, f"run{len(runs)}.bin")
+            with open(path, "wb") as run:
+                array(typecode, arr).tofile(run)
+            runs.append(path)
+            count += len(arr)
+            del arr
+        initial_runs = len(runs)
+
+        passes = 0
+        while len(runs) > fan_in:
+            merged = []
+            for lo in range(0, len(runs), fan_in):
+                group = runs[lo : lo + fan_in]
+                path = os.path.join(run_dir, f"pass{passes}-{len(merged)}.bin")
+                _merge_runs(group, path, "binary", typecode, buffer_items)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            passes += 1
+        _merge_runs(runs, output_path, file_format, typecode, buffer_items)
+        passes += 1
+
+    return {"values": count, "runs": initial_runs, "merge_passes": passes}
+
+
+def _read_chunks(
+    path: str, file_format: str, typecode: str, chunk_items: int
+) -> Iterator[array]:
+    """Yield the input values in arrays of at most chunk_items values."""
+    if file_format == "binary":
+        with open(path, "rb") as source:
+            while True:
+                chunk = array(typecode)
+                try:
+                    chunk.fromfile(source, chunk_items)
+                except EOFError:
+                    pass  # The last, partial chunk has still been read.
+                if not chunk:
+                    return
+                yield chunk
+    else:
+        parse = float if typecode in ("f", "d") else int
+        with open(path, newline="") as source:
+            # Blank lines (such as a trailing one) hold no value.
+            rows = (row for row in csv.reader(source) if row)
+            while True:
+                values = (parse(row[0]) for row in islice(rows, chunk_items))
+                chunk = array(typecode, values)
+                if not chunk:
+                    return
+                yield chunk
+
+
+def _read_run(path: str, typecode: str, buffer_items: int) -> Iterator:
+    """Yield the values of a binary run, reading buffer_items at a time."""
+    with open(path, "rb") as run:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(run, buffer_items)
+            except EOFError:
+                pass
+            if not block:
+                return
+            yield from block
+
+
+def _merge_runs(
+    runs: list, output_path: str, file_format: str, typecode: str, buffer_items: int
+) -> None:
+    """k-way merge of the sorted binary runs into output_path."""
+    out = array(typecode)
+    if file_format == "csv":
+        output = open(output_path, "w", newline="")
+    else:
+        output = open(output_path, "wb")
+    with output:
+        readers = [_read_run(path, typecode, buffer_items) for path in runs]
+        for value in merge_sorted(*readers):
+            out.append(value)
+            if len(out) >= buffer_items:
+                _write_block(output, out, file_format)
+                out = array(typecode)
+        _write_block(output, out, file_format)
+
+
+def _write_block(output, block: array, file_format: str) -> None:
+    """Append block to an open output file."""
+    if file_format == "csv":
+        output.writelines(f"{value}\n" for value in block)
+    else:
+        block.tofile(output)
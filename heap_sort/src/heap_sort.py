@@ -1,40 +1,301 @@
-def heapify(arr: list[int], n: int, i: int) -> None:
+from itertools import islice
+from typing import Iterable, Iterator
+
+
+def heapify(arr: list, n: int, i: int) -> None:
     """
     Ensure the subtree rooted at index i obeys the max-heap property.
 
+    Iterative: the element at i is lifted out, leaving a "hole" that moves
+    down the tree as larger children are shifted up into it, and the element
+    is written once where the hole stops. That is one assignment per level
+    instead of a three-way swap, and no Python call per level.
+
     Args:
-        arr (list[int]): The heap array.
+        arr (list): The heap array.
         n (int): Size of the heap.
         i (int): Index of the root element of the subtree.
     """
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
+    item = arr[i]
+    child = 2 * i + 1
+    while child < n:
+        right = child + 1
+        if right < n and arr[right] > arr[child]:
+            child = right
+        if not arr[child] > item:
+            break
+        arr[i] = arr[child]
+        i = child
+        child = 2 * i + 1
+    arr[i] = item
 
-    if left < n and arr[left] > arr[largest]:
-        largest = left
-    if right < n and arr[right] > arr[largest]:
-        largest = right
 
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+def heap_sort(
+    arr: list, key=None, reverse: bool = False, bottom_up: bool = True
+) -> None:
+    """
+    Perform Heapsort on the given list in-place.
 
+    Heapsort is not stable: equal elements may change their relative order.
 
-def heap_sort(arr: list[int]) -> None:
+    Args:
+        arr (list): The array to be sorted.
+        key (callable, optional): Function of one argument used to extract a
+            comparison key from each element. Keys are computed once per
+            element, not once per comparison, and moved alongside the values.
+        reverse (bool): Sort in descending order.
+        bottom_up (bool): Use Floyd's bottom-up extraction: the hole left by
+            the maximum is moved all the way down to a leaf with one
+            comparison per level (the two children), and the displaced last
+            element is then sifted up from there, which is usually only a
+            level or two. That is about half the comparisons of the standard
+            sift-down, which compares the element as well at every level.
+            Sorting with a key always uses bottom-up extraction.
     """
-    Perform Heapsort on the given list in-place.
+    n = len(arr)
+    if n < 2:
+        return
+    if key is None:
+        for i in range(n // 2 - 1, -1, -1):
+            heapify(arr, n, i)
+        if bottom_up:
+            _extract_bottom_up(arr, n)
+        else:
+            for end in range(n - 1, 0, -1):
+                arr[0], arr[end] = arr[end], arr[0]
+                heapify(arr, end, 0)
+    else:
+        keys = list(map(key, arr))
+        for i in range(n // 2 - 1, -1, -1):
+            _heapify_keyed(keys, arr, n, i)
+        _extract_bottom_up_keyed(keys, arr, n)
+    if reverse:
+        arr.reverse()
+
+
+def _extract_bottom_up(arr: list, n: int) -> None:
+    """Move the maximum of the heap arr[:end] to arr[end], for each end."""
+    for end in range(n - 1, 0, -1):
+        item = arr[end]
+        arr[end] = arr[0]
+        # Walk the hole from the root down to a leaf along the larger child.
+        pos = 0
+        child = 1
+        while child < end:
+            right = child + 1
+            if right < end and arr[right] > arr[child]:
+                child = right
+            arr[pos] = arr[child]
+            pos = child
+            child = 2 * pos + 1
+        # Sift the displaced element back up from the leaf.
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not item > arr[parent]:
+                break
+            arr[pos] = arr[parent]
+            pos = parent
+        arr[pos] = item
+
+
+def _heapify_keyed(keys: list, values: list, n: int, i: int) -> None:
+    """heapify on keys, moving values in step."""
+    key = keys[i]
+    value = values[i]
+    child = 2 * i + 1
+    while child < n:
+        right = child + 1
+        if right < n and keys[right] > keys[child]:
+            child = right
+        if not keys[child] > key:
+            break
+        keys[i] = keys[child]
+        values[i] = values[child]
+        i = child
+        child = 2 * i + 1
+    keys[i] = key
+    values[i] = value
+
+
+def _extract_bottom_up_keyed(keys: list, values: list, n: int) -> None:
+    """_extract_bottom_up on keys, moving values in step."""
+    for end in range(n - 1, 0, -1):
+        key = keys[end]
+        value = values[end]
+        keys[end] = keys[0]
+        values[end] = values[0]
+        pos = 0
+        child = 1
+        while child < end:
+            right = child + 1
+            if right < end and keys[right] > keys[child]:
+                child = right
+            keys[pos] = keys[child]
+            values[pos] = values[child]
+            pos = child
+            child = 2 * pos + 1
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not key > keys[parent]:
+                break
+            keys[pos] = keys[parent]
+            values[pos] = values[parent]
+            pos = parent
+        keys[pos] = key
+        values[pos] = value
+
+
+def top_k(iterable: Iterable, k: int, key=None) -> list:
+    """
+    Return the k largest items of iterable, largest first, like
+    heapq.nlargest.
+
+    The items are streamed through a min-heap of at most k entries whose
+    root is the smallest item kept so far. Each new item is compared with the
+    root once, and replaces it (followed by a sift-down) only if it is
+    larger, so this takes O(n log k) time and O(k) memory. Equal items keep
+    their input order, earliest first.
 
     Args:
-        arr (list[int]): The array to be sorted.
+        iterable (Iterable): The items, read once.
+        k (int): Number of items to return.
+        key (callable, optional): Function of one argument used to extract a
+            comparison key from each item, called once per item.
+    """
+    if k <= 0:
+        return []
+    it = iter(iterable)
+    if key is None:
+        heap = list(islice(it, k))
+        size = len(heap)
+        for i in range(size // 2 - 1, -1, -1):
+            _heapify_min(heap, size, i)
+        if size == k:
+            smallest = heap[0]
+            for item in it:
+                if item > smallest:
+                    heap[0] = item
+                    _heapify_min(heap, k, 0)
+                    smallest = heap[0]
+        _sort_descending(heap, size)
+        return heap
+
+    # (key, -position, item) entries: among equal keys, the later item is
+    # the smaller entry, so it is evicted first, and items are never compared.
+    heap = [(key(item), -position, item) for position, item in enumerate(islice(it, k))]
+    size = len(heap)
+    for i in range(size // 2 - 1, -1, -1):
+        _heapify_min(heap, size, i)
+    if size == k:
+        smallest = heap[0][0]
+        for position, item in enumerate(it, k):
+            item_key = key(item)
+            if item_key > smallest:
+                heap[0] = (item_key, -position, item)
+                _heapify_min(heap, k, 0)
+                smallest = heap[0][0]
+    _sort_descending(heap, size)
+    return [entry[2] for entry in heap]
+
+
+def merge_sorted(*iterables: Iterable, key=None) -> Iterator:
+    """
+    Lazily merge sorted iterables into one sorted stream, like heapq.merge.
+
+    A min-heap holds the next item of every iterable that is not exhausted.
+    The root is yielded and replaced by the next item from the same
+    iterable, so each item costs O(log k) comparisons for k iterables, and
+    only k items are held at a time. The merge is stable: equal items come
+    out in the order of their iterables.
+
+    Args:
+        *iterables (Iterable): Iterables, each sorted in ascending order
+            (by key, if given). They are read only as items are needed, so
+            they can be generators or files.
+        key (callable, optional): Function of one argument used to extract a
+            comparison key from each item.
+    """
+    iterators = [iter(iterable) for iterable in iterables]
+    heap = []
+    for index, iterator in enumerate(iterators):
+        for item in iterator:
+            heap.append((item, index) if key is None else (key(item), index, item))
+            break
+    size = len(heap)
+    for i in range(size // 2 - 1, -1, -1):
+        _heapify_min(heap, size, i)
+
+    while size > 1:
+        entry = heap[0]
+        index = entry[1]
+        yield entry[0] if key is None else entry[2]
+        for item in iterators[index]:
+            heap[0] = (item, index) if key is None else (key(item), index, item)
+            break
+        else:
+            size -= 1
+            heap[0] = heap[size]
+            heap.pop()
+        _heapify_min(heap, size, 0)
+    if size:
+        # One iterable left: pass the rest of it through.
+        entry = heap[0]
+        yield entry[0] if key is None else entry[2]
+        yield from iterators[entry[1]]
+
+
+def partial_heap_sort(arr: list, k: int) -> None:
+    """
+    Sort only the first k positions of arr in place: afterwards arr[:k] holds
+    the k smallest elements in ascending order, and arr[k:] the others in no
+    particular order.
+
+    arr[:k] is made a max-heap, and each later element smaller than its root
+    is swapped in and sifted down, which leaves the k smallest elements in
+    the heap. The heap is then sorted by bottom-up extraction, as in
+    heap_sort. That is O(n log k) time and O(1) extra space.
+
+    Args:
+        arr (list): The list to be partially sorted.
+        k (int): Number of leading positions to sort.
     """
     n = len(arr)
+    if k >= n:
+        heap_sort(arr)
+        return
+    if k <= 0:
+        return
+    for i in range(k // 2 - 1, -1, -1):
+        heapify(arr, k, i)
+    largest = arr[0]
+    for j in range(k, n):
+        item = arr[j]
+        if item < largest:
+            arr[j] = largest
+            arr[0] = item
+            heapify(arr, k, 0)
+            largest = arr[0]
+    _extract_bottom_up(arr, k)
+
+
+def _heapify_min(heap: list, n: int, i: int) -> None:
+    """heapify for a min-heap: the smallest element rises to the root."""
+    item = heap[i]
+    child = 2 * i + 1
+    while child < n:
+        right = child + 1
+        if right < n and heap[right] < heap[child]:
+            child = right
+        if not heap[child] < item:
+            break
+        heap[i] = heap[child]
+        i = child
+        child = 2 * i + 1
+    heap[i] = item
 
-    # Build max heap
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
 
-    # Extract elements one by one from the heap
-    for i in range(n - 1, 0, -1):
-        arr[0], arr[i] = arr[i], arr[0]
-        heapify(arr, i, 0)
+def _sort_descending(heap: list, n: int) -> None:
+    """Heapsort a min-heap of n elements into descending order in place."""
+    for end in range(n - 1, 0, -1):
+        heap[0], heap[end] = heap[end], heap[0]
+        _heapify_min(heap, end, 0)
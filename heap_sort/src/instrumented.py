@@ -0,0 +1,147 @@
+import functools
+import inspect
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+
+@dataclass(slots=True)
+class OperationCounts:
+    """
+    The work one sort did.
+
+    - comparisons: element comparisons (<, >, <=, >=, ==, !=), including
+      those made inside bisect.
+    - moves: element writes into the list being sorted and into lists
+      sliced from it (a slice assignment counts one per element).
+    - allocations: slices taken of the list being sorted or of those
+      slices, such as insertion-sort shifts, run reversals and heapsort
+      fallback partitions. Lists a sort builds any other way, such as
+      merge_sort's scratch buffer, are not seen.
+    - max_depth: the deepest nesting of calls to any one function of the
+      sort's module, so 1 for a sort that does not recurse.
+    """
+
+    comparisons: int = 0
+    moves: int = 0
+    allocations: int = 0
+    max_depth: int = 0
+
+
+def count_operations(sort: Callable, data: Iterable) -> OperationCounts:
+    """
+    Sort a counted copy of data with sort and return what it did.
+
+    The sorts carry no counting code, so they run at full speed otherwise.
+    Instead the input is instrumented: every element is wrapped in an object
+    whose comparison methods count, in a list subclass that counts writes
+    and slices, and for the duration of the call the functions of the sort's
+    module (and those it imported from its package) are replaced with
+    wrappers that track their call depth. Counting is therefore many times
+    slower than sorting, and must not run while another thread uses the
+    same module.
+
+    Args:
+        sort (callable): A sort that sorts a list in place, such as
+            heap_sort, merge_sort or quick_sort.
+        data (Iterable): The values to sort.
+
+    Returns:
+        OperationCounts: The counts.
+    """
+    counts = OperationCounts()
+    arr = _CountedList((_Counted(value, counts) for value in data), counts)
+    module = inspect.getmodule(sort)
+    prefix = module.__name__.rpartition(".")[0] + "."
+    originals = {
+        name: value
+        for name, value in vars(module).items()
+        if inspect.isfunction(value)
+        and (value.__module__ == module.__name__ or value.__module__.startswith(prefix))
+    }
+    tracked = {name: _track_depth(value, counts) for name, value in originals.items()}
+    vars(module).update(tracked)
+    try:
+        tracked.get(sort.__name__, sort)(arr)
+    finally:
+        vars(module).update(originals)
+    return counts
+
+
+def _track_depth(function: Callable, counts: OperationCounts) -> Callable:
+    """function, raising counts.max_depth to its deepest nesting of calls."""
+    active = 0
+
+    @functools.wraps(function)
+    def tracked(*args, **kwargs):
+        nonlocal active
+        active += 1
+        if active > counts.max_depth:
+            counts.max_depth = active
+        try:
+            return function(*args, **kwargs)
+        finally:
+            active -= 1
+
+    return tracked
+
+
+class _Counted:
+    """A value whose comparisons are counted."""
+
+    __slots__ = ("value", "counts")
+
+    def __init__(self, value, counts: OperationCounts):
+        self.value = value
+        self.counts = counts
+
+    def __lt__(self, other: "_Counted") -> bool:
+        self.counts.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "_Counted") -> bool:
+        self.counts.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "_Counted") -> bool:
+        self.counts.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "_Counted") -> bool:
+        self.counts.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: "_Counted") -> bool:
+        self.counts.comparisons += 1
+        return self.value == other.value
+
+    def __ne__(self, other: "_Counted") -> bool:
+        self.counts.comparisons += 1
+        return self.value != other.value
+
+
+class _CountedList(list):
+    """A list whose element writes and slices are counted."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self, iterable: Iterable, counts: OperationCounts):
+        super().__init__(iterable)
+        self.counts = counts
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self.counts.allocations += 1
+            return _CountedList(list.__getitem__(self, index), self.counts)
+        return list.__getitem__(self, index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counts.moves += len(value)
+        else:
+            self.counts.moves += 1
+        list.__setitem__(self, index, value)
+
+    def reverse(self):
+        self.counts.moves += len(self)
+        list.reverse(self)
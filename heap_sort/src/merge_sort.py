@@ -1,42 +1,168 @@
-def merge_sort(arr: list) -> None:
+from bisect import bisect_left, bisect_right
+
+# Runs shorter than this are extended with binary insertion sort before
+# merging. Insertion shifts elements with C-level slice moves, so it beats
+# merging up to a few dozen elements (see benchmarks.merge_sort_variants).
+INSERTION_CUTOFF = 32
+
+
+def merge_sort(arr: list, key=None) -> None:
     """
     In-place stable merge sort.
 
     Sorts the input list `arr` by modifying it directly.
     Maintains the order of equal elements (stable).
 
+    The sort is adaptive:
+
+    - The input is split into natural runs: maximal non-descending stretches,
+      and strictly descending ones, which are reversed in place. Sorted or
+      reverse-sorted input is one run and is done in O(n).
+    - Runs shorter than INSERTION_CUTOFF are extended with binary insertion
+      sort.
+    - Runs are merged pairwise through one auxiliary buffer of n // 2 slots,
+      allocated once. The shorter run of each merge is copied into it, and
+      merged back, element by element, so merging allocates nothing else.
+      Before each merge, the leading elements of the left run that are
+      already in place (not greater than the right run's first) and the
+      trailing elements of the right run that are already in place are found
+      by binary search and skipped; if the runs are already in order, the
+      merge is skipped entirely.
+
     Args:
         arr (list): The list to be sorted.
+        key (callable, optional): Function of one argument used to extract a
+            comparison key from each element. Each element is decorated once
+            with (key, position), the decorated list is sorted, and arr is
+            rearranged to match, so key is called n times and ties keep their
+            original order.
     """
-    if len(arr) <= 1:
+    n = len(arr)
+    if n <= 1:
+        return
+    if key is not None:
+        decorated = list(zip(map(key, arr), range(n)))
+        merge_sort(decorated)
+        arr[:] = [arr[position] for _, position in decorated]
         return
 
-    mid = len(arr) // 2
-    left = arr[:mid]
-    right = arr[mid:]
+    bounds = _find_runs(arr, n)
+    aux = [None] * (n // 2) if len(bounds) > 2 else []
+    while len(bounds) > 2:
+        merged = [0]
+        for i in range(0, len(bounds) - 2, 2):
+            _merge(arr, aux, bounds[i], bounds[i + 1], bounds[i + 2])
+            merged.append(bounds[i + 2])
+        if len(bounds) % 2 == 0:
+            # An odd number of runs: the last one waits for the next pass.
+            merged.append(bounds[-1])
+        bounds = merged
 
-    merge_sort(left)
-    merge_sort(right)
 
-    i = j = k = 0
+def _find_runs(arr: list, n: int) -> list[int]:
+    """
+    Split arr into sorted runs of at least INSERTION_CUTOFF elements (except
+    possibly the last), returning the run boundaries [0, ..., n].
+    """
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and arr[hi] < arr[lo]:
+            # Strictly descending, so reversing it cannot reorder equal keys.
+            while hi + 1 < n and arr[hi + 1] < arr[hi]:
+                hi += 1
+            hi += 1
+            if lo == 0 and hi == n:
+                arr.reverse()
+            else:
+                arr[lo:hi] = arr[hi - 1 : lo - 1 if lo else None : -1]
+        else:
+            while hi < n and not arr[hi] < arr[hi - 1]:
+                hi += 1
+        if hi - lo < INSERTION_CUTOFF:
+            end = min(lo + INSERTION_CUTOFF, n)
+            _insertion_sort(arr, lo, hi, end)
+            hi = end
+        bounds.append(hi)
+        lo = hi
+    return bounds
+
+
+def _insertion_sort(arr: list, lo: int, start: int, end: int) -> None:
+    """Binary insertion sort of arr[lo:end], given that arr[lo:start] is sorted."""
+    for i in range(start, end):
+        item = arr[i]
+        position = bisect_right(arr, item, lo, i)
+        if position < i:
+            arr[position + 1 : i + 1] = arr[position:i]
+            arr[position] = item
+
 
-    # Merge the sorted halves back into arr
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            arr[k] = left[i]
+def _merge(arr: list, aux: list, lo: int, mid: int, hi: int) -> None:
+    """Stably merge the sorted runs arr[lo:mid] and arr[mid:hi]."""
+    # Left elements <= the first right element are already in place, as are
+    # right elements >= the last left element.
+    lo = bisect_right(arr, arr[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect_left(arr, arr[mid - 1], mid, hi)
+
+    if mid - lo <= hi - mid:
+        # Copy the left run out and merge front to back.
+        left_len = mid - lo
+        for i in range(left_len):
+            aux[i] = arr[lo + i]
+        i = 0
+        j = mid
+        k = lo
+        a = aux[0]
+        b = arr[j]
+        while True:
+            if b < a:
+                arr[k] = b
+                k += 1
+                j += 1
+                if j == hi:
+                    break
+                b = arr[j]
+            else:
+                arr[k] = a
+                k += 1
+                i += 1
+                if i == left_len:
+                    return
+                a = aux[i]
+        while i < left_len:
+            arr[k] = aux[i]
+            k += 1
             i += 1
-        else:
-            arr[k] = right[j]
-            j += 1
-        k += 1
-
-    # Copy remaining elements if any
-    while i < len(left):
-        arr[k] = left[i]
-        i += 1
-        k += 1
-
-    while j < len(right):
-        arr[k] = right[j]
-        j += 1
-        k += 1
+    else:
+        # Copy the right run out and merge back to front.
+        right_len = hi - mid
+        for j in range(right_len):
+            aux[j] = arr[mid + j]
+        i = mid - 1
+        j = right_len - 1
+        k = hi - 1
+        a = arr[i]
+        b = aux[j]
+        while True:
+            if b < a:
+                arr[k] = a
+                k -= 1
+                i -= 1
+                if i < lo:
+                    break
+                a = arr[i]
+            else:
+                arr[k] = b
+                k -= 1
+                j -= 1
+                if j < 0:
+                    return
+                b = aux[j]
+        while j >= 0:
+            arr[k] = aux[j]
+            k -= 1
+            j -= 1
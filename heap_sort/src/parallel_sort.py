@@ -0,0 +1,220 @@
+import heapq
+import os
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+from .merge_sort import merge_sort
+
+METHODS = ("merge", "sample")
+
+# Samples drawn per worker to choose the sample sort splitters. More samples
+# give more even buckets at the cost of a larger serial sort of the sample.
+OVERSAMPLING = 32
+
+
+def parallel_sort(
+    values: array,
+    max_workers: Optional[int] = None,
+    method: str = "merge",
+    sort=merge_sort,
+) -> None:
+    """
+    Sort a numeric array.array in place on several processes.
+
+    The values are copied once into a multiprocessing.shared_memory block and
+    cut into one chunk per worker. Workers attach to the block by name, so no
+    values are pickled between processes; each worker boxes only its own
+    chunk and sorts it with sort (one of the list sorts in this package, or
+    any function that sorts a list in place). The sorted chunks are then
+    combined on the same workers into a second shared block, which is copied
+    back into values:
+
+    - "merge" (parallel sorting by regular sampling): every worker sorts its
+      chunk and returns max_workers evenly spaced samples from it. Splitters
+      chosen from the samples cut the output into one range per worker, and
+      each worker finds its range in every chunk by binary search and k-way
+      merges those slices with a heap (heapq.merge).
+    - "sample" (sample sort): splitters are chosen first from a random
+      sample of OVERSAMPLING values per worker. Every worker reorders its
+      chunk by bucket, then worker i gathers bucket i from all chunks and
+      sorts it. Many copies of one value all land in the same bucket, so
+      duplicate-heavy input can leave the buckets uneven.
+
+    Args:
+        values (array.array): The values to sort.
+        max_workers (Optional[int]): Number of processes (os.cpu_count() by
+            default; 1 sorts in this process).
+        method (str): "merge" or "sample".
+        sort (callable): The list sort run on each chunk or bucket.
+    """
+    if not isinstance(values, array) or values.typecode in ("u", "w"):
+        raise TypeError("parallel_sort expects a numeric array.array")
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}")
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    n = len(values)
+    if max_workers == 1 or n < 2 * max_workers:
+        arr = values.tolist()
+        sort(arr)
+        values[:] = array(values.typecode, arr)
+        return
+
+    nbytes = n * values.itemsize
+    source = shared_memory.SharedMemory(create=True, size=nbytes)
+    target = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        with memoryview(values).cast("B") as raw:
+            source.buf[:nbytes] = raw
+        layout = (source.name, target.name, values.typecode, n, max_workers)
+        workers = range(max_workers)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            if method == "merge":
+                samples = executor.map(
+                    _sort_chunk, [layout] * max_workers, workers, [sort] * max_workers
+                )
+                pivots = sorted(sample for chunk in samples for sample in chunk)
+                splitters = [
+                    pivots[i * max_workers + max_workers // 2]
+                    for i in range(1, max_workers)
+                ]
+                list(
+                    executor.map(
+                        _merge_range,
+                        [layout] * max_workers,
+                        [splitters] * max_workers,
+                        workers,
+                    )
+                )
+            else:
+                sample = sorted(
+                    values[random.randrange(n)]
+                    for _ in range(OVERSAMPLING * max_workers)
+                )
+                splitters = [sample[i * OVERSAMPLING] for i in range(1, max_workers)]
+                counts = list(
+                    executor.map(
+                        _partition_chunk,
+                        [layout] * max_workers,
+                        [splitters] * max_workers,
+                        workers,
+                    )
+                )
+                list(
+                    executor.map(
+                        _sort_bucket,
+                        [layout] * max_workers,
+                        [counts] * max_workers,
+                        workers,
+                        [sort] * max_workers,
+                    )
+                )
+        with memoryview(values).cast("B") as raw:
+            raw[:] = target.buf[:nbytes]
+    finally:
+        for block in (source, target):
+            block.close()
+            block.unlink()
+
+
+def _chunk_bounds(n: int, workers: int, index: int) -> tuple[int, int]:
+    """The slice of the input owned by worker index."""
+    return n * index // workers, n * (index + 1) // workers
+
+
+def _sort_chunk(layout: tuple, index: int, sort) -> list:
+    """Sort chunk index in place and return max_workers regular samples of it."""
+    source_name, _, typecode, n, workers = layout
+    lo, hi = _chunk_bounds(n, workers, index)
+    source = shared_memory.SharedMemory(name=source_name)
+    try:
+        with source.buf.cast(typecode) as view:
+            chunk = view[lo:hi].tolist()
+            sort(chunk)
+            view[lo:hi] = array(typecode, chunk)
+    finally:
+        source.close()
+    return [chunk[i * len(chunk) // workers] for i in range(workers)]
+
+
+def _merge_range(layout: tuple, splitters: list, index: int) -> None:
+    """
+    Merge the values v with splitters[index - 1] <= v < splitters[index] from
+    every sorted chunk into their final place in the target block.
+    """
+    source_name, target_name, typecode, n, workers = layout
+    source = shared_memory.SharedMemory(name=source_name)
+    target = shared_memory.SharedMemory(name=target_name)
+    try:
+        with source.buf.cast(typecode) as view:
+            runs = []
+            offset = 0
+            for chunk in range(workers):
+                lo, hi = _chunk_bounds(n, workers, chunk)
+                start = bisect_left(view, splitters[index - 1], lo, hi) if index else lo
+                stop = (
+                    bisect_left(view, splitters[index], lo, hi)
+                    if index < len(splitters)
+                    else hi
+                )
+                offset += start - lo
+                runs.append(view[start:stop])
+            merged = array(typecode, heapq.merge(*runs))
+            for run in runs:
+                run.release()
+        with target.buf.cast(typecode) as out:
+            out[offset : offset + len(merged)] = merged
+    finally:
+        source.close()
+        target.close()
+
+
+def _partition_chunk(layout: tuple, splitters: list, index: int) -> list[int]:
+    """
+    Reorder chunk index by bucket (bucket b holds the values v with
+    splitters[b - 1] <= v < splitters[b]) and return the bucket sizes.
+    """
+    source_name, _, typecode, n, workers = layout
+    lo, hi = _chunk_bounds(n, workers, index)
+    source = shared_memory.SharedMemory(name=source_name)
+    try:
+        with source.buf.cast(typecode) as view:
+            buckets = [[] for _ in range(workers)]
+            for value in view[lo:hi].tolist():
+                buckets[bisect_right(splitters, value)].append(value)
+            start = lo
+            for bucket in buckets:
+                view[start : start + len(bucket)] = array(typecode, bucket)
+                start += len(bucket)
+    finally:
+        source.close()
+    return [len(bucket) for bucket in buckets]
+
+
+def _sort_bucket(layout: tuple, counts: list, index: int, sort) -> None:
+    """
+    Gather bucket index from every partitioned chunk, sort it, and write it
+    to its final place in the target block. counts[c][b] is the size of
+    bucket b in chunk c.
+    """
+    source_name, target_name, typecode, n, workers = layout
+    offset = sum(sum(chunk_counts[:index]) for chunk_counts in counts)
+    source = shared_memory.SharedMemory(name=source_name)
+    target = shared_memory.SharedMemory(name=target_name)
+    try:
+        bucket = []
+        with source.buf.cast(typecode) as view:
+            for chunk, chunk_counts in enumerate(counts):
+                start = _chunk_bounds(n, workers, chunk)[0] + sum(chunk_counts[:index])
+                bucket.extend(view[start : start + chunk_counts[index]].tolist())
+        sort(bucket)
+        with target.buf.cast(typecode) as out:
+            out[offset : offset + len(bucket)] = array(typecode, bucket)
+    finally:
+        source.close()
+        target.close()
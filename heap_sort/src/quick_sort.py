@@ -1,35 +1,151 @@
-import random
+from bisect import bisect_right
 
+# Partitions with at most this many elements are finished by binary insertion
+# sort instead of being partitioned further.
+INSERTION_CUTOFF = 16
 
-def quick_sort(arr):
+# Partitions larger than this take the pivot as Tukey's ninther (the median
+# of three medians of three) instead of the median of three.
+NINTHER_THRESHOLD = 128
+
+# Partitioning stops and heapsort takes over after DEPTH_FACTOR * log2(n)
+# levels, which bounds the worst case at O(n log n).
+DEPTH_FACTOR = 2
+
+
+def quick_sort(arr: list) -> None:
     """
-    In-place Quicksort with randomized pivot selection.
+    In-place introsort: quicksort with a heapsort fallback.
+
+    - Pivots are the median of three (first, middle, last), or Tukey's
+      ninther for large partitions, so sorted and reverse-sorted input split
+      evenly.
+    - Partitioning is three-way (Dutch national flag): elements equal to the
+      pivot are gathered in the middle and never looked at again, so inputs
+      with many duplicates stay O(n log n) instead of degrading toward O(n²).
+    - Only the smaller side is handled by a recursive call; the loop
+      continues on the larger side, so the recursion depth is at most
+      log2(n).
+    - Partitions of INSERTION_CUTOFF elements or fewer are finished with
+      binary insertion sort.
+    - If partitioning goes deeper than DEPTH_FACTOR * log2(n) levels (for
+      example on inputs built to defeat the pivot rule), the remaining
+      partition is heapsorted in place, as a heap rooted at its first slot.
 
     Args:
         arr (list): The list of elements to be sorted.
     """
-
-    def partition(a, low, high):
-        # Choose a random pivot and move it to the end
-        pivot_index = random.randint(low, high)
-        a[pivot_index], a[high] = a[high], a[pivot_index]
-        pivot = a[high]
-
-        i = low
-        for j in range(low, high):
-            if a[j] < pivot:
-                a[i], a[j] = a[j], a[i]
-                i += 1
-        # Place pivot at its correct position
-        a[i], a[high] = a[high], a[i]
-        return i
-
-    def _quick_sort(a, low, high):
-        if low < high:
-            p = partition(a, low, high)
-            _quick_sort(a, low, p - 1)
-            _quick_sort(a, p + 1, high)
-
-    if len(arr) <= 1:
+    n = len(arr)
+    if n <= 1:
         return
-    _quick_sort(arr, 0, len(arr) - 1)
+    _introsort(arr, 0, n - 1, DEPTH_FACTOR * n.bit_length())
+
+
+def _introsort(a: list, lo: int, hi: int, depth: int) -> None:
+    """Sort a[lo:hi + 1], falling back to heapsort after depth partitions."""
+    while hi - lo >= INSERTION_CUTOFF:
+        if depth <= 0:
+            _heap_sort_range(a, lo, hi)
+            return
+        depth -= 1
+        lt, gt = _partition(a, lo, hi, _choose_pivot(a, lo, hi))
+        # Now a[lo:lt] < pivot, a[lt:gt + 1] == pivot and a[gt + 1:hi + 1] > pivot.
+        if lt - lo < hi - gt:
+            _introsort(a, lo, lt - 1, depth)
+            lo = gt + 1
+        else:
+            _introsort(a, gt + 1, hi, depth)
+            hi = lt - 1
+    _insertion_sort(a, lo, hi + 1)
+
+
+def _median_of_three(a: list, i: int, j: int, k: int):
+    """Return the median of a[i], a[j] and a[k]."""
+    x, y, z = a[i], a[j], a[k]
+    if x < y:
+        if y < z:
+            return y
+        return z if x < z else x
+    if x < z:
+        return x
+    return z if y < z else y
+
+
+def _choose_pivot(a: list, lo: int, hi: int):
+    """Median of three, or Tukey's ninther for large partitions."""
+    mid = (lo + hi) // 2
+    if hi - lo < NINTHER_THRESHOLD:
+        return _median_of_three(a, lo, mid, hi)
+    step = (hi - lo) // 8
+    # The median of three of the medians of three evenly spaced triples;
+    # since they are values, compare them directly.
+    first = _median_of_three(a, lo, lo + step, lo + 2 * step)
+    second = _median_of_three(a, mid - step, mid, mid + step)
+    third = _median_of_three(a, hi - 2 * step, hi - step, hi)
+    if first < second:
+        if second < third:
+            return second
+        return third if first < third else first
+    if first < third:
+        return first
+    return third if second < third else second
+
+
+def _partition(a: list, lo: int, hi: int, pivot) -> tuple[int, int]:
+    """
+    Three-way partition of a[lo:hi + 1] around pivot (Dutch national flag).
+    Returns (lt, gt), the bounds of the block of elements equal to pivot.
+    """
+    lt = lo
+    i = lo
+    gt = hi
+    while i <= gt:
+        x = a[i]
+        if x < pivot:
+            a[i] = a[lt]
+            a[lt] = x
+            lt += 1
+            i += 1
+        elif pivot < x:
+            a[i] = a[gt]
+            a[gt] = x
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _heap_sort_range(a: list, lo: int, hi: int) -> None:
+    """Heapsort a[lo:hi + 1] in place, without copying it out of a."""
+    n = hi - lo + 1
+    for i in range(n // 2 - 1, -1, -1):
+        _sift_down(a, lo, n, i)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        _sift_down(a, lo, end, 0)
+
+
+def _sift_down(a: list, lo: int, n: int, i: int) -> None:
+    """heap_sort.heapify for the heap a[lo:lo + n]; i is relative to lo."""
+    item = a[lo + i]
+    child = 2 * i + 1
+    while child < n:
+        right = child + 1
+        if right < n and a[lo + right] > a[lo + child]:
+            child = right
+        if not a[lo + child] > item:
+            break
+        a[lo + i] = a[lo + child]
+        i = child
+        child = 2 * i + 1
+    a[lo + i] = item
+
+
+def _insertion_sort(a: list, lo: int, end: int) -> None:
+    """Binary insertion sort of a[lo:end]."""
+    for i in range(lo + 1, end):
+        item = a[i]
+        position = bisect_right(a, item, lo, i)
+        if position < i:
+            a[position + 1 : i + 1] = a[position:i]
+            a[position] = item
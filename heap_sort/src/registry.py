@@ -0,0 +1,56 @@
+from array import array
+from dataclasses import dataclass
+from typing import Callable
+from . import heap_sort, merge_sort, quick_sort, typed_sort
+
+
+@dataclass(frozen=True, slots=True)
+class Algorithm:
+    """
+    A sort the benchmarks can run by name.
+
+    sort is called with the result of prepare(data), where data is the
+    dataset as a sequence of ints (a list, or a memoryview of a cached
+    dataset). prepare builds a fresh input for every run (a new list by
+    default) and is never timed. If countable, sort takes any list and
+    instrumented.count_operations can count its comparisons and moves.
+    """
+
+    name: str
+    sort: Callable
+    prepare: Callable = list
+    countable: bool = True
+
+
+ALGORITHMS: dict[str, Algorithm] = {}
+
+
+def register(
+    name: str, sort: Callable, prepare: Callable = list, countable: bool = True
+) -> Algorithm:
+    """Add a sort to ALGORITHMS under name, which must be new."""
+    if name in ALGORITHMS:
+        raise ValueError(f"An algorithm named {name!r} is already registered")
+    algorithm = Algorithm(name, sort, prepare, countable)
+    ALGORITHMS[name] = algorithm
+    return algorithm
+
+
+def get_algorithm(name: str) -> Algorithm:
+    """The registered algorithm called name."""
+    if name not in ALGORITHMS:
+        raise KeyError(
+            f"Unknown algorithm {name!r}; registered: {', '.join(ALGORITHMS)}"
+        )
+    return ALGORITHMS[name]
+
+
+def _int64_array(data) -> array:
+    """The dataset as an int64 array.array, for the typed engine."""
+    return array("q", data)
+
+
+register("Heap Sort", heap_sort.heap_sort)
+register("Merge Sort", merge_sort.merge_sort)
+register("Quick Sort", quick_sort.quick_sort)
+register("Typed Sort", typed_sort.typed_sort, _int64_array, countable=False)
@@ -0,0 +1,81 @@
+import heapq
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; array.array input works without it.
+    np = None
+
+# Elements per block without NumPy. Each block is sorted on its own
+# before the blocks are merged, so at most this many elements are boxed as
+# Python objects at a time.
+BLOCK_SIZE = 1 << 16
+
+
+def typed_sort(buffer) -> None:
+    """
+    Sort a homogeneous numeric buffer in place: an array.array (any numeric
+    typecode, e.g. "q" for int64 or "d" for float64) or a 1-D NumPy array.
+
+    The values are never held as a Python list.
+
+    - With NumPy installed, an array.array is viewed as an ndarray without
+      copying, no element is ever boxed, and the whole buffer is sorted by
+      one ndarray.sort call.
+    - Without NumPy, the buffer is cut into blocks of BLOCK_SIZE elements.
+      Each block is boxed, sorted by the built-in sort and written back, one
+      block at a time, and the blocks are combined with a k-way heap merge
+      (heapq.merge) into one auxiliary array of the same type, which is
+      copied back.
+
+    NaN values have no defined position.
+
+    Args:
+        buffer (array.array or numpy.ndarray): The values to sort.
+
+    Raises:
+        TypeError: If buffer is not an array.array or a 1-D ndarray, or is
+            an ndarray while NumPy is not importable.
+    """
+    if np is not None:
+        _as_ndarray(buffer).sort()
+    elif isinstance(buffer, array):
+        _sort_array(buffer, BLOCK_SIZE)
+    else:
+        raise TypeError(
+            f"typed_sort expects an array.array, got {type(buffer).__name__}"
+        )
+
+
+def _as_ndarray(buffer):
+    """A writable 1-D ndarray sharing memory with buffer."""
+    if isinstance(buffer, array):
+        if buffer.typecode == "u" or buffer.typecode == "w":
+            raise TypeError("typed_sort expects a numeric array.array")
+        return np.asarray(memoryview(buffer))
+    if isinstance(buffer, np.ndarray) and buffer.ndim == 1:
+        return buffer
+    raise TypeError(
+        "typed_sort expects an array.array or a 1-D numpy.ndarray, "
+        f"got {type(buffer).__name__}"
+    )
+
+
+def _sort_array(values: array, block_size: int) -> None:
+    """Block-sort values with the built-in sort, then k-way merge the blocks."""
+    n = len(values)
+    typecode = values.typecode
+    for lo in range(0, n, block_size):
+        values[lo : lo + block_size] = array(
+            typecode, sorted(values[lo : lo + block_size])
+        )
+    if n <= block_size:
+        return
+
+    merged = array(typecode)
+    with memoryview(values) as view:
+        blocks = [view[lo : lo + block_size] for lo in range(0, n, block_size)]
+        merged.extend(heapq.merge(*blocks))
+        view[:] = memoryview(merged)
+        for block in blocks:
+            block.release()
@@ -0,0 +1,97 @@
+import tempfile
+import unittest
+from unittest import mock
+from src.registry import ALGORITHMS, get_algorithm, register
+from utils import benchmark_utils, metrics_utils
+
+
+class TestBenchmarkUtils(unittest.TestCase):
+    def test_summarize(self):
+        stats = metrics_utils.summarize([5.0, 1.0, 3.0, 2.0, 4.0])
+        self.assertEqual(stats, {"median": 3.0, "iqr": 2.0, "min": 1.0})
+        self.assertEqual(
+            metrics_utils.summarize([7.0]), {"median": 7.0, "iqr": 0.0, "min": 7.0}
+        )
+
+    def test_time_runs_uses_fresh_inputs(self):
+        inputs = []
+        times = metrics_utils.time_runs(inputs.append, [3, 1, 2], repeats=3, warmup=2)
+        self.assertEqual(len(times), 3)
+        self.assertEqual(len(inputs), 5)
+        self.assertEqual(len({id(arr) for arr in inputs}), 5)
+
+    def test_run_cell(self):
+        options = benchmark_utils.RunOptions(repeats=2, warmup=0)
+        for name in ALGORITHMS:
+            with self.subTest(algorithm=name):
+                cell = benchmark_utils.Cell(name, "Random", 200, seed=1)
+                result = benchmark_utils.run_cell(cell, options)
+                self.assertLessEqual(result["min_ms"], result["median_ms"])
+                self.assertGreaterEqual(result["memory_kb"], 0)
+
+    def test_run_cell_counts_operations(self):
+        options = benchmark_utils.RunOptions(
+            repeats=1, warmup=0, measure_memory=False, count_operations=True
+        )
+        result = benchmark_utils.run_cell(
+            benchmark_utils.Cell("Merge Sort", "Sorted", 100), options
+        )
+        self.assertEqual(result["comparisons"], 100)
+        self.assertEqual(result["max_depth"], 1)
+        result = benchmark_utils.run_cell(
+            benchmark_utils.Cell("Typed Sort", "Sorted", 100), options
+        )
+        self.assertIsNone(result["comparisons"])
+
+    def test_run_cells_caches_results(self):
+        options = benchmark_utils.RunOptions(repeats=1, warmup=0)
+        cells = [
+            benchmark_utils.Cell("Heap Sort", "Sorted", 100),
+            benchmark_utils.Cell("Merge Sort", "Sorted", 100),
+        ]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for max_workers, expect_cached in ((2, False), (1, True)):
+                reported = []
+                results = benchmark_utils.run_cells(
+                    cells,
+                    options,
+                    max_workers=max_workers,
+                    cache_dir=cache_dir,
+                    on_result=lambda cell, result, cached: reported.append(cached),
+                )
+                self.assertEqual(set(results), set(cells))
+                self.assertEqual(reported, [expect_cached] * len(cells))
+
+    def test_cache_key(self):
+        cell = benchmark_utils.Cell("Quick Sort", "Random", 1000)
+        key = benchmark_utils.cache_key(cell)
+        self.assertEqual(key, benchmark_utils.cache_key(cell))
+        smaller = benchmark_utils.Cell("Quick Sort", "Random", 999)
+        self.assertNotEqual(key, benchmark_utils.cache_key(smaller))
+        self.assertNotEqual(
+            key, benchmark_utils.cache_key(cell, benchmark_utils.RunOptions(repeats=3))
+        )
+
+    def test_cache_key_hashes_instrumentation_when_counting(self):
+        cell = benchmark_utils.Cell("Quick Sort", "Random", 1000)
+        plain = benchmark_utils.RunOptions()
+        counting = benchmark_utils.RunOptions(count_operations=True)
+        keys = {
+            benchmark_utils.cache_key(cell, options) for options in (plain, counting)
+        }
+        with mock.patch.object(
+            benchmark_utils, "instrumentation_hash", return_value="changed"
+        ):
+            self.assertIn(benchmark_utils.cache_key(cell, plain), keys)
+            self.assertNotIn(benchmark_utils.cache_key(cell, counting), keys)
+
+    def test_registry(self):
+        self.assertEqual(get_algorithm("Heap Sort").name, "Heap Sort")
+        with self.assertRaises(KeyError):
+            get_algorithm("Bogo Sort")
+        with self.assertRaises(ValueError):
+            register("Heap Sort", sorted)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+from utils import dataset_utils
+
+
+class TestDatasetUtils(unittest.TestCase):
+    def backends(self):
+        """The random backends to test: NumPy if installed, and random."""
+        yield "numpy" if dataset_utils.np is not None else "random"
+        if dataset_utils.np is not None:
+            with mock.patch.object(dataset_utils, "np", None):
+                yield "random"
+
+    def test_seeded_datasets_are_reproducible(self):
+        for backend in self.backends():
+            for dtype in dataset_utils.DATASET_TYPES:
+                with self.subTest(backend=backend, dataset=dtype):
+                    data = dataset_utils.generate_dataset(dtype, 1000, seed=7)
+                    self.assertEqual(len(data), 1000)
+                    self.assertEqual(
+                        data, dataset_utils.generate_dataset(dtype, 1000, seed=7)
+                    )
+                    self.assertEqual(dataset_utils.generate_dataset(dtype, 0, 7), [])
+
+    def test_unseeded_datasets_follow_random_seed(self):
+        random.seed(3)
+        first = dataset_utils.generate_random_dataset(100)
+        random.seed(3)
+        self.assertEqual(first, dataset_utils.generate_random_dataset(100))
+
+    def test_distributions(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend):
+                data = dataset_utils.generate_random_dataset(5000, 10, 20, seed=1)
+                self.assertEqual(set(data), set(range(10, 21)))
+
+                data = dataset_utils.generate_few_unique_dataset(5000, 1, unique=4)
+                self.assertEqual(set(data), {0, 1, 2, 3})
+
+                data = dataset_utils.generate_nearly_sorted_dataset(1000, 1, swaps=5)
+                self.assertEqual(sorted(data), list(range(1000)))
+                self.assertLessEqual(sum(a != b for a, b in enumerate(data)), 10)
+
+                counts = Counter(dataset_utils.generate_zipf_dataset(5000, 1, a=2))
+                self.assertEqual(min(counts), 1)
+                self.assertGreater(counts[1], counts[2])
+                self.assertGreater(counts[2], counts[4])
+
+        with self.assertRaises(ValueError):
+            dataset_utils.generate_zipf_dataset(10, a=1)
+
+    def test_quicksort_killer_is_a_permutation(self):
+        self.assertEqual(
+            dataset_utils.generate_quicksort_killer_dataset(8),
+            [0, 4, 2, 6, 1, 3, 5, 7],
+        )
+        for size in [*range(17), 102, 1000, 1001, 1002, 1003]:
+            with self.subTest(size=size):
+                data = dataset_utils.generate_quicksort_killer_dataset(size)
+                self.assertEqual(sorted(data), list(range(size)))
+
+    def test_shapes(self):
+        self.assertEqual(dataset_utils.generate_organ_pipe_dataset(5), [0, 1, 2, 1, 0])
+        self.assertEqual(dataset_utils.generate_organ_pipe_dataset(4), [0, 1, 1, 0])
+        self.assertEqual(
+            dataset_utils.generate_sawtooth_dataset(7, teeth=3),
+            [0, 1, 2, 0, 1, 2, 0],
+        )
+
+    def test_load_dataset_maps_cached_file(self):
+        expected = dataset_utils.generate_dataset("Zipf", 500, seed=2)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = dataset_utils.load_dataset("Zipf", 500, 2, cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            second = dataset_utils.load_dataset("Zipf", 500, 2, cache_dir)
+            for data in (first, second):
+                self.assertIsInstance(data, memoryview)
+                self.assertTrue(data.readonly)
+                self.assertEqual(data.tolist(), expected)
+            first.release()
+            second.release()
+        self.assertEqual(dataset_utils.load_dataset("Zipf", 500, 2, None), expected)
+
+    def test_unknown_dataset(self):
+        with self.assertRaises(ValueError):
+            dataset_utils.generate_dataset("Bogus", 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
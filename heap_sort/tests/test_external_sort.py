@@ -0,0 +1,86 @@
+import os
+import random
+import tempfile
+import unittest
+from array import array
+from src.external_sort import external_sort
+from src.quick_sort import quick_sort
+
+
+class TestExternalSort(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.work_dir.name, "input")
+        self.output_path = os.path.join(self.work_dir.name, "output")
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    def write_binary(self, data, typecode="q"):
+        with open(self.input_path, "wb") as output:
+            array(typecode, data).tofile(output)
+
+    def read_binary(self, typecode="q"):
+        values = array(typecode)
+        with open(self.output_path, "rb") as source:
+            values.frombytes(source.read())
+        return values.tolist()
+
+    def test_binary(self):
+        data = [random.randint(-(2**63), 2**63 - 1) for _ in range(5000)]
+        self.write_binary(data)
+        stats = external_sort(self.input_path, self.output_path)
+        self.assertEqual(self.read_binary(), sorted(data))
+        self.assertEqual(stats, {"values": 5000, "runs": 1, "merge_passes": 1})
+
+    def test_several_merge_passes(self):
+        data = [random.randint(0, 100) for _ in range(1000)]
+        self.write_binary(data)
+        # 10 values per run and 2 runs per merge: 100 runs, 7 passes.
+        stats = external_sort(
+            self.input_path, self.output_path, memory_budget=640, fan_in=2
+        )
+        self.assertEqual(self.read_binary(), sorted(data))
+        self.assertEqual(stats, {"values": 1000, "runs": 100, "merge_passes": 7})
+
+    def test_csv(self):
+        data = [random.uniform(-1e6, 1e6) for _ in range(2000)]
+        with open(self.input_path, "w") as output:
+            output.writelines(f"{value}\n" for value in data)
+        external_sort(
+            self.input_path,
+            self.output_path,
+            memory_budget=4096,
+            file_format="csv",
+            typecode="d",
+            sort=quick_sort,
+        )
+        with open(self.output_path) as source:
+            self.assertEqual([float(line) for line in source], sorted(data))
+
+    def test_csv_skips_blank_lines(self):
+        with open(self.input_path, "w") as output:
+            output.write("3\n\n1\n2\n\n")
+        stats = external_sort(
+            self.input_path, self.output_path, memory_budget=128, file_format="csv"
+        )
+        with open(self.output_path) as source:
+            self.assertEqual(source.read().split(), ["1", "2", "3"])
+        self.assertEqual(stats["values"], 3)
+
+    def test_empty(self):
+        self.write_binary([])
+        stats = external_sort(self.input_path, self.output_path)
+        self.assertEqual(self.read_binary(), [])
+        self.assertEqual(stats["runs"], 0)
+
+    def test_rejects_bad_arguments(self):
+        self.write_binary([2, 1])
+        with self.assertRaises(ValueError):
+            external_sort(self.input_path, self.output_path, file_format="xml")
+        with self.assertRaises(ValueError):
+            external_sort(self.input_path, self.output_path, fan_in=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,8 @@
+import heapq
+import random
 import unittest
-from src.heap_sort import heap_sort
+from itertools import count, islice
+from src.heap_sort import heap_sort, merge_sorted, partial_heap_sort, top_k
 
 
 class TestHeapsort(unittest.TestCase):
@@ -24,6 +27,66 @@ class TestHeapsort(unittest.TestCase):
         heap_sort(arr)
         self.assertEqual(arr, [42])
 
+    def test_matches_sorted(self):
+        rng = random.Random(0)
+        for size in [2, 3, 10, 257]:
+            arr = [rng.randint(0, 20) for _ in range(size)]
+            for bottom_up in (True, False):
+                with self.subTest(size=size, bottom_up=bottom_up):
+                    result = arr.copy()
+                    heap_sort(result, bottom_up=bottom_up)
+                    self.assertEqual(result, sorted(arr))
+
+    def test_key_and_reverse(self):
+        words = ["pear", "fig", "banana", "kiwi", "apple"]
+        by_length = words.copy()
+        heap_sort(by_length, key=len)
+        self.assertEqual([len(w) for w in by_length], [3, 4, 4, 5, 6])
+
+        arr = [4, -9, 2, 7, -1]
+        heap_sort(arr, key=abs, reverse=True)
+        self.assertEqual(arr, [-9, 7, 4, 2, -1])
+
+        arr = [3, 1, 2]
+        heap_sort(arr, reverse=True)
+        self.assertEqual(arr, [3, 2, 1])
+
+
+class TestStreamingHeap(unittest.TestCase):
+    def test_top_k(self):
+        rng = random.Random(0)
+        arr = [rng.randint(0, 50) for _ in range(500)]
+        for k in (0, 1, 10, 500, 600):
+            with self.subTest(k=k):
+                self.assertEqual(top_k(iter(arr), k), heapq.nlargest(k, arr))
+
+    def test_top_k_key_keeps_input_order(self):
+        words = ["fig", "kiwi", "pear", "apple", "plum", "banana"]
+        self.assertEqual(top_k(words, 3, key=len), ["banana", "apple", "kiwi"])
+        self.assertEqual(top_k(words, 1, key=len), heapq.nlargest(1, words, key=len))
+
+    def test_merge_sorted_is_lazy_and_stable(self):
+        # Infinite generators: an eager merge would never return.
+        merged = merge_sorted(count(0, 3), count(1, 3), count(2, 3))
+        self.assertEqual(list(islice(merged, 9)), list(range(9)))
+
+        runs = [[(1, "a"), (2, "a")], [(1, "b")], [], [(0, "c"), (2, "c")]]
+        self.assertEqual(
+            list(merge_sorted(*runs, key=lambda pair: pair[0])),
+            [(0, "c"), (1, "a"), (1, "b"), (2, "a"), (2, "c")],
+        )
+        self.assertEqual(list(merge_sorted()), [])
+
+    def test_partial_heap_sort(self):
+        rng = random.Random(1)
+        arr = [rng.randint(0, 100) for _ in range(300)]
+        for k in (0, 1, 7, 299, 300, 400):
+            with self.subTest(k=k):
+                result = arr.copy()
+                partial_heap_sort(result, k)
+                self.assertEqual(result[:k], sorted(arr)[:k])
+                self.assertEqual(sorted(result), sorted(arr))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,41 @@
+import random
+import unittest
+from src import heap_sort, merge_sort, quick_sort
+from src.instrumented import OperationCounts, count_operations
+
+
+class TestInstrumented(unittest.TestCase):
+    def test_counts_each_sort(self):
+        rng = random.Random(0)
+        data = [rng.randint(0, 1000) for _ in range(2000)]
+        for sort in (heap_sort.heap_sort, merge_sort.merge_sort, quick_sort.quick_sort):
+            with self.subTest(sort=sort.__name__):
+                counts = count_operations(sort, data)
+                self.assertGreater(counts.comparisons, len(data))
+                self.assertGreater(counts.moves, len(data))
+                self.assertGreaterEqual(counts.max_depth, 1)
+
+    def test_exact_counts(self):
+        # One ascending run: merge sort only compares neighbours.
+        counts = count_operations(merge_sort.merge_sort, range(100))
+        self.assertEqual(counts, OperationCounts(100, 0, 0, 1))
+        # Heapsort allocates nothing and does not recurse.
+        counts = count_operations(heap_sort.heap_sort, range(100, 0, -1))
+        self.assertEqual((counts.allocations, counts.max_depth), (0, 1))
+
+    def test_recursion_depth(self):
+        counts = count_operations(quick_sort.quick_sort, range(1 << 12))
+        self.assertGreater(counts.max_depth, 1)
+        self.assertLessEqual(counts.max_depth, 12)
+
+    def test_modules_are_restored(self):
+        introsort = quick_sort._introsort
+        count_operations(quick_sort.quick_sort, [3, 1, 2])
+        self.assertIs(quick_sort._introsort, introsort)
+        with self.assertRaises(TypeError):
+            count_operations(quick_sort.quick_sort, [3, "1", 2])
+        self.assertIs(quick_sort._introsort, introsort)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,22 @@
+import random
 import unittest
 from src.merge_sort import merge_sort
 
 
+class Item:
+    """Compares by key only, so the label shows the order of equal items."""
+
+    def __init__(self, key, label):
+        self.key = key
+        self.label = label
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+
 class TestMergeSort(unittest.TestCase):
     def test_random(self):
         arr = [4, 2, 7, 1, 3]
@@ -24,6 +39,36 @@ class TestMergeSort(unittest.TestCase):
         merge_sort(arr)
         self.assertEqual(arr, [42])
 
+    def test_matches_sorted(self):
+        rng = random.Random(0)
+        for size in [2, 31, 32, 33, 100, 1000]:
+            datasets = [
+                [rng.randint(0, 9) for _ in range(size)],
+                list(range(size, 0, -1)),
+                [i % 7 for i in range(size)],
+                list(range(size // 2)) + list(range(size // 2, 0, -1)),
+            ]
+            for arr in datasets:
+                with self.subTest(size=size, arr=arr[:5]):
+                    result = arr.copy()
+                    merge_sort(result)
+                    self.assertEqual(result, sorted(arr))
+
+    def test_stable_with_key(self):
+        rng = random.Random(1)
+        pairs = [(rng.randint(0, 5), i) for i in range(500)]
+        # Descending stretches of equal keys must not be reversed.
+        pairs += [(5 - i // 10, 500 + i) for i in range(60)]
+        expected = sorted(pairs, key=lambda pair: pair[0])
+
+        result = pairs.copy()
+        merge_sort(result, key=lambda pair: pair[0])
+        self.assertEqual(result, expected)
+
+        items = [Item(key, label) for key, label in pairs]
+        merge_sort(items)
+        self.assertEqual([(item.key, item.label) for item in items], expected)
+
 
 if __name__ == "__main__":
     unittest.main()
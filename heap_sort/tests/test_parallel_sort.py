@@ -0,0 +1,44 @@
+import random
+import unittest
+from array import array
+from src.heap_sort import heap_sort
+from src.parallel_sort import parallel_sort
+from src.quick_sort import quick_sort
+
+
+class TestParallelSort(unittest.TestCase):
+    def test_merge(self):
+        data = [random.randint(-(10**12), 10**12) for _ in range(5000)]
+        values = array("q", data)
+        parallel_sort(values, max_workers=3, method="merge")
+        self.assertEqual(values.tolist(), sorted(data))
+
+    def test_sample(self):
+        data = [random.random() for _ in range(5000)]
+        values = array("d", data)
+        parallel_sort(values, max_workers=3, method="sample", sort=quick_sort)
+        self.assertEqual(values.tolist(), sorted(data))
+
+    def test_duplicates(self):
+        data = [random.randint(0, 3) for _ in range(2000)]
+        for method in ("merge", "sample"):
+            values = array("i", data)
+            parallel_sort(values, max_workers=2, method=method, sort=heap_sort)
+            self.assertEqual(values.tolist(), sorted(data))
+
+    def test_small_input_sorts_serially(self):
+        values = array("q", [3, 1, 2])
+        parallel_sort(values, max_workers=4)
+        self.assertEqual(values.tolist(), [1, 2, 3])
+
+    def test_rejects_lists(self):
+        with self.assertRaises(TypeError):
+            parallel_sort([3, 1, 2])
+
+    def test_rejects_unknown_method(self):
+        with self.assertRaises(ValueError):
+            parallel_sort(array("q", [2, 1]), method="bogo")
+
+
+if __name__ == "__main__":
+    unittest.main()
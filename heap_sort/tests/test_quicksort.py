@@ -1,4 +1,7 @@
+import random
 import unittest
+from unittest import mock
+from src import quick_sort as quick_sort_module
 from src.quick_sort import quick_sort
 
 
@@ -24,6 +27,52 @@ class TestQuickSort(unittest.TestCase):
         quick_sort(arr)
         self.assertEqual(arr, [42])
 
+    def test_matches_sorted(self):
+        rng = random.Random(0)
+        for size in [2, 16, 17, 100, 129, 2000]:
+            datasets = [
+                [rng.randint(0, 3) for _ in range(size)],
+                [rng.random() for _ in range(size)],
+                list(range(size, 0, -1)),
+                [5] * size,
+                list(range(size // 2)) + list(range(size // 2, 0, -1)),
+            ]
+            for arr in datasets:
+                with self.subTest(size=size, arr=arr[:5]):
+                    result = arr.copy()
+                    quick_sort(result)
+                    self.assertEqual(result, sorted(arr))
+
+    def test_large_duplicate_heavy_input(self):
+        # Two-way partitioning recursed once per duplicate here and hit the
+        # recursion limit.
+        arr = [random.randint(0, 10) for _ in range(50_000)]
+        expected = sorted(arr)
+        quick_sort(arr)
+        self.assertEqual(arr, expected)
+
+    def test_heap_sort_fallback(self):
+        arr = [random.randint(0, 1000) for _ in range(500)]
+        expected = sorted(arr)
+        fallback = mock.patch.object(
+            quick_sort_module,
+            "_heap_sort_range",
+            wraps=quick_sort_module._heap_sort_range,
+        )
+        # With no partitioning depth allowed, introsort goes straight to heapsort.
+        with mock.patch.object(quick_sort_module, "DEPTH_FACTOR", 0), fallback as spy:
+            quick_sort(arr)
+        spy.assert_called_once()
+        self.assertEqual(arr, expected)
+
+    def test_heap_sort_range_leaves_the_rest_alone(self):
+        rng = random.Random(0)
+        for lo, hi in ((0, 0), (0, 99), (10, 11), (17, 80)):
+            arr = [rng.randint(0, 50) for _ in range(100)]
+            expected = arr[:lo] + sorted(arr[lo : hi + 1]) + arr[hi + 1 :]
+            quick_sort_module._heap_sort_range(arr, lo, hi)
+            self.assertEqual(arr, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+from array import array
+from unittest import mock
+from src import typed_sort as typed_sort_module
+from src.typed_sort import typed_sort
+
+requires_numpy = unittest.skipIf(typed_sort_module.np is None, "NumPy not installed")
+
+
+class TestTypedSort(unittest.TestCase):
+    def test_int64(self):
+        data = [random.randint(-(2**63), 2**63 - 1) for _ in range(1000)]
+        values = array("q", data)
+        typed_sort(values)
+        self.assertEqual(values.tolist(), sorted(data))
+
+    def test_float64(self):
+        data = [random.uniform(-1e9, 1e9) for _ in range(1000)]
+        values = array("d", data)
+        typed_sort(values)
+        self.assertEqual(values.tolist(), sorted(data))
+
+    def test_empty(self):
+        values = array("q")
+        typed_sort(values)
+        self.assertEqual(values.tolist(), [])
+
+    def test_block_sizes(self):
+        data = [random.randint(0, 50) for _ in range(500)]
+        for block_size in (1, 7, 64, 499, 500, 1000):
+            values = array("i", data)
+            # Without NumPy, typed_sort takes the block-sorting fallback.
+            with mock.patch.object(typed_sort_module, "np", None), mock.patch.object(
+                typed_sort_module, "BLOCK_SIZE", block_size
+            ):
+                typed_sort(values)
+            self.assertEqual(values.tolist(), sorted(data))
+
+    def test_stdlib_fallback(self):
+        data = [random.randint(-1000, 1000) for _ in range(1000)]
+        for typecode in "hIqd":
+            for block_size in (1, 10, 333, 2000):
+                values = array(typecode, [abs(x) for x in data])
+                typed_sort_module._sort_array(values, block_size)
+                self.assertEqual(values.tolist(), sorted(abs(x) for x in data))
+
+    def test_rejects_lists(self):
+        with self.assertRaises(TypeError):
+            typed_sort([3, 1, 2])
+
+    @requires_numpy
+    def test_numpy_array(self):
+        np = typed_sort_module.np
+        values = np.random.default_rng(0).integers(-1000, 1000, 10_000)
+        expected = np.sort(values)
+        typed_sort(values)
+        self.assertTrue((values == expected).all())
+
+    @requires_numpy
+    def test_numpy_view_sorts_in_place(self):
+        np = typed_sort_module.np
+        base = np.arange(10, 0, -1, dtype=np.float64)
+        typed_sort(base[2:8])
+        self.assertEqual(base.tolist(), [10, 9, 3, 4, 5, 6, 7, 8, 2, 1])
+
+    @requires_numpy
+    def test_rejects_2d(self):
+        np = typed_sort_module.np
+        with self.assertRaises(TypeError):
+            typed_sort(np.zeros((2, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,306 @@
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, fields
+from src.instrumented import OperationCounts, count_operations
+from src.registry import get_algorithm
+from utils import dataset_utils, metrics_utils
+
+
+@dataclass(frozen=True, slots=True)
+class Cell:
+    """One benchmark measurement: an algorithm on one dataset."""
+
+    algorithm: str
+    dataset: str
+    size: int
+    seed: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class RunOptions:
+    """How each cell is measured."""
+
+    repeats: int = 5
+    warmup: int = 1
+    gc_control: bool = True
+    measure_memory: bool = True
+    count_operations: bool = False
+
+
+def run_cell(cell, options=RunOptions(), dataset_dir=None):
+    """
+    Measure one cell: a timing pass of options.warmup + options.repeats runs
+    without tracemalloc, then, with options.measure_memory, one separate run
+    under tracemalloc for the peak memory, and with options.count_operations,
+    one more run on instrumented input (see instrumented.count_operations)
+    for the operation counts.
+
+    The dataset is regenerated from the cell's seed, so a cell gives the same
+    input in any process. With a dataset_dir, it is generated once and then
+    memory-mapped from there (see dataset_utils.load_dataset).
+
+    Returns:
+        dict: Median, IQR and minimum time in ms ("median_ms", "iqr_ms",
+        "min_ms"), peak memory in KB ("memory_kb", None if not measured) and
+        the fields of OperationCounts ("comparisons", "moves", "allocations",
+        "max_depth", None if not counted or the algorithm is not countable).
+    """
+    algorithm = get_algorithm(cell.algorithm)
+    data = dataset_utils.load_dataset(cell.dataset, cell.size, cell.seed, dataset_dir)
+    times_ms = metrics_utils.time_runs(
+        algorithm.sort,
+        data,
+        repeats=options.repeats,
+        warmup=options.warmup,
+        gc_control=options.gc_control,
+        prepare=algorithm.prepare,
+    )
+    stats = metrics_utils.summarize(times_ms)
+    memory_kb = None
+    if options.measure_memory:
+        memory_kb = metrics_utils.peak_memory(
+            algorithm.sort, data, prepare=algorithm.prepare
+        )
+    counts = dict.fromkeys(field.name for field in fields(OperationCounts))
+    if options.count_operations and algorithm.countable:
+        counts = asdict(count_operations(algorithm.sort, data))
+    return {
+        "median_ms": stats["median"],
+        "iqr_ms": stats["iqr"],
+        "min_ms": stats["min"],
+        "memory_kb": memory_kb,
+        **counts,
+    }
+
+
+def run_cells(
+    cells,
+    options=RunOptions(),
+    max_workers=1,
+    isolate=False,
+    pin_cpus=False,
+    cache_dir=None,
+    on_result=None,
+    dataset_dir=None,
+):
+    """
+    Measure many cells, in parallel and resumably.
+
+    - With a cache_dir, every finished cell is written there at once, under
+      cache_key(cell, options), and cells already there are not measured
+      again. A rerun only measures cells whose algorithm source, dataset,
+      options or Python version changed, and an interrupted run picks up
+      where it stopped.
+    - Cells run on a pool of max_workers processes (in this process if
+      max_workers is 1 and not isolate). With isolate, every cell gets a
+      freshly spawned process.
+    - With pin_cpus, each running cell is pinned to its own CPU (on systems
+      with os.sched_setaffinity), so concurrent cells do not migrate onto
+      each other's cores. max_workers is capped at the number of CPUs.
+
+    Args:
+        cells (Iterable[Cell]): The cells to measure.
+        options (RunOptions): How each cell is measured.
+        max_workers (int): Number of cells measured at once.
+        isolate (bool): Measure every cell in a freshly spawned process.
+        pin_cpus (bool): Pin each running cell to one CPU.
+        cache_dir (Optional[str]): Directory of cached results.
+        on_result (callable, optional): Called as on_result(cell, result,
+            cached) as each cell finishes.
+        dataset_dir (Optional[str]): Directory of cached datasets, shared by
+            all workers.
+
+    Returns:
+        dict: The result of run_cell for each cell.
+    """
+    cpus = _available_cpus() if pin_cpus else []
+    if cpus:
+        max_workers = min(max_workers, len(cpus))
+    results = {}
+    pending = []
+    for cell in dict.fromkeys(cells):
+        cached = _load_cached(cache_dir, cell, options)
+        if cached is None:
+            pending.append(cell)
+        else:
+            results[cell] = cached
+            if on_result:
+                on_result(cell, cached, True)
+
+    def finish(cell, result):
+        results[cell] = result
+        _store_cached(cache_dir, cell, options, result)
+        if on_result:
+            on_result(cell, result, False)
+
+    if max_workers == 1 and not isolate:
+        cpu = cpus[0] if cpus else None
+        for cell in pending:
+            finish(cell, _measure_pinned(cell, options, cpu, dataset_dir))
+        return results
+
+    if isolate:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=1,
+        )
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    with executor:
+        # At most max_workers cells are submitted at a time, so every
+        # running cell can be given a CPU that no other running cell has.
+        free_cpus = list(cpus)
+        running = {}
+        queue = iter(pending)
+        try:
+            while True:
+                for cell in queue:
+                    cpu = free_cpus.pop() if free_cpus else None
+                    future = executor.submit(
+                        _measure_pinned, cell, options, cpu, dataset_dir
+                    )
+                    running[future] = (cell, cpu)
+                    if len(running) == max_workers:
+                        break
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    cell, cpu = running.pop(future)
+                    if cpu is not None:
+                        free_cpus.append(cpu)
+                    finish(cell, future.result())
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    return results
+
+
+def cache_key(cell, options=RunOptions()):
+    """
+    A hash of everything a cell's result depends on: the source of the
+    algorithm (see source_hash), the dataset type, seed and fingerprint (see
+    dataset_utils.dataset_fingerprint), the size, the run options and the
+    Python version, plus, with options.count_operations, the source of the
+    instrumentation (see instrumentation_hash).
+    """
+    spec = {
+        "algorithm": cell.algorithm,
+        "source": source_hash(cell.algorithm),
+        "dataset": cell.dataset,
+        "generator": dataset_utils.dataset_fingerprint(cell.dataset),
+        "seed": cell.seed,
+        "size": cell.size,
+        "options": asdict(options),
+        "python": sys.version,
+    }
+    if options.count_operations:
+        spec["instrumentation"] = instrumentation_hash()
+    return _hash_text(json.dumps(spec, sort_keys=True))
+
+
+def source_hash(name):
+    """
+    A hash of the source of a registered algorithm: the file that defines
+    its sort, every file of the same package that it imports from (followed
+    transitively), and the source of its prepare function.
+    """
+    algorithm = get_algorithm(name)
+    module = inspect.getmodule(algorithm.sort)
+    package = module.__name__.rpartition(".")[0]
+    files = {}
+    stack = [module]
+    while stack:
+        module = stack.pop()
+        if module.__name__ in files:
+            continue
+        with open(inspect.getsourcefile(module), "rb") as source:
+            files[module.__name__] = source.read()
+        if not package:
+            continue
+        for value in vars(module).values():
+            used = value if inspect.ismodule(value) else inspect.getmodule(value)
+            if used and used.__name__.startswith(package + "."):
+                stack.append(used)
+
+    digest = hashlib.sha256()
+    for module_name in sorted(files):
+        digest.update(module_name.encode())
+        digest.update(files[module_name])
+    if inspect.isfunction(algorithm.prepare):
+        digest.update(inspect.getsource(algorithm.prepare).encode())
+    else:
+        digest.update(repr(algorithm.prepare).encode())
+    return digest.hexdigest()
+
+
+def instrumentation_hash():
+    """A hash of the source of src/instrumented.py, which produces the counts."""
+    with open(inspect.getsourcefile(count_operations), "rb") as source:
+        return hashlib.sha256(source.read()).hexdigest()
+
+
+def _hash_text(text):
+    """The SHA-256 hex digest of text."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _available_cpus():
+    """The CPUs this process may run on, or [] if that cannot be set."""
+    if not hasattr(os, "sched_setaffinity"):
+        return []
+    return sorted(os.sched_getaffinity(0))
+
+
+def _measure_pinned(cell, options, cpu, dataset_dir=None):
+    """run_cell, pinned to cpu (if not None) for its duration."""
+    if cpu is None:
+        return run_cell(cell, options, dataset_dir)
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {cpu})
+    try:
+        return run_cell(cell, options, dataset_dir)
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def _cache_path(cache_dir, cell, options):
+    """The cache file of a cell."""
+    return os.path.join(cache_dir, f"{cache_key(cell, options)}.json")
+
+
+def _load_cached(cache_dir, cell, options):
+    """The cached result of a cell, or None."""
+    if cache_dir is None:
+        return None
+    try:
+        with open(_cache_path(cache_dir, cell, options)) as cached:
+            return json.load(cached)["result"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _store_cached(cache_dir, cell, options, result):
+    """Write a cell's result to the cache, atomically."""
+    if cache_dir is None:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _cache_path(cache_dir, cell, options)
+    entry = {
+        "cell": asdict(cell),
+        "options": asdict(options),
+        "python": sys.version,
+        "result": result,
+    }
+    # A partly written file is never visible under the final name, so a
+    # sweep killed mid-write leaves no corrupt entry behind.
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as output:
+        json.dump(entry, output, indent=2)
+    os.replace(temporary, path)
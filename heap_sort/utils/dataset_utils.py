@@ -1,16 +1,196 @@
+import hashlib
+import inspect
+import mmap
+import os
 import random
+from array import array
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the generators fall back to random.
+    np = None
 
-def generate_sorted_dataset(size):
+# Where load_dataset keeps generated datasets, as raw int64 files.
+DATASET_CACHE_DIR = os.path.join("outputs", "datasets")
+
+INT64_MAX = (1 << 63) - 1
+
+
+def _rng(seed):
+    """
+    The random generator of one dataset: a NumPy Generator, or a
+    random.Random without NumPy. With seed None, the seed is drawn from the
+    random module, so random.seed() still makes the dataset reproducible.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    if np is not None:
+        return np.random.default_rng(seed)
+    return random.Random(seed)
+
+
+def generate_sorted_dataset(size, seed=None):
     """Generates a sorted dataset."""
     return list(range(size))
 
 
-def generate_reverse_sorted_dataset(size):
+def generate_reverse_sorted_dataset(size, seed=None):
     """Generates a reverse sorted dataset."""
     return list(range(size, 0, -1))
 
 
-def generate_random_dataset(size, lower=0, upper=1000):
-    """Generates a random dataset."""
-    return [random.randint(lower, upper) for _ in range(size)]
+def generate_random_dataset(size, lower=0, upper=1000, seed=None):
+    """Generates a random dataset, uniform over lower..upper inclusive."""
+    rng = _rng(seed)
+    if np is not None:
+        return rng.integers(lower, upper, size=size, endpoint=True).tolist()
+    return rng.choices(range(lower, upper + 1), k=size)
+
+
+def generate_few_unique_dataset(size, seed=None, unique=10):
+    """Generates a random dataset of only `unique` distinct values."""
+    return generate_random_dataset(size, 0, unique - 1, seed)
+
+
+def generate_nearly_sorted_dataset(size, seed=None, swaps=None):
+    """
+    Generates a sorted dataset with `swaps` random pairs of elements swapped
+    (default: 1% of the size).
+    """
+    if swaps is None:
+        swaps = size // 100
+    arr = list(range(size))
+    if not size:
+        return arr
+    rng = _rng(seed)
+    if np is not None:
+        positions = rng.integers(0, size, size=(swaps, 2)).tolist()
+    else:
+        positions = [(rng.randrange(size), rng.randrange(size)) for _ in range(swaps)]
+    for i, j in positions:
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def generate_organ_pipe_dataset(size, seed=None):
+    """Generates a dataset that rises to its middle, then falls: 0 1 2 1 0."""
+    rising = list(range((size + 1) // 2))
+    return rising + rising[: size // 2][::-1]
+
+
+def generate_sawtooth_dataset(size, seed=None, teeth=10):
+    """Generates `teeth` sorted runs of equal length, each from 0 upwards."""
+    period = max(1, -(-size // teeth))
+    return (list(range(period)) * teeth)[:size]
+
+
+def generate_zipf_dataset(size, seed=None, a=1.5):
+    """
+    Generates a Zipf-distributed dataset with exponent a > 1: value k has
+    probability proportional to k ** -a, so a few small values dominate and
+    the tail is long.
+    """
+    if a <= 1:
+        raise ValueError("a must be greater than 1")
+    rng = _rng(seed)
+    if np is not None:
+        return rng.zipf(a, size=size).tolist()
+    # The integer part of a Pareto variate with shape a - 1 has the same
+    # power-law tail, P(X >= k) = k ** (1 - a).
+    return [min(int(rng.paretovariate(a - 1)), INT64_MAX) for _ in range(size)]
+
+
+def generate_quicksort_killer_dataset(size, seed=None):
+    """
+    Musser's sequence that drives a median-of-three quicksort to quadratic
+    time by making every pivot one of the two smallest elements, as a
+    permutation of 0..size-1.
+
+    The sequence is defined for sizes divisible by 4 (an even half k): the
+    first half holds i - 1 at odd 1-based positions i and k + i - 2 at even
+    ones, and the second half holds the odd values in order. For other
+    sizes it is built on the largest multiple of 4 and the remaining largest
+    values are appended, which keeps the maximum last.
+    """
+    whole = size - size % 4
+    half = whole // 2
+    first = [i - 1 if i % 2 else half + i - 2 for i in range(1, half + 1)]
+    return first + list(range(1, whole, 2)) + list(range(whole, size))
+
+
+DATASET_TYPES = {
+    "Sorted": generate_sorted_dataset,
+    "Reverse": generate_reverse_sorted_dataset,
+    "Random": generate_random_dataset,
+    "Few Unique": generate_few_unique_dataset,
+    "Nearly Sorted": generate_nearly_sorted_dataset,
+    "Organ Pipe": generate_organ_pipe_dataset,
+    "Sawtooth": generate_sawtooth_dataset,
+    "Zipf": generate_zipf_dataset,
+    "Quicksort Killer": generate_quicksort_killer_dataset,
+}
+
+
+def generate_dataset(dataset_type, size, seed=None):
+    """
+    Generates a dataset of the given type (a key of DATASET_TYPES). With a
+    seed, random datasets are reproducible, so a benchmark cell can be
+    regenerated in another process instead of being copied to it.
+    """
+    if dataset_type not in DATASET_TYPES:
+        raise ValueError(f"dataset_type must be one of {', '.join(DATASET_TYPES)}")
+    return DATASET_TYPES[dataset_type](size, seed=seed)
+
+
+def dataset_fingerprint(dataset_type):
+    """
+    A hash of what a dataset's values depend on besides its size and seed:
+    the source of its generator and of _rng, and the random backend (a
+    seeded NumPy Generator and random.Random give different values).
+    """
+    if dataset_type not in DATASET_TYPES:
+        raise ValueError(f"dataset_type must be one of {', '.join(DATASET_TYPES)}")
+    backend = f"numpy-{np.__version__}" if np is not None else "random"
+    digest = hashlib.sha256(backend.encode())
+    for function in (_rng, DATASET_TYPES[dataset_type]):
+        digest.update(inspect.getsource(function).encode())
+    return digest.hexdigest()
+
+
+def load_dataset(dataset_type, size, seed, cache_dir=DATASET_CACHE_DIR):
+    """
+    A seeded dataset, generated once and then read from a cache of raw int64
+    files.
+
+    The file is memory-mapped read-only and returned as a memoryview of
+    int64 values, so loading it copies nothing: pages are read on first
+    touch and shared by every process that maps the same file. Callers must
+    copy it before sorting (the registry's prepare functions do). Without a
+    cache_dir or seed, or for size 0, the dataset is generated as a list.
+
+    Args:
+        dataset_type (str): A key of DATASET_TYPES.
+        size (int): The number of elements.
+        seed (Optional[int]): The dataset's seed.
+        cache_dir (Optional[str]): Directory of cached datasets.
+
+    Returns:
+        memoryview or list: The dataset.
+    """
+    if cache_dir is None or seed is None or size == 0:
+        return generate_dataset(dataset_type, size, seed)
+    name = dataset_type.lower().replace(" ", "_")
+    fingerprint = dataset_fingerprint(dataset_type)[:16]
+    path = os.path.join(cache_dir, f"{name}-{size}-{seed}-{fingerprint}.bin")
+    if not os.path.exists(path):
+        values = array("q", generate_dataset(dataset_type, size, seed))
+        os.makedirs(cache_dir, exist_ok=True)
+        # Written under a temporary name first, so concurrent cells never map
+        # a partly written file.
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as output:
+            values.tofile(output)
+        os.replace(temporary, path)
+    with open(path, "rb") as source:
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast("q")
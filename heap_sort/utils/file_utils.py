@@ -3,7 +3,13 @@ import os
 
 
 def save_results_to_csv(
-    output_dir, filename, dataset_type, dataset_sizes, results_time, results_memory
+    output_dir,
+    filename,
+    dataset_type,
+    dataset_sizes,
+    results_time,
+    results_memory,
+    extra_columns=None,
 ):
     """
     Save benchmarking results to a CSV file.
@@ -15,7 +21,10 @@ def save_results_to_csv(
         dataset_sizes (list): List of dataset sizes.
         results_time (dict): Dictionary mapping algorithms to execution times.
         results_memory (dict): Dictionary mapping algorithms to memory usage.
+        extra_columns (dict, optional): More columns after the memory column,
+            mapping each column name to a dictionary shaped like results_time.
     """
+    extra_columns = extra_columns or {}
 
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -33,6 +42,7 @@ def save_results_to_csv(
             "Algorithm",
             "Execution Time (ms)",
             "Memory Usage (KB)",
+            *extra_columns,
         ]
         writer.writerow(header)
 
@@ -46,5 +56,9 @@ def save_results_to_csv(
                         algo,
                         results_time[algo][dataset_sizes.index(size)],
                         results_memory[algo][dataset_sizes.index(size)],
+                        *(
+                            column[algo][dataset_sizes.index(size)]
+                            for column in extra_columns.values()
+                        ),
                     ]
                 )
@@ -1,3 +1,6 @@
+import copy
+import gc
+import statistics
 import time
 import tracemalloc
 
@@ -6,35 +9,90 @@ def measure_performance(func, data):
     """
     Measure the execution time and peak memory usage of a function.
 
+    Time and memory are measured in two separate runs, each on its own copy
+    of data made before the measurement starts: tracemalloc hooks every
+    allocation, so timing a run while it is tracing inflates the time.
+
     Args:
         func (callable): The sorting function to test.
-        data (list): The input dataset (list of numbers).
+        data (list): The input dataset (list of numbers, or a typed buffer such
+            as an array.array).
 
     Returns:
         tuple: (execution time in milliseconds, peak memory usage in KB)
     """
+    (elapsed_time_ms,) = time_runs(func, data, repeats=1, warmup=0)
+    return elapsed_time_ms, peak_memory(func, data)
 
-    # Copy the data to avoid in-place modifications affecting other tests
-    data_copy = data.copy()
 
-    # Start memory tracking
-    tracemalloc.start()
+def time_runs(func, data, repeats=5, warmup=1, gc_control=True, prepare=copy.copy):
+    """
+    Time repeated runs of a function.
+
+    Each run gets a fresh input, prepare(data), built before its timer starts.
+    The first warmup runs are discarded. With gc_control, garbage is collected
+    before each run and the collector is paused while the run is timed, so a
+    collection triggered by earlier work cannot land inside the measurement.
+
+    Args:
+        func (callable): The sorting function to test.
+        data: The input dataset.
+        repeats (int): Number of timed runs.
+        warmup (int): Number of untimed runs first.
+        gc_control (bool): Collect and pause the garbage collector.
+        prepare (callable): Builds the input of one run from data.
+
+    Returns:
+        list: The execution time of each timed run, in milliseconds.
+    """
+    times_ms = []
+    for run in range(warmup + repeats):
+        arr = prepare(data)
+        gc_was_enabled = gc.isenabled()
+        if gc_control:
+            gc.collect()
+            gc.disable()
+        try:
+            start_time = time.perf_counter()
+            func(arr)
+            end_time = time.perf_counter()
+        finally:
+            if gc_control and gc_was_enabled:
+                gc.enable()
+        if run >= warmup:
+            times_ms.append((end_time - start_time) * 1000)
+    return times_ms
 
-    # Start timer
-    start_time = time.perf_counter()
 
-    # Execute the function
-    func(data_copy)
+def peak_memory(func, data, prepare=copy.copy):
+    """
+    Peak memory allocated while func runs on prepare(data), in KB.
 
-    # Stop timer
-    end_time = time.perf_counter()
+    The input is built before tracing starts, so it is not counted.
+    """
+    arr = prepare(data)
+    tracemalloc.start()
+    try:
+        func(arr)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
 
-    # Measure peak memory usage
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
 
-    # Convert time to milliseconds and memory to KB
-    elapsed_time_ms = (end_time - start_time) * 1000
-    peak_memory_kb = peak / 1024
+def summarize(samples):
+    """
+    Summarize timing samples.
 
-    return elapsed_time_ms, peak_memory_kb
+    Returns:
+        dict: The median, interquartile range (IQR) and minimum of samples.
+    """
+    if len(samples) > 1:
+        q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    else:
+        q1 = q3 = samples[0]
+    return {
+        "median": statistics.median(samples),
+        "iqr": q3 - q1,
+        "min": min(samples),
+    }
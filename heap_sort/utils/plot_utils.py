@@ -9,6 +9,7 @@ def plot_performance(
     title_suffix="",
     output_file="outputs/sorting_performance.png",
     log_scale=True,
+    results_counts=None,
 ):
     """
     Plot execution time and memory usage for sorting algorithms.
@@ -20,18 +21,23 @@ def plot_performance(
         title_suffix (str, optional): Suffix to append to plot titles.
         output_file (str, optional): Path to save the generated plot image.
         log_scale (bool, optional): Whether to use log scale for y-axes. Default is True.
+        results_counts (dict, optional): Operation counts to plot after the
+            memory usage, one subplot each, mapping each count's name (e.g.
+            "Comparisons") to a dictionary shaped like results_time.
     """
+    results_counts = results_counts or {}
 
     # Ensure output directory exists
     output_dir = os.path.dirname(output_file)
     if output_dir and not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    # Create figure with two subplots
-    plt.figure(figsize=(14, 6))
+    # Create figure with two subplots, plus one per operation count
+    columns = 2 + len(results_counts)
+    plt.figure(figsize=(7 * columns, 6))
 
     # Execution Time Plot
-    plt.subplot(1, 2, 1)
+    plt.subplot(1, columns, 1)
     for algo in results_time:
         plt.plot(dataset_sizes, results_time[algo], marker="o", label=algo)
     plt.xlabel("Dataset Size")
@@ -43,7 +49,7 @@ def plot_performance(
     plt.grid(True, which="both", ls="--")
 
     # Memory Usage Plot
-    plt.subplot(1, 2, 2)
+    plt.subplot(1, columns, 2)
     for algo in results_memory:
         plt.plot(dataset_sizes, results_memory[algo], marker="o", label=algo)
     plt.xlabel("Dataset Size")
@@ -54,6 +60,19 @@ def plot_performance(
     plt.legend()
     plt.grid(True, which="both", ls="--")
 
+    # Operation Count Plots (symlog, since some counts are zero)
+    for column, (name, results) in enumerate(results_counts.items(), start=3):
+        plt.subplot(1, columns, column)
+        for algo in results:
+            plt.plot(dataset_sizes, results[algo], marker="o", label=algo)
+        plt.xlabel("Dataset Size")
+        plt.ylabel(name)
+        plt.title(f"{name} {title_suffix}")
+        if log_scale:
+            plt.yscale("symlog")
+        plt.legend()
+        plt.grid(True, which="both", ls="--")
+
     # Optimize layout and save
     plt.tight_layout()
     plt.savefig(output_file)
@@ -0,0 +1,128 @@
+# arity_matrix.py
+
+import random
+import time
+from src.instrumented import CountingPriorityQueue
+from src.priority_queue import PriorityQueue, Task
+
+# Queue size of the operation count table, which runs on the much slower
+# CountingPriorityQueue.
+COUNT_QUEUE_SIZE = 10_000
+
+
+def build_workload(
+    queue_size: int, inserts_per_extract: int, num_ops: int, seed: int
+) -> tuple[list[Task], list]:
+    """
+    The initial tasks of a queue with `queue_size` tasks, and `num_ops`
+    operations mixing inserts (a Task) and extract_max calls (None) in the
+    given ratio.
+    """
+    rng = random.Random(seed)
+    tasks = [
+        Task(priority=rng.randint(1, 1_000_000), task_id=i) for i in range(queue_size)
+    ]
+    # Decide the operation sequence and priorities up front so every arity
+    # replays exactly the same workload.
+    operations = []
+    next_id = queue_size
+    for i in range(num_ops):
+        if i % (inserts_per_extract + 1) == inserts_per_extract:
+            operations.append(None)
+        else:
+            operations.append(Task(priority=rng.randint(1, 1_000_000), task_id=next_id))
+            next_id += 1
+    return tasks, operations
+
+
+def replay(pq, operations: list):
+    """Run operations (see build_workload) on pq."""
+    insert = pq.insert
+    extract_max = pq.extract_max
+    for task in operations:
+        if task is None:
+            extract_max()
+        else:
+            insert(task)
+
+
+def run_workload(
+    arity: int, queue_size: int, inserts_per_extract: int, num_ops: int, seed: int
+) -> float:
+    """
+    Fill a queue with `queue_size` tasks, then run `num_ops` operations mixing
+    inserts and extract_max calls in the given ratio.
+
+    Returns:
+        float: Operations per second over the mixed phase.
+    """
+    tasks, operations = build_workload(queue_size, inserts_per_extract, num_ops, seed)
+    pq = PriorityQueue.from_tasks(tasks, arity=arity)
+    start_time = time.perf_counter()
+    replay(pq, operations)
+    end_time = time.perf_counter()
+    return num_ops / (end_time - start_time)
+
+
+def count_workload(
+    arity: int, queue_size: int, inserts_per_extract: int, num_ops: int, seed: int
+) -> tuple[float, float]:
+    """
+    The workload of run_workload on a CountingPriorityQueue.
+
+    Returns:
+        tuple: Key comparisons and task moves per operation over the mixed
+        phase.
+    """
+    tasks, operations = build_workload(queue_size, inserts_per_extract, num_ops, seed)
+    pq = CountingPriorityQueue.from_tasks(tasks, arity=arity)
+    pq.reset_counts()
+    replay(pq, operations)
+    return pq.counts.comparisons / num_ops, pq.counts.moves / num_ops
+
+
+def main():
+    """
+    Benchmark matrix of heap arity x insert/extract ratio x queue size.
+    Reports operations per second for each cell, then the key comparisons
+    and task moves per operation behind them, at COUNT_QUEUE_SIZE tasks.
+    """
+    arities = [2, 3, 4, 8]
+    ratios = [1, 4, 16]
+    queue_sizes = [10_000, 100_000, 1_000_000]
+    num_ops = 100_000
+
+    print(
+        f"{'Size':<10} {'Ins:Ext':<9} "
+        + " ".join(f"{f'd={arity} (ops/s)':<15}" for arity in arities)
+    )
+    print("=" * 80)
+    for size in queue_sizes:
+        for ratio in ratios:
+            row = [
+                run_workload(arity, size, ratio, num_ops, seed=size + ratio)
+                for arity in arities
+            ]
+            print(
+                f"{size:<10} {f'{ratio}:1':<9} "
+                + " ".join(f"{ops:<15,.0f}" for ops in row)
+            )
+
+    print(f"\nComparisons / moves per operation, {COUNT_QUEUE_SIZE:,} tasks")
+    print(f"{'Ins:Ext':<9} " + " ".join(f"{f'd={arity}':<15}" for arity in arities))
+    print("=" * 70)
+    for ratio in ratios:
+        row = [
+            count_workload(
+                arity, COUNT_QUEUE_SIZE, ratio, num_ops, seed=COUNT_QUEUE_SIZE + ratio
+            )
+            for arity in arities
+        ]
+        print(
+            f"{f'{ratio}:1':<9} "
+            + " ".join(f"{f'{cmp:.1f} / {moves:.1f}':<15}" for cmp, moves in row)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# batch_ops.py
+
+import random
+import time
+from src.priority_queue import PriorityQueue, Task
+
+
+def make_tasks(count: int, first_id: int, rng: random.Random) -> list[Task]:
+    """Create `count` tasks with random priorities and consecutive ids."""
+    return [
+        Task(priority=rng.randint(1, 1_000_000), task_id=task_id)
+        for task_id in range(first_id, first_id + count)
+    ]
+
+
+def time_ms(func, *args) -> float:
+    """Return the execution time of func(*args) in milliseconds."""
+    start_time = time.perf_counter()
+    func(*args)
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000
+
+
+def insert_one_by_one(pq: PriorityQueue, tasks: list[Task]):
+    for task in tasks:
+        pq.insert(task)
+
+
+def extract_one_by_one(pq: PriorityQueue, k: int):
+    for _ in range(k):
+        pq.extract_max()
+
+
+def main():
+    """
+    Compare bulk construction and batched insert/extract against one call per
+    task.
+    """
+    rng = random.Random(42)
+
+    print("Building a queue of N tasks")
+    print(f"{'Size':<10} {'insert x N (ms)':<18} {'from_tasks (ms)':<18}")
+    print("=" * 50)
+    for size in [10_000, 100_000, 1_000_000]:
+        tasks = make_tasks(size, 0, rng)
+        insert_ms = time_ms(insert_one_by_one, PriorityQueue(), tasks)
+        build_ms = time_ms(PriorityQueue.from_tasks, tasks)
+        print(f"{size:<10} {insert_ms:<18.2f} {build_ms:<18.2f}")
+
+    queue_size = 100_000
+    print(f"\nBatches against a queue of {queue_size} tasks")
+    print(
+        f"{'Batch':<8} {'insert x k (ms)':<17} {'insert_many (ms)':<18} "
+        f"{'extract x k (ms)':<18} {'extract_many (ms)':<18}"
+    )
+    print("=" * 80)
+    base = make_tasks(queue_size, 0, rng)
+    for batch_size in [64, 256, 1024, 50_000, 200_000]:
+        batch = make_tasks(batch_size, queue_size, rng)
+        insert_ms = time_ms(insert_one_by_one, PriorityQueue.from_tasks(base), batch)
+        insert_many_ms = time_ms(PriorityQueue.from_tasks(base).insert_many, batch)
+
+        k = min(batch_size, queue_size)
+        extract_ms = time_ms(extract_one_by_one, PriorityQueue.from_tasks(base), k)
+        extract_many_ms = time_ms(PriorityQueue.from_tasks(base).extract_many, k)
+        print(
+            f"{batch_size:<8} {insert_ms:<17.2f} {insert_many_ms:<18.2f} "
+            f"{extract_ms:<18.2f} {extract_many_ms:<18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# cancellation.py
+
+import random
+import time
+from src.priority_queue import PriorityQueue, Task
+
+
+def run_workload(
+    cancel_share: float, use_cancel: bool, max_dead_fraction: float, num_ops: int
+) -> dict:
+    """
+    Run a steady-state workload: each step inserts a task, then either cancels
+    a random queued task (with probability cancel_share) or extracts the max.
+
+    Returns:
+        dict: Time taken and the queue's live/dead/compaction counters, with
+        the largest dead share seen during the run.
+    """
+    rng = random.Random(7)
+    pq = PriorityQueue.from_tasks(
+        (Task(priority=rng.randint(1, 1_000_000), task_id=i) for i in range(100_000)),
+        max_dead_fraction=max_dead_fraction,
+    )
+    queued = list(range(100_000))
+    next_id = 100_000
+    drop = pq.cancel if use_cancel else pq.remove
+    peak_dead_share = 0.0
+
+    start_time = time.perf_counter()
+    for step in range(num_ops):
+        pq.insert(Task(priority=rng.randint(1, 1_000_000), task_id=next_id))
+        queued.append(next_id)
+        next_id += 1
+        if rng.random() < cancel_share:
+            # Swap-remove a random id from the local list of candidates.
+            position = rng.randrange(len(queued))
+            queued[position], queued[-1] = queued[-1], queued[position]
+            task_id = queued.pop()
+            if pq.contains(task_id):
+                drop(task_id)
+        else:
+            pq.extract_max()
+        if step % 1000 == 0:
+            peak_dead_share = max(peak_dead_share, pq.dead_count / len(pq.heap))
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "ms": elapsed * 1000,
+        "live": pq.live_count,
+        "dead": pq.dead_count,
+        "compactions": pq.compactions,
+        "peak_dead_share": peak_dead_share,
+    }
+
+
+def main():
+    """
+    Compare remove() against cancel() under cancel-heavy load, and show how
+    max_dead_fraction trades memory (dead entries) against compaction work.
+    """
+    num_ops = 100_000
+    print(
+        f"{'Cancel %':<10} {'Mode':<18} {'Time (ms)':<12} {'Live':<9} {'Dead':<9} "
+        f"{'Compactions':<13} {'Peak dead %':<12}"
+    )
+    print("=" * 86)
+    for cancel_share in [0.25, 0.5, 0.75]:
+        modes = [
+            ("remove", False, 0.5),
+            ("cancel f=0.25", True, 0.25),
+            ("cancel f=0.5", True, 0.5),
+        ]
+        for name, use_cancel, fraction in modes:
+            result = run_workload(cancel_share, use_cancel, fraction, num_ops)
+            print(
+                f"{cancel_share * 100:<10.0f} {name:<18} {result['ms']:<12.1f} "
+                f"{result['live']:<9} {result['dead']:<9} "
+                f"{result['compactions']:<13} {result['peak_dead_share'] * 100:<12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
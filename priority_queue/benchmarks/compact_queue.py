@@ -0,0 +1,94 @@
+# compact_queue.py
+
+import gc
+import random
+import time
+import tracemalloc
+from src.compact_priority_queue import CompactPriorityQueue
+from src.priority_queue import PriorityQueue, Task
+
+QUEUE_TYPES = {
+    "PriorityQueue": PriorityQueue,
+    "CompactPriorityQueue": CompactPriorityQueue,
+}
+
+
+def generate_tasks(count: int, seed: int):
+    """Lazily yield `count` tasks with random priorities, arrivals and deadlines."""
+    rng = random.Random(seed)
+    for task_id in range(count):
+        arrival_time = rng.uniform(0, 1000)
+        yield Task(
+            priority=rng.randint(1, 1_000_000),
+            task_id=task_id,
+            arrival_time=arrival_time,
+            deadline=arrival_time + rng.uniform(5, 15),
+        )
+
+
+def bytes_per_task(queue_type, count: int) -> float:
+    """
+    Measure the memory held by a queue of `count` tasks, including the tasks
+    themselves, divided by `count`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    pq = queue_type.from_tasks(generate_tasks(count, seed=1))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del pq
+    return current / count
+
+
+def ops_per_second(queue_type, count: int, num_ops: int) -> dict[str, float]:
+    """Time insert, update_priority and extract_max on a queue of `count` tasks."""
+    rng = random.Random(2)
+    pq = queue_type.from_tasks(generate_tasks(count, seed=1))
+    new_tasks = list(generate_tasks(count + num_ops, seed=3))[count:]
+    updates = [
+        (rng.randrange(count), rng.randint(1, 1_000_000)) for _ in range(num_ops)
+    ]
+    results = {}
+
+    start_time = time.perf_counter()
+    for task in new_tasks:
+        pq.insert(task)
+    results["insert"] = num_ops / (time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    for task_id, priority in updates:
+        pq.update_priority(task_id, priority)
+    results["update"] = num_ops / (time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    for _ in range(num_ops):
+        pq.extract_max()
+    results["extract"] = num_ops / (time.perf_counter() - start_time)
+    return results
+
+
+def main():
+    """
+    Compare PriorityQueue and CompactPriorityQueue on memory per queued task
+    and on operations per second.
+    """
+    queue_sizes = [100_000, 1_000_000]
+    num_ops = 50_000
+
+    print(
+        f"{'Size':<10} {'Queue':<22} {'Bytes/task':<12} {'Insert/s':<12} "
+        f"{'Update/s':<12} {'Extract/s':<12}"
+    )
+    print("=" * 84)
+    for size in queue_sizes:
+        for name, queue_type in QUEUE_TYPES.items():
+            memory = bytes_per_task(queue_type, size)
+            ops = ops_per_second(queue_type, size, num_ops)
+            print(
+                f"{size:<10} {name:<22} {memory:<12.1f} {ops['insert']:<12,.0f} "
+                f"{ops['update']:<12,.0f} {ops['extract']:<12,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# contention.py
+
+import asyncio
+import statistics
+import threading
+import time
+from src.concurrent_priority_queue import AsyncPriorityQueue, ThreadSafePriorityQueue
+from src.priority_queue import PriorityQueue, Task
+
+
+class BusyPollQueue:
+    """
+    The pattern used before ThreadSafePriorityQueue: one coarse external lock
+    around a PriorityQueue, with consumers polling is_empty and sleeping.
+    """
+
+    POLL_INTERVAL = 0.0005
+
+    def __init__(self):
+        self.queue = PriorityQueue()
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def put(self, task: Task):
+        with self.lock:
+            self.queue.insert(task)
+
+    def get(self):
+        while True:
+            with self.lock:
+                if not self.queue.is_empty():
+                    return self.queue.extract_max()
+                if self.closed:
+                    return None
+            time.sleep(self.POLL_INTERVAL)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+
+
+def summarize(num_tasks: int, elapsed: float, latencies: list[float]) -> dict:
+    """Throughput in tasks/s and put -> get latency quantiles in microseconds."""
+    latencies.sort()
+    return {
+        "throughput": num_tasks / elapsed,
+        "p50_us": statistics.median(latencies) * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+    }
+
+
+def run_threads(pq, producers: int, consumers: int, tasks_per_producer: int) -> dict:
+    """
+    Run producer and consumer threads against pq. Producers pace themselves
+    slightly so consumers spend time waiting, which is what the wakeup latency
+    measures.
+    """
+    put_times: dict[int, float] = {}
+    latencies: list[float] = []
+    latencies_lock = threading.Lock()
+
+    def produce(offset: int):
+        for i in range(tasks_per_producer):
+            task_id = offset + i
+            put_times[task_id] = time.perf_counter()
+            pq.put(Task(priority=i % 100, task_id=task_id))
+            if i % 64 == 0:
+                time.sleep(0.0001)
+
+    def consume():
+        local = []
+        while True:
+            task = pq.get()
+            if task is None:
+                break
+            local.append(time.perf_counter() - put_times[task.task_id])
+        with latencies_lock:
+            latencies.extend(local)
+
+    producer_threads = [
+        threading.Thread(target=produce, args=(n * tasks_per_producer,))
+        for n in range(producers)
+    ]
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    start_time = time.perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    pq.close()
+    for thread in consumer_threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+    return summarize(producers * tasks_per_producer, elapsed, latencies)
+
+
+async def run_coroutines(producers: int, consumers: int, tasks_per_producer: int):
+    """Same workload as run_threads, with coroutines on an AsyncPriorityQueue."""
+    pq = AsyncPriorityQueue()
+    put_times: dict[int, float] = {}
+    latencies: list[float] = []
+
+    async def produce(offset: int):
+        for i in range(tasks_per_producer):
+            task_id = offset + i
+            put_times[task_id] = time.perf_counter()
+            await pq.put(Task(priority=i % 100, task_id=task_id))
+            if i % 64 == 0:
+                await asyncio.sleep(0)
+
+    async def consume():
+        while True:
+            task = await pq.get()
+            if task is None:
+                return
+            latencies.append(time.perf_counter() - put_times[task.task_id])
+
+    start_time = time.perf_counter()
+    consumer_tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce(n * tasks_per_producer) for n in range(producers)))
+    pq.close()
+    await asyncio.gather(*consumer_tasks)
+    elapsed = time.perf_counter() - start_time
+    return summarize(producers * tasks_per_producer, elapsed, latencies)
+
+
+def main():
+    """
+    Contention benchmark: N producers x M consumers on the busy-poll pattern,
+    ThreadSafePriorityQueue and AsyncPriorityQueue. Reports throughput and
+    put -> get latency.
+    """
+    configurations = [(1, 1), (4, 4), (8, 2), (2, 8)]
+    tasks_per_producer = 20_000
+
+    print(
+        f"{'N x M':<8} {'Queue':<24} {'Tasks/s':<12} {'p50 (us)':<12} {'p99 (us)':<12}"
+    )
+    print("=" * 72)
+    for producers, consumers in configurations:
+        rows = {
+            "Busy poll + lock": run_threads(
+                BusyPollQueue(), producers, consumers, tasks_per_producer
+            ),
+            "ThreadSafePriorityQueue": run_threads(
+                ThreadSafePriorityQueue(), producers, consumers, tasks_per_producer
+            ),
+            "AsyncPriorityQueue": asyncio.run(
+                run_coroutines(producers, consumers, tasks_per_producer)
+            ),
+        }
+        for name, result in rows.items():
+            print(
+                f"{f'{producers} x {consumers}':<8} {name:<24} "
+                f"{result['throughput']:<12,.0f} {result['p50_us']:<12.1f} "
+                f"{result['p99_us']:<12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
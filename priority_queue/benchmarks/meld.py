@@ -0,0 +1,170 @@
+# meld.py
+
+import random
+import time
+import tracemalloc
+from src.pairing_heap import PairingHeap
+from src.priority_queue import PriorityQueue, Task
+
+
+def array_meld(target: PriorityQueue, source: PriorityQueue):
+    """Meld for the array heap: bulk insert the source's tasks, then clear it."""
+    target.insert_many(source.heap)
+    source.clear()
+
+
+def array_meld_by_extract(target: PriorityQueue, source: PriorityQueue):
+    """Meld by extracting every task from source and inserting it into target."""
+    while not source.is_empty():
+        target.insert(source.extract_max())
+
+
+def make_tasks(count: int, first_id: int, rng: random.Random) -> list[Task]:
+    return [
+        Task(priority=rng.randint(1, 1_000_000), task_id=first_id + i)
+        for i in range(count)
+    ]
+
+
+def time_meld(size: int, by_extract: bool) -> dict:
+    """
+    Time merging two queues of `size` tasks each: PairingHeap.meld, array
+    heap insert_many and, if by_extract, array heap extract + insert.
+    """
+    rng = random.Random(size)
+    left = make_tasks(size, 0, rng)
+    right = make_tasks(size, size, rng)
+    results = {}
+
+    a, b = PairingHeap.from_tasks(left), PairingHeap.from_tasks(right)
+    start_time = time.perf_counter()
+    a.meld(b)
+    results["pairing meld"] = time.perf_counter() - start_time
+
+    a, b = PriorityQueue.from_tasks(left), PriorityQueue.from_tasks(right)
+    start_time = time.perf_counter()
+    array_meld(a, b)
+    results["array insert_many"] = time.perf_counter() - start_time
+
+    if by_extract:
+        a, b = PriorityQueue.from_tasks(left), PriorityQueue.from_tasks(right)
+        start_time = time.perf_counter()
+        array_meld_by_extract(a, b)
+        results["array extract+insert"] = time.perf_counter() - start_time
+    return results
+
+
+def bytes_per_task(queue_type, size: int) -> float:
+    """Traced memory of a queue of `size` tasks, excluding the tasks."""
+    tasks = make_tasks(size, 0, random.Random(0))
+    tracemalloc.start()
+    queue = queue_type.from_tasks(tasks)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del queue
+    return used / size
+
+
+def mixed_workload(
+    queue_type, num_queues: int, size: int, num_ops: int, meld_rate: float, seed: int
+) -> float:
+    """
+    Run num_ops operations over num_queues worker queues: inserts and
+    extract_max calls in equal measure, update_priority on 10% of operations,
+    and a meld of one queue into another at the given rate.
+
+    Returns:
+        float: Operations per second.
+    """
+    rng = random.Random(seed)
+    queues = [
+        queue_type.from_tasks(make_tasks(size, q * size, rng))
+        for q in range(num_queues)
+    ]
+    meld = (lambda a, b: a.meld(b)) if queue_type is PairingHeap else array_meld
+    # Decide the operation sequence up front so both queue types replay
+    # exactly the same workload.
+    operations = []
+    next_id = num_queues * size
+    for _ in range(num_ops):
+        roll = rng.random()
+        if roll < meld_rate:
+            operations.append(("meld", *rng.sample(range(num_queues), 2)))
+        elif roll < 0.1:
+            operations.append(("update", rng.randrange(num_queues), rng.random()))
+        elif roll < 0.55:
+            task = Task(priority=rng.randint(1, 1_000_000), task_id=next_id)
+            operations.append(("insert", rng.randrange(num_queues), task))
+            next_id += 1
+        else:
+            operations.append(("extract", rng.randrange(num_queues), None))
+
+    start_time = time.perf_counter()
+    for op, index, arg in operations:
+        queue = queues[index]
+        if op == "insert":
+            queue.insert(arg)
+        elif op == "extract":
+            queue.extract_max()
+        elif op == "update":
+            task = queue.extract_max()
+            if task is not None:
+                task.priority = int(arg * 1_000_000)
+                queue.insert(task)
+        else:
+            meld(queues[arg], queue)
+    end_time = time.perf_counter()
+    return num_ops / (end_time - start_time)
+
+
+def main():
+    """
+    Compare PairingHeap with the array PriorityQueue: the cost of merging two
+    queues, and operations per second on mixed workloads with and without
+    melds.
+    """
+    print(
+        f"{'Size':<10} {'Pairing meld (ms)':<19} {'insert_many (ms)':<18} "
+        f"{'extract+insert (ms)':<20}"
+    )
+    print("=" * 70)
+    for size in [10_000, 100_000, 1_000_000]:
+        # Extract + insert takes close to a minute at 10^6; skip it there.
+        results = time_meld(size, by_extract=size <= 100_000)
+        by_extract = results.get("array extract+insert")
+        print(
+            f"{size:<10} {results['pairing meld'] * 1e3:<19.3f} "
+            f"{results['array insert_many'] * 1e3:<18.1f} "
+            f"{'-' if by_extract is None else f'{by_extract * 1e3:.1f}':<20}"
+        )
+
+    print(f"\n{'Queue':<15} {'Bytes/task (excluding the Task)':<32}")
+    print("=" * 48)
+    for queue_type in (PriorityQueue, PairingHeap):
+        print(f"{queue_type.__name__:<15} {bytes_per_task(queue_type, 100_000):<32.1f}")
+
+    num_queues = 8
+    num_ops = 100_000
+    print(f"\nMixed workload: {num_queues} queues, {num_ops} operations")
+    print(
+        f"{'Tasks/queue':<12} {'Meld rate':<10} {'Array (ops/s)':<15} "
+        f"{'Pairing (ops/s)':<16} {'Winner':<8}"
+    )
+    print("=" * 64)
+    for size in [1_000, 10_000, 100_000]:
+        for meld_rate in [0.0, 0.0001, 0.001]:
+            array_ops = mixed_workload(
+                PriorityQueue, num_queues, size, num_ops, meld_rate, seed=size
+            )
+            pairing_ops = mixed_workload(
+                PairingHeap, num_queues, size, num_ops, meld_rate, seed=size
+            )
+            winner = "pairing" if pairing_ops > array_ops else "array"
+            print(
+                f"{size:<12} {meld_rate:<10} {array_ops:<15,.0f} "
+                f"{pairing_ops:<16,.0f} {winner:<8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# metrics_overhead.py
+
+import contextlib
+import os
+import sys
+import time
+import tracemalloc
+from src.scheduler_simulation import SchedulerSimulation, exponential_service
+
+NUM_WORKERS = 8
+UTILIZATION = 0.95
+
+
+def run(num_tasks: int, verbose: bool, record_completed: bool, trace_memory: bool):
+    """
+    Simulate num_tasks tasks with per-task logging (sent to os.devnull) and
+    retention switched on or off. Returns the run time in seconds, or with
+    trace_memory the peak traced memory in MB.
+    """
+    sim = SchedulerSimulation(
+        num_workers=NUM_WORKERS,
+        service_time=exponential_service(1.0),
+        drop_expired=True,
+        verbose=verbose,
+        record_completed=record_completed,
+        seed=1,
+    )
+    sim.generate_tasks(num_tasks, horizon=num_tasks / (NUM_WORKERS * UTILIZATION))
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        if trace_memory:
+            tracemalloc.start()
+            baseline, _ = tracemalloc.get_traced_memory()
+            sim.run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return (peak - baseline) / 2**20
+        start_time = time.perf_counter()
+        sim.run()
+        return time.perf_counter() - start_time
+
+
+def main():
+    """
+    Compare a run with per-task prints and per-task retention against the
+    default run, which only updates SchedulerMetrics. Pass sizes on the
+    command line to override the defaults.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    modes = [
+        ("prints + retention", True, True),
+        ("retention only", False, True),
+        ("metrics only", False, False),
+    ]
+
+    print(f"{'Tasks':<10} {'Mode':<20} {'Run (s)':<10} {'Peak mem (MB)':<14}")
+    print("=" * 56)
+    for size in sizes:
+        for name, verbose, record_completed in modes:
+            elapsed = run(size, verbose, record_completed, trace_memory=False)
+            peak_mb = run(size, verbose, record_completed, trace_memory=True)
+            print(f"{size:<10} {name:<20} {elapsed:<10.2f} {peak_mb:<14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# policies.py
+
+import random
+import time
+from src.policies import POLICIES
+from src.priority_queue import PriorityQueue, Task
+from src.replication_runner import run_replications
+from src.scheduler_simulation import exponential_service
+
+
+def queue_throughput(policy: str, queue_size: int, num_ops: int, seed: int) -> float:
+    """
+    Fill a queue under `policy`, then alternate insert and extract_max for
+    `num_ops` operations.
+
+    Returns:
+        float: Operations per second over the mixed phase.
+    """
+    rng = random.Random(seed)
+
+    def make_task(task_id: int) -> Task:
+        arrival_time = rng.uniform(0, 1_000)
+        return Task(
+            priority=rng.randint(1, 10),
+            task_id=task_id,
+            arrival_time=arrival_time,
+            deadline=arrival_time + rng.uniform(5, 15),
+            service_time=rng.expovariate(1.0),
+        )
+
+    pq = PriorityQueue.from_tasks(
+        [make_task(i) for i in range(queue_size)], policy=policy
+    )
+    new_tasks = [make_task(queue_size + i) for i in range(num_ops // 2)]
+
+    insert = pq.insert
+    extract_max = pq.extract_max
+    start_time = time.perf_counter()
+    for task in new_tasks:
+        insert(task)
+        extract_max()
+    end_time = time.perf_counter()
+    return 2 * len(new_tasks) / (end_time - start_time)
+
+
+def main():
+    """
+    Compare the built-in policies on multi-worker simulations just below and
+    just above saturation (deadline miss rate, mean wait), and on raw queue
+    operations per second.
+    """
+    num_workers = 4
+    num_tasks = 10_000
+    seeds = range(8)
+
+    print(f"{'Policy':<15} {'Queue ops/s':<12}")
+    print("=" * 28)
+    for policy in POLICIES:
+        ops = queue_throughput(policy, 100_000, 200_000, seed=0)
+        print(f"{policy:<15} {ops:<12,.0f}")
+
+    for load in (0.9, 1.1):
+        print(
+            f"\nSimulation: {num_workers} workers at {load:.0%} load, "
+            f"{num_tasks} tasks x {len(seeds)} seeds"
+        )
+        print(f"{'Policy':<15} {'Miss rate':<18} {'Mean wait':<18}")
+        print("=" * 52)
+        for policy in POLICIES:
+            config = {
+                "num_tasks": num_tasks,
+                "horizon": num_tasks / (num_workers * load),
+                "num_workers": num_workers,
+                "service_time": exponential_service(1.0),
+                "policy": policy,
+            }
+            merged = run_replications(config, seeds)
+            miss = merged["deadline_miss_rate"]
+            wait = merged["mean_wait"]
+            miss_text = f"{miss['mean']:.3f} ±{miss['ci_high'] - miss['mean']:.3f}"
+            wait_text = f"{wait['mean']:.2f} ±{wait['ci_high'] - wait['mean']:.2f}"
+            print(f"{policy:<15} {miss_text:<18} {wait_text:<18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# replications.py
+
+import os
+import time
+from src.replication_runner import METRICS, run_replications
+from src.scheduler_simulation import exponential_service
+
+CONFIG = {
+    "num_tasks": 20_000,
+    "horizon": 20_000 / (4 * 0.9),
+    "num_workers": 4,
+    "service_time": exponential_service(1.0),
+    "drop_expired": True,
+}
+
+
+def main():
+    """
+    Run the same seeded replications with 1, 2, 4, ... worker processes and
+    report wall time, speedup and parallel efficiency, followed by the merged
+    confidence intervals.
+    """
+    num_replications = 32
+    seeds = range(num_replications)
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, *(2**i for i in range(8) if 2**i <= cpu_count)})
+
+    print(f"{num_replications} replications of {CONFIG['num_tasks']} tasks each")
+    print(f"{'Workers':<9} {'Time (s)':<10} {'Speedup':<9} {'Efficiency':<10}")
+    print("=" * 42)
+    baseline = None
+    merged = None
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        merged = run_replications(CONFIG, seeds, max_workers=workers)
+        elapsed = time.perf_counter() - start_time
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(
+            f"{workers:<9} {elapsed:<10.2f} {speedup:<9.2f} {speedup / workers:<10.0%}"
+        )
+
+    print(f"\n{'Metric':<20} {'Mean':<12} {'95% CI':<26}")
+    print("=" * 58)
+    for metric in METRICS:
+        interval = merged[metric]
+        ci = f"[{interval['ci_low']:.4f}, {interval['ci_high']:.4f}]"
+        print(f"{metric:<20} {interval['mean']:<12.4f} {ci:<26}")
+
+
+if __name__ == "__main__":
+    main()
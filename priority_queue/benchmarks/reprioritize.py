@@ -0,0 +1,67 @@
+# reprioritize.py
+
+import random
+import time
+from src.priority_queue import PriorityQueue, Task
+
+
+def build_queue(size: int, seed: int = 0) -> PriorityQueue:
+    """Build a queue of `size` tasks with random priorities."""
+    rng = random.Random(seed)
+    pq = PriorityQueue()
+    for task_id in range(size):
+        pq.insert(Task(priority=rng.randint(1, 1_000_000), task_id=task_id))
+    return pq
+
+
+def linear_scan_index(pq: PriorityQueue, task_id: int) -> int:
+    """The O(n) lookup the queue used before the index map was kept live."""
+    for i, task in enumerate(pq.heap):
+        if task.task_id == task_id:
+            return i
+    return -1
+
+
+def time_per_op_us(func, operations) -> float:
+    """Return the mean time per call of func over operations, in microseconds."""
+    start_time = time.perf_counter()
+    for args in operations:
+        func(*args)
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1_000_000 / len(operations)
+
+
+def main():
+    """
+    Time update_priority, remove and the old linear lookup as the queue grows.
+    update_priority and remove should stay roughly flat (O(log n)), while the
+    linear scan grows with the queue size.
+    """
+    queue_sizes = [1_000, 10_000, 100_000, 300_000]
+    rng = random.Random(42)
+
+    print(
+        f"{'Size':<10} {'Update (us)':<14} {'Remove (us)':<14} {'Linear Scan (us)':<16}"
+    )
+    print("=" * 60)
+
+    for size in queue_sizes:
+        pq = build_queue(size)
+        num_ops = min(2_000, size // 2)
+        updates = [
+            (rng.randrange(size), rng.randint(1, 1_000_000)) for _ in range(num_ops)
+        ]
+        update_us = time_per_op_us(pq.update_priority, updates)
+
+        removals = [(task_id,) for task_id in rng.sample(range(size), num_ops)]
+        remove_us = time_per_op_us(pq.remove, removals)
+
+        # The scan is slow enough that a handful of lookups is representative.
+        lookups = [(pq, rng.choice(pq.heap).task_id) for _ in range(50)]
+        scan_us = time_per_op_us(linear_scan_index, lookups)
+
+        print(f"{size:<10} {update_us:<14.2f} {remove_us:<14.2f} {scan_us:<16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# sharding.py
+
+import os
+import random
+import sys
+import threading
+import time
+from bisect import bisect_left
+from src.priority_queue import PriorityQueue, Task
+from src.sharded_queue import ShardedPriorityQueue, rank_error, run_sharded
+
+
+class LockedQueue:
+    """A PriorityQueue behind one lock: the baseline for sharding."""
+
+    def __init__(self):
+        self.queue = PriorityQueue()
+        self.lock = threading.Lock()
+
+    def insert(self, task: Task):
+        with self.lock:
+            self.queue.insert(task)
+
+    def insert_many(self, tasks: list[Task]):
+        with self.lock:
+            self.queue.insert_many(tasks)
+
+    def extract_max(self):
+        with self.lock:
+            return self.queue.extract_max()
+
+
+def make_tasks(count: int, seed: int = 0) -> list[Task]:
+    rng = random.Random(seed)
+    return [Task(priority=rng.randint(1, 1_000_000), task_id=i) for i in range(count)]
+
+
+def burn(task: Task) -> int:
+    """A CPU-bound handler: a few thousand integer operations per task."""
+    total = task.priority
+    for i in range(2_000):
+        total = (total * 31 + i) % 1_000_003
+    return total
+
+
+def make_queue(num_shards, selection):
+    """A ShardedPriorityQueue, or the single-lock baseline if num_shards is None."""
+    if num_shards is None:
+        return LockedQueue()
+    return ShardedPriorityQueue(num_shards=num_shards, selection=selection, seed=0)
+
+
+def thread_throughput(queue, tasks: list[Task], num_threads: int) -> float:
+    """
+    Insert then extract every task from num_threads threads at once.
+
+    Returns:
+        float: Operations (inserts plus extracts) per second.
+    """
+    chunks = [tasks[i::num_threads] for i in range(num_threads)]
+
+    def work(chunk: list[Task]):
+        for task in chunk:
+            queue.insert(task)
+        for _ in chunk:
+            queue.extract_max()
+
+    threads = [threading.Thread(target=work, args=(chunk,)) for chunk in chunks]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return 2 * len(tasks) / (time.perf_counter() - start_time)
+
+
+def mean_rank_error(queue, tasks: list[Task]) -> float:
+    """Average number of queued tasks that outranked each extracted task."""
+    queue.insert_many(tasks)
+    queued = sorted(task.priority for task in tasks)
+    total = 0
+    for _ in tasks:
+        priority = queue.extract_max().priority
+        total += rank_error(queued, priority)
+        del queued[bisect_left(queued, priority)]
+    return total / len(tasks)
+
+
+def process_throughput(tasks: list[Task], num_workers: int, stealing: bool) -> float:
+    """Tasks handled per second by run_sharded with the CPU-bound handler."""
+    start_time = time.perf_counter()
+    run_sharded(tasks, burn, num_workers=num_workers, work_stealing=stealing)
+    return len(tasks) / (time.perf_counter() - start_time)
+
+
+def main():
+    """
+    Measure ShardedPriorityQueue against a single locked PriorityQueue:
+    thread throughput and ordering error as the shard count grows, then
+    run_sharded throughput as the number of worker processes grows.
+    """
+    num_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tasks = make_tasks(num_tasks)
+    print(f"{num_tasks} tasks, {os.cpu_count()} CPU(s)\n")
+
+    print(f"{'Queue':<28} {'Threads':<8} {'Ops/s':<12} {'Mean rank error':<16}")
+    print("=" * 66)
+    for num_threads in [1, 4]:
+        configs = [("single lock", None, None)] + [
+            (f"{selection} K={k}", k, selection)
+            for selection in ["two_choice", "top_of_shards"]
+            for k in [2, 4, 8, 16]
+        ]
+        for name, num_shards, selection in configs:
+            queue = make_queue(num_shards, selection)
+            ops = thread_throughput(queue, tasks, num_threads)
+            error = mean_rank_error(make_queue(num_shards, selection), tasks[:10_000])
+            print(f"{name:<28} {num_threads:<8} {ops:<12,.0f} {error:<16.2f}")
+
+    work = tasks[: num_tasks // 10]
+    print(f"\nrun_sharded, {len(work)} CPU-bound tasks")
+    print(f"{'Workers':<8} {'Stealing':<9} {'Tasks/s':<12} {'Speedup':<8}")
+    print("=" * 40)
+    baseline = None
+    for num_workers in [1, 2, 4, 8]:
+        for stealing in [False, True]:
+            rate = process_throughput(work, num_workers, stealing)
+            baseline = baseline or rate
+            print(
+                f"{num_workers:<8} {str(stealing):<9} {rate:<12,.0f} "
+                f"{rate / baseline:<8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
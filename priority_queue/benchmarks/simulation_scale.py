@@ -0,0 +1,60 @@
+# simulation_scale.py
+
+import resource
+import sys
+import time
+from src.scheduler_simulation import SchedulerSimulation, exponential_service
+
+
+def run_simulation(num_tasks: int, num_workers: int, utilization: float) -> dict:
+    """
+    Simulate num_tasks tasks with exponential service times (mean 1) on
+    num_workers workers. Arrivals are spread so the offered load is the given
+    utilization.
+    """
+    horizon = num_tasks / (num_workers * utilization)
+    sim = SchedulerSimulation(
+        num_workers=num_workers,
+        service_time=exponential_service(1.0),
+        drop_expired=True,
+        record_completed=False,
+        seed=1,
+    )
+    start_time = time.perf_counter()
+    sim.generate_tasks(num_tasks, horizon=horizon)
+    generated_time = time.perf_counter()
+    sim.run()
+    end_time = time.perf_counter()
+    stats = sim.summary()
+    stats["generate_s"] = generated_time - start_time
+    stats["run_s"] = end_time - generated_time
+    return stats
+
+
+def main():
+    """
+    Time the discrete-event scheduler as the task count grows.
+    Pass sizes on the command line to override the defaults, e.g.
+    `python -m benchmarks.simulation_scale 10000000`.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    num_workers = 8
+
+    print(
+        f"{'Tasks':<10} {'Generate (s)':<14} {'Run (s)':<10} {'Tasks/s':<12} "
+        f"{'Util':<7} {'Expired':<9} {'Missed':<8} {'Peak RSS (MB)':<14}"
+    )
+    print("=" * 90)
+    for size in sizes:
+        stats = run_simulation(size, num_workers, utilization=0.95)
+        peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(
+            f"{size:<10} {stats['generate_s']:<14.2f} {stats['run_s']:<10.2f} "
+            f"{size / stats['run_s']:<12,.0f} {stats['utilization']:<7.2f} "
+            f"{stats['expired']:<9} {stats['missed_deadlines']:<8} "
+            f"{peak_rss_mb:<14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
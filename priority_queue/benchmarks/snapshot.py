@@ -0,0 +1,105 @@
+# snapshot.py
+
+import gc
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+from src.priority_queue import PriorityQueue, Task
+
+# pickle keeps a memo entry for every object it writes, which for a queue of
+# 10^7 tasks needs more memory than the queue itself; larger queues are only
+# snapshotted. Raise this on machines with more than ~8 GB of RAM.
+PICKLE_LIMIT = 5_000_000
+
+
+def make_queue(size: int) -> PriorityQueue:
+    rng = random.Random(size)
+    return PriorityQueue.from_tasks(
+        Task(
+            priority=rng.randint(1, 1_000_000),
+            task_id=i,
+            arrival_time=i * 0.001,
+            deadline=i * 0.001 + rng.uniform(5, 15),
+        )
+        for i in range(size)
+    )
+
+
+def timed(function, *args):
+    """Return (result, seconds) for one call."""
+    start_time = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start_time
+
+
+def pickle_dump(pq: PriorityQueue, path: str):
+    with open(path, "wb") as output:
+        pickle.dump(pq, output, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def pickle_load(path: str) -> PriorityQueue:
+    with open(path, "rb") as source:
+        return pickle.load(source)
+
+
+def measure(size: int, directory: str, with_pickle: bool) -> dict:
+    """
+    Save and load a queue of `size` tasks with snapshot/restore and, if
+    with_pickle, with pickle. Only one queue is alive at a time.
+    """
+    snapshot_path = os.path.join(directory, "queue.snapshot")
+    pickle_path = os.path.join(directory, "queue.pickle")
+    pq = make_queue(size)
+    results = {}
+    _, results["snapshot"] = timed(pq.snapshot, snapshot_path)
+    if with_pickle:
+        _, results["dump"] = timed(pickle_dump, pq, pickle_path)
+    del pq
+    gc.collect()
+
+    restored, results["restore"] = timed(PriorityQueue.restore, snapshot_path)
+    del restored
+    gc.collect()
+    results["snapshot_mb"] = os.path.getsize(snapshot_path) / 2**20
+    os.remove(snapshot_path)
+    if with_pickle:
+        loaded, results["load"] = timed(pickle_load, pickle_path)
+        del loaded
+        gc.collect()
+        results["pickle_mb"] = os.path.getsize(pickle_path) / 2**20
+        os.remove(pickle_path)
+    return results
+
+
+def main():
+    """
+    Compare PriorityQueue.snapshot/restore with pickling the queue: save and
+    load times and file sizes (pass sizes as arguments; default 10^6, 10^7).
+    Pickle is skipped above PICKLE_LIMIT tasks.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+    print(
+        f"{'Size':<10} {'Format':<9} {'Save (s)':<10} {'Load (s)':<10} "
+        f"{'File (MB)':<10} {'Load speedup':<12}"
+    )
+    print("=" * 66)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            r = measure(size, directory, with_pickle=size <= PICKLE_LIMIT)
+            speedup = f"{r['load'] / r['restore']:.1f}" if "load" in r else "-"
+            print(
+                f"{size:<10} {'snapshot':<9} {r['snapshot']:<10.2f} "
+                f"{r['restore']:<10.2f} {r['snapshot_mb']:<10.1f} {speedup:<12}"
+            )
+            if "load" in r:
+                print(
+                    f"{size:<10} {'pickle':<9} {r['dump']:<10.2f} "
+                    f"{r['load']:<10.2f} {r['pickle_mb']:<10.1f} {'1.0':<12}"
+                )
+
+
+if __name__ == "__main__":
+    main()
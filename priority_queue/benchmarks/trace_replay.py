@@ -0,0 +1,74 @@
+# trace_replay.py
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from src.scheduler_simulation import SchedulerSimulation, exponential_service
+from src.task_sources import jsonl_tasks, random_tasks, write_jsonl_trace
+
+NUM_WORKERS = 8
+UTILIZATION = 0.95
+
+
+def replay(source_factory, trace_memory: bool) -> float:
+    """
+    Run one simulation over the tasks from source_factory(). Returns the wall
+    time in seconds, or with trace_memory the peak traced memory in MB
+    (tracemalloc slows the run down too much to time it in the same pass).
+    """
+    sim = SchedulerSimulation(
+        num_workers=NUM_WORKERS, drop_expired=True, record_completed=False, seed=1
+    )
+    if not trace_memory:
+        start_time = time.perf_counter()
+        sim.run(source_factory())
+        return time.perf_counter() - start_time
+
+    tracemalloc.start()
+    sim.run(source_factory())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    """
+    Replay a JSONL trace through the scheduler, streamed from disk, against
+    loading the same trace into a list first. Pass sizes on the command line
+    to override the defaults, e.g. `python -m benchmarks.trace_replay 10000000`.
+    """
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+
+    print(
+        f"{'Tasks':<10} {'Trace (MB)':<11} {'Mode':<10} {'Time (s)':<10} "
+        f"{'Peak mem (MB)':<14}"
+    )
+    print("=" * 58)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f"trace_{size}.jsonl")
+            horizon = size / (NUM_WORKERS * UTILIZATION)
+            write_jsonl_trace(
+                random_tasks(
+                    size, horizon, seed=0, service_time=exponential_service(1.0)
+                ),
+                path,
+            )
+            trace_mb = os.path.getsize(path) / 2**20
+            for mode, factory in [
+                ("streamed", lambda: jsonl_tasks(path)),
+                ("in-memory", lambda: list(jsonl_tasks(path))),
+            ]:
+                elapsed = replay(factory, trace_memory=False)
+                peak_mb = replay(factory, trace_memory=True)
+                print(
+                    f"{size:<10} {trace_mb:<11.1f} {mode:<10} {elapsed:<10.2f} "
+                    f"{peak_mb:<14.2f}"
+                )
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+# compact_priority_queue.py
+
+import heapq
+import math
+from array import array
+from typing import Iterable, Optional
+from .priority_queue import Task
+
+
+class CompactPriorityQueue:
+    """
+    Max-heap priority queue with the same interface as PriorityQueue, stored
+    as parallel typed arrays instead of a list of Task objects.
+
+    Priorities and task ids are kept in signed 64-bit arrays, arrival times,
+    deadlines and service times in double arrays (NaN standing in for None),
+    all in heap order. Task objects are only created when a task leaves the
+    queue or is looked up, so a queued task costs a few machine words plus
+    its entry in the task_id -> heap index map.
+
+    Tasks returned by get and peek_top are copies: changing them does not
+    change the queue. Use increase_key, decrease_key or update_priority.
+
+    Cancellation works as in PriorityQueue: cancel marks a tombstone and the
+    arrays are compacted once more than `max_dead_fraction` of them is dead.
+
+    Unlike PriorityQueue there is no ordering policy: entries are always
+    served by priority, which keeps the sift loops on one int64 column.
+    """
+
+    # Same rebuild threshold as PriorityQueue.insert_many.
+    REBUILD_RATIO = 1.0
+
+    def __init__(self, arity: int = 2, max_dead_fraction: float = 0.5):
+        if arity < 2:
+            raise ValueError("Heap arity must be at least 2")
+        if not 0 < max_dead_fraction <= 1:
+            raise ValueError("max_dead_fraction must be in (0, 1]")
+        self.arity = arity
+        self.max_dead_fraction = max_dead_fraction
+        self.priorities = array("q")
+        self.task_ids = array("q")
+        self.arrival_times = array("d")
+        self.deadlines = array("d")
+        self.service_times = array("d")
+        self.task_index_map: dict[int, int] = {}
+        self.cancelled: set[int] = set()
+        self.compactions = 0
+
+    @classmethod
+    def from_tasks(
+        cls, tasks: Iterable[Task], arity: int = 2, max_dead_fraction: float = 0.5
+    ) -> "CompactPriorityQueue":
+        """
+        Build a compact priority queue from an iterable of tasks.
+        Time complexity: O(n) (bottom-up heap construction)
+        """
+        pq = cls(arity, max_dead_fraction)
+        for task in tasks:
+            pq._append(task)
+        pq._build_heap()
+        return pq
+
+    def __len__(self) -> int:
+        return len(self.priorities) - len(self.cancelled)
+
+    def __contains__(self, task_id: int) -> bool:
+        return self._find_task_index(task_id) is not None
+
+    @property
+    def live_count(self) -> int:
+        """Number of queued tasks that have not been cancelled."""
+        return len(self.priorities) - len(self.cancelled)
+
+    @property
+    def dead_count(self) -> int:
+        """Number of cancelled tasks still held in the arrays."""
+        return len(self.cancelled)
+
+    def is_empty(self) -> bool:
+        """Return True if the queue is empty."""
+        return len(self.priorities) == len(self.cancelled)
+
+    def clear(self):
+        """Remove every task from the queue."""
+        compactions = self.compactions
+        self.__init__(self.arity, self.max_dead_fraction)
+        self.compactions = compactions
+
+    def contains(self, task_id: int) -> bool:
+        """
+        Return True if a task with task_id is queued.
+        Time complexity: O(1)
+        """
+        return self._find_task_index(task_id) is not None
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """
+        Return a copy of the queued task with task_id, or None.
+        Time complexity: O(1)
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            return None
+        return self._task_at(index)
+
+    def insert(self, task: Task):
+        """
+        Insert a new task into the priority queue.
+        Time complexity: O(log n)
+        """
+        if task.task_id in self.task_index_map:
+            if task.task_id not in self.cancelled:
+                raise ValueError(f"Task with id {task.task_id} already in queue")
+            self._discard_dead(task.task_id)
+        self._append(task)
+        self._heapify_up(len(self.priorities) - 1)
+
+    def insert_many(self, tasks: Iterable[Task]):
+        """
+        Insert a batch of tasks into the priority queue.
+        Time complexity: O(k log n) for a small batch of k tasks, O(n + k) when
+        the batch is large enough that rebuilding the heap is cheaper.
+        """
+        tasks = list(tasks)
+        task_ids = {task.task_id for task in tasks}
+        index_map = self.task_index_map
+        cancelled = self.cancelled
+        if len(task_ids) != len(tasks) or any(
+            task_id in index_map and task_id not in cancelled for task_id in task_ids
+        ):
+            raise ValueError("Task ids must be unique")
+
+        if len(tasks) < self.REBUILD_RATIO * len(self.priorities):
+            for task in tasks:
+                self.insert(task)
+        else:
+            # The heap is rebuilt anyway, so drop dead tasks on the way.
+            if cancelled:
+                self._drop_cancelled()
+                self.compactions += 1
+            for task in tasks:
+                self._append(task)
+            self._build_heap()
+
+    def extract_max(self) -> Optional[Task]:
+        """
+        Remove and return the task with the highest priority.
+        Time complexity: O(log n)
+        """
+        if self.cancelled:
+            self._drop_dead_root()
+        if not self.priorities:
+            return None
+        return self._remove_at(0)
+
+    def extract_many(self, k: int) -> list[Task]:
+        """
+        Remove and return up to k tasks in priority order (highest first).
+        Time complexity: O(k log n)
+        """
+        extract_max = self.extract_max
+        return [extract_max() for _ in range(min(k, len(self)))]
+
+    def peek_top(self, k: int) -> list[Task]:
+        """
+        Return copies of up to k tasks in priority order (highest first)
+        without removing them.
+        Time complexity: O(k log k)
+        """
+        priorities = self.priorities
+        task_ids = self.task_ids
+        size = len(priorities)
+        arity = self.arity
+        cancelled = self.cancelled
+        top: list[Task] = []
+        if k <= 0 or size == 0:
+            return top
+
+        # Frontier of candidate heap indices, ordered by priority. Dead tasks
+        # are skipped, but their children are still candidates.
+        frontier = [(-priorities[0], 0)]
+        while frontier and len(top) < k:
+            _, index = heapq.heappop(frontier)
+            if task_ids[index] not in cancelled:
+                top.append(self._task_at(index))
+            first = arity * index + 1
+            for child in range(first, min(first + arity, size)):
+                heapq.heappush(frontier, (-priorities[child], child))
+        return top
+
+    def remove(self, task_id: int) -> Task:
+        """
+        Remove and return the task with task_id.
+        Time complexity: O(log n)
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        return self._remove_at(index)
+
+    def cancel(self, task_id: int) -> Task:
+        """
+        Cancel the task with task_id and return a copy of it. The task is only
+        marked dead; it is dropped when it reaches the root or at the next
+        compaction.
+        Time complexity: O(1) amortized
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        task = self._task_at(index)
+        self.cancelled.add(task_id)
+        if len(self.cancelled) > self.max_dead_fraction * len(self.priorities):
+            self.compact()
+        return task
+
+    def compact(self):
+        """
+        Drop every cancelled task and rebuild the heap.
+        Time complexity: O(n)
+        """
+        if not self.cancelled:
+            return
+        self._drop_cancelled()
+        self._build_heap()
+        self.compactions += 1
+
+    def increase_key(self, task_id: int, new_priority: int):
+        """
+        Increase the priority of a task by task_id.
+        Time complexity: O(1) for lookup + O(log n) for heapify.
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        if new_priority < self.priorities[index]:
+            raise ValueError("New priority must be higher than current priority")
+
+        self.priorities[index] = new_priority
+        self._heapify_up(index)
+
+    def decrease_key(self, task_id: int, new_priority: int):
+        """
+        Decrease the priority of a task by task_id.
+        Time complexity: O(1) for lookup + O(log n) for heapify.
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        if new_priority > self.priorities[index]:
+            raise ValueError("New priority must be lower than current priority")
+
+        self.priorities[index] = new_priority
+        self._heapify_down(index)
+
+    def update_priority(self, task_id: int, new_priority: int):
+        """
+        Set the priority of a task by task_id, moving it up or down as needed.
+        Time complexity: O(log n)
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+
+        old_priority = self.priorities[index]
+        self.priorities[index] = new_priority
+        if new_priority > old_priority:
+            self._heapify_up(index)
+        elif new_priority < old_priority:
+            self._heapify_down(index)
+
+    def _find_task_index(self, task_id: int) -> Optional[int]:
+        """Helper method to find the index of a live task by task_id. O(1)"""
+        if self.cancelled and task_id in self.cancelled:
+            return None
+        return self.task_index_map.get(task_id)
+
+    def _drop_cancelled(self):
+        """Filter cancelled tasks out of every column, leaving heap order unset."""
+        cancelled = self.cancelled
+        keep = [
+            i for i, task_id in enumerate(self.task_ids) if task_id not in cancelled
+        ]
+        self.priorities = array("q", [self.priorities[i] for i in keep])
+        self.task_ids = array("q", [self.task_ids[i] for i in keep])
+        self.arrival_times = array("d", [self.arrival_times[i] for i in keep])
+        self.deadlines = array("d", [self.deadlines[i] for i in keep])
+        self.service_times = array("d", [self.service_times[i] for i in keep])
+        cancelled.clear()
+
+    def _drop_dead_root(self):
+        """Discard cancelled tasks from the root until a live task is on top."""
+        task_ids = self.task_ids
+        cancelled = self.cancelled
+        while task_ids and task_ids[0] in cancelled:
+            cancelled.discard(task_ids[0])
+            self._remove_at(0)
+
+    def _discard_dead(self, task_id: int):
+        """Physically remove a cancelled task so its id can be reused."""
+        self.cancelled.discard(task_id)
+        self._remove_at(self.task_index_map[task_id])
+
+    def _append(self, task: Task):
+        """Append a task's fields to the arrays without touching the index map."""
+        self.priorities.append(task.priority)
+        self.task_ids.append(task.task_id)
+        self.arrival_times.append(
+            math.nan if task.arrival_time is None else task.arrival_time
+        )
+        self.deadlines.append(math.nan if task.deadline is None else task.deadline)
+        self.service_times.append(
+            math.nan if task.service_time is None else task.service_time
+        )
+
+    def _task_at(self, index: int) -> Task:
+        """Materialize the task stored at index as a Task object."""
+        arrival_time = self.arrival_times[index]
+        deadline = self.deadlines[index]
+        service_time = self.service_times[index]
+        return Task(
+            priority=self.priorities[index],
+            task_id=self.task_ids[index],
+            arrival_time=None if math.isnan(arrival_time) else arrival_time,
+            deadline=None if math.isnan(deadline) else deadline,
+            service_time=None if math.isnan(service_time) else service_time,
+        )
+
+    def _move(self, source: int, target: int):
+        """Copy the entry at source into slot target and update the index map."""
+        self.priorities[target] = self.priorities[source]
+        task_id = self.task_ids[source]
+        self.task_ids[target] = task_id
+        self.arrival_times[target] = self.arrival_times[source]
+        self.deadlines[target] = self.deadlines[source]
+        self.service_times[target] = self.service_times[source]
+        self.task_index_map[task_id] = target
+
+    def _build_heap(self):
+        """Heapify the arrays bottom-up in O(n), then rebuild the index map."""
+        priorities = self.priorities
+        task_ids = self.task_ids
+        arrival_times = self.arrival_times
+        deadlines = self.deadlines
+        service_times = self.service_times
+        size = len(priorities)
+        arity = self.arity
+        for start in range((size - 2) // arity, -1, -1):
+            index = start
+            priority = priorities[index]
+            task_id = task_ids[index]
+            arrival_time = arrival_times[index]
+            deadline = deadlines[index]
+            service_time = service_times[index]
+            while True:
+                first = arity * index + 1
+                if first >= size:
+                    break
+                largest = first
+                largest_priority = priorities[first]
+                for child_index in range(first + 1, min(first + arity, size)):
+                    child_priority = priorities[child_index]
+                    if child_priority > largest_priority:
+                        largest = child_index
+                        largest_priority = child_priority
+                if largest_priority <= priority:
+                    break
+                priorities[index] = largest_priority
+                task_ids[index] = task_ids[largest]
+                arrival_times[index] = arrival_times[largest]
+                deadlines[index] = deadlines[largest]
+                service_times[index] = service_times[largest]
+                index = largest
+            priorities[index] = priority
+            task_ids[index] = task_id
+            arrival_times[index] = arrival_time
+            deadlines[index] = deadline
+            service_times[index] = service_time
+
+        self.task_index_map = {task_id: i for i, task_id in enumerate(task_ids)}
+        if len(self.task_index_map) != size:
+            raise ValueError("Task ids must be unique")
+
+    def _remove_at(self, index: int) -> Task:
+        """Remove the task at index, fill the gap with the last entry and re-sift."""
+        removed = self._task_at(index)
+        del self.task_index_map[removed.task_id]
+
+        last = len(self.priorities) - 1
+        if index < last:
+            self._move(last, index)
+        for column in (
+            self.priorities,
+            self.task_ids,
+            self.arrival_times,
+            self.deadlines,
+            self.service_times,
+        ):
+            column.pop()
+
+        if index < last:
+            parent_index = (index - 1) // self.arity
+            if index > 0 and self.priorities[index] > self.priorities[parent_index]:
+                self._heapify_up(index)
+            else:
+                self._heapify_down(index)
+        return removed
+
+    def _heapify_up(self, index: int):
+        """
+        Restore heap property by moving the entry at index up.
+
+        Parent entries are shifted down into the hole column by column, and
+        every moved task has its index map entry updated.
+        """
+        priorities = self.priorities
+        task_ids = self.task_ids
+        index_map = self.task_index_map
+        arity = self.arity
+        priority = priorities[index]
+        task_id = task_ids[index]
+
+        # Most random inserts stay where they are; skip loading the other
+        # columns unless the entry actually moves.
+        if index == 0 or priority <= priorities[(index - 1) // arity]:
+            index_map[task_id] = index
+            return
+
+        arrival_times = self.arrival_times
+        deadlines = self.deadlines
+        service_times = self.service_times
+        arrival_time = arrival_times[index]
+        deadline = deadlines[index]
+        service_time = service_times[index]
+        while index > 0:
+            parent_index = (index - 1) // arity
+            parent_priority = priorities[parent_index]
+            if priority <= parent_priority:
+                break
+            priorities[index] = parent_priority
+            parent_id = task_ids[parent_index]
+            task_ids[index] = parent_id
+            arrival_times[index] = arrival_times[parent_index]
+            deadlines[index] = deadlines[parent_index]
+            service_times[index] = service_times[parent_index]
+            index_map[parent_id] = index
+            index = parent_index
+
+        priorities[index] = priority
+        task_ids[index] = task_id
+        arrival_times[index] = arrival_time
+        deadlines[index] = deadline
+        service_times[index] = service_time
+        index_map[task_id] = index
+
+    def _heapify_down(self, index: int):
+        """
+        Restore heap property by moving the entry at index down.
+
+        The largest child is shifted up into the hole at each level, and every
+        moved task has its index map entry updated.
+        """
+        priorities = self.priorities
+        task_ids = self.task_ids
+        arrival_times = self.arrival_times
+        deadlines = self.deadlines
+        service_times = self.service_times
+        index_map = self.task_index_map
+        arity = self.arity
+        size = len(priorities)
+        priority = priorities[index]
+        task_id = task_ids[index]
+        arrival_time = arrival_times[index]
+        deadline = deadlines[index]
+        service_time = service_times[index]
+
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            largest = first
+            largest_priority = priorities[first]
+            for child_index in range(first + 1, min(first + arity, size)):
+                child_priority = priorities[child_index]
+                if child_priority > largest_priority:
+                    largest = child_index
+                    largest_priority = child_priority
+            if largest_priority <= priority:
+                break
+
+            priorities[index] = largest_priority
+            child_id = task_ids[largest]
+            task_ids[index] = child_id
+            arrival_times[index] = arrival_times[largest]
+            deadlines[index] = deadlines[largest]
+            service_times[index] = service_times[largest]
+            index_map[child_id] = index
+            index = largest
+
+        priorities[index] = priority
+        task_ids[index] = task_id
+        arrival_times[index] = arrival_time
+        deadlines[index] = deadline
+        service_times[index] = service_time
+        index_map[task_id] = index
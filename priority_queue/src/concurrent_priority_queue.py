@@ -0,0 +1,232 @@
+# concurrent_priority_queue.py
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Iterable, Optional, Union
+from .compact_priority_queue import CompactPriorityQueue
+from .priority_queue import PriorityQueue, Task
+
+HeapQueue = Union[PriorityQueue, CompactPriorityQueue]
+
+
+class ThreadSafePriorityQueue:
+    """
+    Thread-safe front end for a PriorityQueue.
+
+    Every operation runs under one lock, and consumers block in get on a
+    condition variable until a producer puts a task, instead of polling
+    is_empty. The wrapped queue can be a PriorityQueue (the default) or a
+    CompactPriorityQueue.
+    """
+
+    def __init__(self, queue: Optional[HeapQueue] = None):
+        self.queue = queue if queue is not None else PriorityQueue()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.closed = False
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.queue)
+
+    def is_empty(self) -> bool:
+        """Return True if the queue is empty."""
+        with self.lock:
+            return self.queue.is_empty()
+
+    def put(self, task: Task):
+        """Insert a task and wake one waiting consumer."""
+        with self.not_empty:
+            if self.closed:
+                raise ValueError("Queue is closed")
+            self.queue.insert(task)
+            self.not_empty.notify()
+
+    def put_many(self, tasks: Iterable[Task]):
+        """Insert a batch of tasks and wake up to one consumer per task."""
+        tasks = list(tasks)
+        with self.not_empty:
+            if self.closed:
+                raise ValueError("Queue is closed")
+            self.queue.insert_many(tasks)
+            self.not_empty.notify(len(tasks))
+
+    def get(
+        self, block: bool = True, timeout: Optional[float] = None
+    ) -> Optional[Task]:
+        """
+        Remove and return the task with the highest priority.
+
+        If the queue is empty and block is True, wait until a task is put, the
+        timeout (in seconds) expires, or the queue is closed. Returns None if
+        no task could be taken.
+        """
+        with self.not_empty:
+            if block and timeout is None:
+                while self.queue.is_empty() and not self.closed:
+                    self.not_empty.wait()
+            elif block:
+                end_time = time.monotonic() + timeout
+                while self.queue.is_empty() and not self.closed:
+                    remaining = end_time - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.not_empty.wait(remaining)
+            return self.queue.extract_max()
+
+    def get_many(self, k: int) -> list[Task]:
+        """Remove and return up to k tasks without waiting."""
+        with self.lock:
+            return self.queue.extract_many(k)
+
+    def close(self):
+        """
+        Stop accepting tasks and wake every waiting consumer. Tasks already
+        queued can still be taken; once the queue is empty get returns None.
+        """
+        with self.not_empty:
+            self.closed = True
+            self.not_empty.notify_all()
+
+    def contains(self, task_id: int) -> bool:
+        """Return True if a task with task_id is queued."""
+        with self.lock:
+            return self.queue.contains(task_id)
+
+    def remove(self, task_id: int) -> Task:
+        """Remove and return the task with task_id."""
+        with self.lock:
+            return self.queue.remove(task_id)
+
+    def cancel(self, task_id: int) -> Task:
+        """Cancel the task with task_id (marks a tombstone, see PriorityQueue)."""
+        with self.lock:
+            return self.queue.cancel(task_id)
+
+    def increase_key(self, task_id: int, new_priority: int):
+        """Increase the priority of a task by task_id."""
+        with self.lock:
+            self.queue.increase_key(task_id, new_priority)
+
+    def decrease_key(self, task_id: int, new_priority: int):
+        """Decrease the priority of a task by task_id."""
+        with self.lock:
+            self.queue.decrease_key(task_id, new_priority)
+
+    def update_priority(self, task_id: int, new_priority: int):
+        """Set the priority of a task by task_id."""
+        with self.lock:
+            self.queue.update_priority(task_id, new_priority)
+
+
+class AsyncPriorityQueue:
+    """
+    asyncio front end for a PriorityQueue.
+
+    Meant to be used from a single event loop, so no lock is needed: waiting
+    consumers park on futures that put_nowait resolves, the same way
+    asyncio.Queue hands items to its getters.
+    """
+
+    def __init__(self, queue: Optional[HeapQueue] = None):
+        self.queue = queue if queue is not None else PriorityQueue()
+        self.getters: deque[asyncio.Future] = deque()
+        self.closed = False
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def is_empty(self) -> bool:
+        """Return True if the queue is empty."""
+        return self.queue.is_empty()
+
+    def put_nowait(self, task: Task):
+        """Insert a task and wake one waiting consumer."""
+        if self.closed:
+            raise ValueError("Queue is closed")
+        self.queue.insert(task)
+        self._wake_getters(1)
+
+    def put_many(self, tasks: Iterable[Task]):
+        """Insert a batch of tasks and wake up to one consumer per task."""
+        if self.closed:
+            raise ValueError("Queue is closed")
+        tasks = list(tasks)
+        self.queue.insert_many(tasks)
+        self._wake_getters(len(tasks))
+
+    async def put(self, task: Task):
+        """
+        Insert a task. The queue is unbounded, so this never waits; it is a
+        coroutine for symmetry with get and asyncio.Queue.
+        """
+        self.put_nowait(task)
+
+    def get_nowait(self) -> Optional[Task]:
+        """Remove and return the highest priority task, or None if empty."""
+        return self.queue.extract_max()
+
+    async def get(self) -> Optional[Task]:
+        """
+        Remove and return the task with the highest priority, waiting until
+        one is put. Returns None once the queue is closed and empty. Wrap in
+        asyncio.wait_for to add a timeout.
+        """
+        while self.queue.is_empty() and not self.closed:
+            getter = asyncio.get_running_loop().create_future()
+            self.getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self.getters.remove(getter)
+                except ValueError:
+                    pass
+                # The wakeup meant for this getter must not be lost.
+                if not self.queue.is_empty():
+                    self._wake_getters(1)
+                raise
+        return self.queue.extract_max()
+
+    def close(self):
+        """
+        Stop accepting tasks and wake every waiting consumer. Tasks already
+        queued can still be taken; once the queue is empty get returns None.
+        """
+        self.closed = True
+        self._wake_getters(len(self.getters))
+
+    def contains(self, task_id: int) -> bool:
+        """Return True if a task with task_id is queued."""
+        return self.queue.contains(task_id)
+
+    def remove(self, task_id: int) -> Task:
+        """Remove and return the task with task_id."""
+        return self.queue.remove(task_id)
+
+    def cancel(self, task_id: int) -> Task:
+        """Cancel the task with task_id (marks a tombstone, see PriorityQueue)."""
+        return self.queue.cancel(task_id)
+
+    def increase_key(self, task_id: int, new_priority: int):
+        """Increase the priority of a task by task_id."""
+        self.queue.increase_key(task_id, new_priority)
+
+    def decrease_key(self, task_id: int, new_priority: int):
+        """Decrease the priority of a task by task_id."""
+        self.queue.decrease_key(task_id, new_priority)
+
+    def update_priority(self, task_id: int, new_priority: int):
+        """Set the priority of a task by task_id."""
+        self.queue.update_priority(task_id, new_priority)
+
+    def _wake_getters(self, count: int):
+        """Resolve up to count waiting getters, skipping cancelled ones."""
+        while count > 0 and self.getters:
+            getter = self.getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                count -= 1
@@ -0,0 +1,140 @@
+# instrumented.py
+
+from dataclasses import dataclass, fields, replace
+from typing import Iterable, Optional, Union
+from .policies import Policy
+from .priority_queue import PriorityQueue
+
+
+@dataclass(slots=True)
+class SiftCounts:
+    """
+    The work done by a CountingPriorityQueue.
+
+    - sifts: calls of the sift-up and sift-down paths, plus one per node a
+      heap build sifts down.
+    - comparisons: key comparisons, in the sift loops and wherever else the
+      queue compares keys (reprioritizing, removal, peek_top).
+    - moves: task writes into the heap array.
+    """
+
+    sifts: int = 0
+    comparisons: int = 0
+    moves: int = 0
+
+
+class CountingPriorityQueue(PriorityQueue):
+    """
+    A PriorityQueue that counts the work of its sift paths in `counts`.
+
+    PriorityQueue itself carries no counting code, so it runs at full speed;
+    a queue is instrumented by constructing this subclass instead. It wraps
+    every key the policy returns in an object whose comparison methods
+    count, keeps the heap in a list subclass that counts writes, and counts
+    sifts. Everything else behaves exactly as in PriorityQueue, only slower.
+    """
+
+    def __init__(
+        self,
+        arity: int = 2,
+        max_dead_fraction: float = 0.5,
+        policy: Optional[Union[str, Policy]] = None,
+    ):
+        self.counts = SiftCounts()
+        super().__init__(arity, max_dead_fraction, policy)
+        self.base_policy = self.policy
+        counts = self.counts
+        base_policy = self.base_policy
+
+        def counting_policy(task):
+            return _CountedKey(base_policy(task), counts)
+
+        self.policy = counting_policy
+
+    @property
+    def heap(self) -> list:
+        """The heap array; whatever is assigned is copied into a counting list."""
+        return self._heap
+
+    @heap.setter
+    def heap(self, tasks: Iterable):
+        self._heap = _CountedHeap(tasks, self.counts)
+
+    def snapshot(self, path: str) -> int:
+        """PriorityQueue.snapshot, recording the policy this queue wraps."""
+        counting_policy = self.policy
+        self.policy = self.base_policy
+        try:
+            return super().snapshot(path)
+        finally:
+            self.policy = counting_policy
+
+    def reset_counts(self) -> SiftCounts:
+        """Return the counts so far and start counting from zero."""
+        counts = replace(self.counts)
+        for field in fields(SiftCounts):
+            setattr(self.counts, field.name, 0)
+        return counts
+
+    def _build_heap(self):
+        self.counts.sifts += (len(self.heap) - 2) // self.arity + 1
+        super()._build_heap()
+
+    def _heapify_up(self, index: int):
+        self.counts.sifts += 1
+        super()._heapify_up(index)
+
+    def _heapify_down(self, index: int):
+        self.counts.sifts += 1
+        super()._heapify_down(index)
+
+
+class _CountedKey:
+    """A policy key whose comparisons are counted."""
+
+    __slots__ = ("value", "counts")
+
+    def __init__(self, value, counts: SiftCounts):
+        self.value = value
+        self.counts = counts
+
+    def __lt__(self, other: "_CountedKey") -> bool:
+        self.counts.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "_CountedKey") -> bool:
+        self.counts.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "_CountedKey") -> bool:
+        self.counts.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "_CountedKey") -> bool:
+        self.counts.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: "_CountedKey") -> bool:
+        self.counts.comparisons += 1
+        return self.value == other.value
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class _CountedHeap(list):
+    """A heap array whose task writes are counted."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self, tasks: Iterable, counts: SiftCounts):
+        super().__init__(tasks)
+        self.counts = counts
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counts.moves += len(value)
+        else:
+            self.counts.moves += 1
+        list.__setitem__(self, index, value)
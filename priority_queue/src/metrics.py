@@ -0,0 +1,340 @@
+# metrics.py
+
+import csv
+import json
+import math
+from dataclasses import dataclass, field
+from math import ceil, log
+from .priority_queue import Task
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class StreamingHistogram:
+    """
+    Histogram of non-negative values in bounded memory, with quantiles.
+
+    Values are counted in logarithmic buckets: bucket k holds values in
+    (gamma^(k-1), gamma^k] with gamma = (1 + e) / (1 - e), so any quantile is
+    answered within a relative error of e (1% by default) and the number of
+    buckets grows only with the logarithm of max / min, never with the number
+    of values. Values at or below `min_value` (including zero and negative
+    values) share one bucket and are reported as 0.
+
+    Count, sum, min and max are tracked exactly.
+    """
+
+    def __init__(self, relative_error: float = 0.01, min_value: float = 1e-9):
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be in (0, 1)")
+        self.relative_error = relative_error
+        self.min_value = min_value
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self._inverse_log_gamma = 1 / math.log(self.gamma)
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float):
+        """
+        Record one value.
+        Time complexity: O(1)
+        """
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value > self.min_value:
+            key = ceil(log(value) * self._inverse_log_gamma)
+            buckets = self.buckets
+            buckets[key] = buckets.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+
+    def merge(self, other: "StreamingHistogram"):
+        """Add the counts of another histogram with the same relative_error."""
+        if other.gamma != self.gamma:
+            raise ValueError("Histograms must have the same relative_error")
+        buckets = self.buckets
+        for key, bucket_count in other.buckets.items():
+            buckets[key] = buckets.get(key, 0) + bucket_count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Return the q-quantile (0 <= q <= 1) within the relative error.
+        Time complexity: O(b log b) for b buckets
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+        if not self.count:
+            return 0.0
+        # Nearest-rank definition: the smallest value with at least q of the
+        # values at or below it.
+        rank = max(0, math.ceil(q * self.count) - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # The midpoint of the bucket in relative terms.
+                value = 2 * self.gamma**key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Count, mean, min, max and the standard quantiles as a dict."""
+        summary = {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+        }
+        for q in QUANTILES:
+            summary[_quantile_name(q)] = self.quantile(q)
+        return summary
+
+
+def _quantile_name(q: float) -> str:
+    """0.5 -> 'p50', 0.999 -> 'p99.9'."""
+    return f"p{q * 100:g}"
+
+
+@dataclass(slots=True)
+class PriorityMetrics:
+    """Counters and wait-time histogram for the tasks of one priority."""
+
+    dispatched: int = 0
+    completed: int = 0
+    missed: int = 0
+    cancelled: int = 0
+    preempted: int = 0
+    wait: StreamingHistogram = field(default_factory=StreamingHistogram)
+
+    def to_dict(self) -> dict:
+        return {
+            "dispatched": self.dispatched,
+            "completed": self.completed,
+            "missed": self.missed,
+            "cancelled": self.cancelled,
+            "preempted": self.preempted,
+            "wait": self.wait.to_dict(),
+        }
+
+
+class SchedulerMetrics:
+    """
+    Metrics collected by SchedulerSimulation in bounded memory.
+
+    - Counters: arrived, dispatched, completed, missed (completed after the
+      deadline), cancelled (expired in the queue) and preempted.
+    - Streaming histograms of wait time (arrival to first start), per
+      priority and overall, and of lateness (max(0, completion - deadline)).
+    - Queue depth sampled every `sample_interval` units of simulated time. At
+      most `max_samples` samples are kept: when the buffer fills, every other
+      sample is dropped and the interval doubles, so a long run keeps an
+      evenly spaced, coarser series instead of growing without bound.
+    - (task, completion time) pairs for every completed task, only if
+      record_tasks is True.
+
+    Args:
+        record_tasks (bool): Keep every completed task in completed_tasks.
+        sample_interval (float): Simulated time between queue depth samples.
+        max_samples (int): Upper bound on the number of samples kept.
+        relative_error (float): Quantile accuracy of the histograms.
+    """
+
+    def __init__(
+        self,
+        record_tasks: bool = False,
+        sample_interval: float = 1.0,
+        max_samples: int = 10_000,
+        relative_error: float = 0.01,
+    ):
+        if sample_interval <= 0:
+            raise ValueError("sample_interval must be positive")
+        if max_samples < 2:
+            raise ValueError("max_samples must be at least 2")
+        self.record_tasks = record_tasks
+        self.sample_interval = sample_interval
+        self.max_samples = max_samples
+        self.relative_error = relative_error
+
+        self.arrived = 0
+        self.dispatched = 0
+        self.completed = 0
+        self.missed = 0
+        self.cancelled = 0
+        self.preempted = 0
+        self.busy_time = 0.0
+        self.end_time = 0.0
+        self.lateness = StreamingHistogram(relative_error)
+        self.by_priority: dict[int, PriorityMetrics] = {}
+        self.queue_depth: list[tuple[float, int]] = []
+        self.next_sample_time = 0.0
+        self.completed_tasks: list[tuple[Task, float]] = []
+
+    def _priority(self, priority: int) -> PriorityMetrics:
+        stats = self.by_priority.get(priority)
+        if stats is None:
+            stats = self.by_priority[priority] = PriorityMetrics(
+                wait=StreamingHistogram(self.relative_error)
+            )
+        return stats
+
+    def record_arrivals(self, count: int):
+        """Count tasks that entered the system."""
+        self.arrived += count
+
+    def record_dispatch(self, task: Task, wait: float):
+        """Record the first start of a task after waiting `wait` time units."""
+        self.dispatched += 1
+        stats = self._priority(task.priority)
+        stats.dispatched += 1
+        stats.wait.add(wait)
+
+    @property
+    def wait(self) -> StreamingHistogram:
+        """
+        Wait-time histogram over all priorities. Only the per-priority
+        histograms are updated per task; this merges them on demand.
+        """
+        merged = StreamingHistogram(self.relative_error)
+        for stats in self.by_priority.values():
+            merged.merge(stats.wait)
+        return merged
+
+    def record_completion(self, task: Task, now: float) -> bool:
+        """Record a finished task. Returns True if it missed its deadline."""
+        self.completed += 1
+        stats = self._priority(task.priority)
+        stats.completed += 1
+        missed = False
+        if task.deadline is not None:
+            lateness = now - task.deadline
+            self.lateness.add(max(0.0, lateness))
+            if lateness > 0:
+                missed = True
+                self.missed += 1
+                stats.missed += 1
+        if self.record_tasks:
+            self.completed_tasks.append((task, now))
+        return missed
+
+    def record_cancel(self, task: Task):
+        """Record a task dropped from the queue before it started."""
+        self.cancelled += 1
+        self._priority(task.priority).cancelled += 1
+
+    def record_preemption(self, task: Task):
+        """Record a running task sent back to the queue."""
+        self.preempted += 1
+        self._priority(task.priority).preempted += 1
+
+    def sample_queue_depth(self, now: float, depth: int):
+        """
+        Record the queue depth if a sample is due at time now.
+        Time complexity: O(1) amortized
+        """
+        if now < self.next_sample_time:
+            return
+        samples = self.queue_depth
+        samples.append((now, depth))
+        if len(samples) >= self.max_samples:
+            del samples[1::2]
+            self.sample_interval *= 2
+        self.next_sample_time = now + self.sample_interval
+
+    def utilization(self, num_workers: int) -> float:
+        """Share of worker time spent processing tasks."""
+        worker_time = num_workers * self.end_time
+        return self.busy_time / worker_time if worker_time else 0.0
+
+    def to_dict(self) -> dict:
+        """All metrics except the per-task records, as JSON-ready data."""
+        return {
+            "counters": {
+                "arrived": self.arrived,
+                "dispatched": self.dispatched,
+                "completed": self.completed,
+                "missed": self.missed,
+                "cancelled": self.cancelled,
+                "preempted": self.preempted,
+            },
+            "busy_time": self.busy_time,
+            "end_time": self.end_time,
+            "wait": self.wait.to_dict(),
+            "lateness": self.lateness.to_dict(),
+            "by_priority": {
+                str(priority): stats.to_dict()
+                for priority, stats in sorted(self.by_priority.items())
+            },
+            "queue_depth": {
+                "sample_interval": self.sample_interval,
+                "samples": [list(sample) for sample in self.queue_depth],
+            },
+        }
+
+    def write_json(self, path: str):
+        """Write to_dict() as JSON."""
+        with open(path, "w") as output:
+            json.dump(self.to_dict(), output, indent=2)
+
+    def rows(self) -> list[tuple]:
+        """
+        Flatten the scalar metrics into (metric, priority, value) rows, with
+        priority "all" for the overall figures.
+        """
+        rows = []
+        data = self.to_dict()
+        for name, value in data["counters"].items():
+            rows.append((name, "all", value))
+        rows.append(("busy_time", "all", self.busy_time))
+        rows.append(("end_time", "all", self.end_time))
+        for histogram in ("wait", "lateness"):
+            for stat, value in data[histogram].items():
+                rows.append((f"{histogram}_{stat}", "all", value))
+        for priority, stats in data["by_priority"].items():
+            for name in ("dispatched", "completed", "missed", "cancelled", "preempted"):
+                rows.append((name, priority, stats[name]))
+            for stat, value in stats["wait"].items():
+                rows.append((f"wait_{stat}", priority, value))
+        return rows
+
+    def write_csv(self, path: str):
+        """Write rows() as a CSV file with a metric,priority,value header."""
+        with open(path, "w", newline="") as output:
+            writer = csv.writer(output)
+            writer.writerow(("metric", "priority", "value"))
+            writer.writerows(self.rows())
+
+    def write_queue_depth_csv(self, path: str):
+        """Write the queue depth samples as a time,depth CSV file."""
+        with open(path, "w", newline="") as output:
+            writer = csv.writer(output)
+            writer.writerow(("time", "depth"))
+            writer.writerows(self.queue_depth)
+
+
+def format_quantiles(histogram: StreamingHistogram, digits: int = 2) -> str:
+    """One-line summary such as 'p50 1.20, p90 3.40, p99 7.10, p99.9 9.00'."""
+    return ", ".join(
+        f"{_quantile_name(q)} {histogram.quantile(q):.{digits}f}" for q in QUANTILES
+    )
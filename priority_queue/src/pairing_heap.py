@@ -0,0 +1,289 @@
+# pairing_heap.py
+
+from typing import Iterable, Optional, Union
+from .policies import Policy, get_policy
+from .priority_queue import Task
+
+
+class _Node:
+    """
+    A pairing heap node. `child` is the leftmost child, `sibling` the next
+    sibling to the right, and `prev` the left sibling, or the parent for a
+    leftmost child, so a node can be cut out in O(1).
+    """
+
+    __slots__ = ("task", "key", "child", "sibling", "prev")
+
+    def __init__(self, task: Task, key):
+        self.task = task
+        self.key = key
+        self.child: Optional[_Node] = None
+        self.sibling: Optional[_Node] = None
+        self.prev: Optional[_Node] = None
+
+
+class PairingHeap:
+    """
+    Mergeable max-priority queue for Task objects, built as a pairing heap.
+
+    Offers the by-id interface of PriorityQueue (insert, extract_max,
+    increase_key, decrease_key, update_priority, remove, contains, get) plus
+    meld, which merges another queue into this one in O(1) heap work: the two
+    roots are linked and nothing is sifted. Melding two PriorityQueues instead
+    means rebuilding or reinserting the smaller one.
+
+    Nodes are linked objects rather than array slots, so each operation pays
+    for pointer chasing and node allocation; the array heap is faster when
+    queues are never merged (see benchmarks.meld).
+
+    Like PriorityQueue, the order is set by a policy and each task's key is
+    computed once per insert or reprioritization.
+    """
+
+    def __init__(self, policy: Optional[Union[str, Policy]] = None):
+        self.policy = get_policy(policy)
+        self.root: Optional[_Node] = None
+        self.nodes: dict[int, _Node] = {}
+
+    @classmethod
+    def from_tasks(
+        cls, tasks: Iterable[Task], policy: Optional[Union[str, Policy]] = None
+    ) -> "PairingHeap":
+        """
+        Build a pairing heap from an iterable of tasks.
+        Time complexity: O(n)
+        """
+        heap = cls(policy)
+        for task in tasks:
+            heap.insert(task)
+        return heap
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self.nodes
+
+    def is_empty(self) -> bool:
+        """Return True if the queue is empty."""
+        return self.root is None
+
+    def clear(self):
+        """Remove every task from the queue."""
+        self.root = None
+        self.nodes = {}
+
+    def contains(self, task_id: int) -> bool:
+        """
+        Return True if a task with task_id is queued.
+        Time complexity: O(1)
+        """
+        return task_id in self.nodes
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """
+        Return the queued task with task_id without removing it, or None.
+        Time complexity: O(1)
+        """
+        node = self.nodes.get(task_id)
+        return node.task if node is not None else None
+
+    def peek_max(self) -> Optional[Task]:
+        """
+        Return the task with the highest priority without removing it.
+        Time complexity: O(1)
+        """
+        return self.root.task if self.root is not None else None
+
+    def insert(self, task: Task):
+        """
+        Insert a new task into the priority queue.
+        Time complexity: O(1)
+        """
+        if task.task_id in self.nodes:
+            raise ValueError(f"Task with id {task.task_id} already in queue")
+        node = _Node(task, self.policy(task))
+        self.nodes[task.task_id] = node
+        self.root = node if self.root is None else _link(self.root, node)
+
+    def insert_many(self, tasks: Iterable[Task]):
+        """
+        Insert a batch of tasks into the priority queue.
+        Time complexity: O(k)
+        """
+        for task in tasks:
+            self.insert(task)
+
+    def extract_max(self) -> Optional[Task]:
+        """
+        Remove and return the task with the highest priority.
+        Time complexity: O(log n) amortized
+        """
+        root = self.root
+        if root is None:
+            return None
+        del self.nodes[root.task.task_id]
+        self.root = _merge_pairs(root.child)
+        return root.task
+
+    def extract_many(self, k: int) -> list[Task]:
+        """
+        Remove and return up to k tasks in priority order (highest first).
+        Time complexity: O(k log n) amortized
+        """
+        extract_max = self.extract_max
+        return [extract_max() for _ in range(min(k, len(self)))]
+
+    def remove(self, task_id: int) -> Task:
+        """
+        Remove and return the task with task_id.
+        Time complexity: O(log n) amortized
+        """
+        node = self.nodes.get(task_id)
+        if node is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        if node is self.root:
+            return self.extract_max()
+        del self.nodes[task_id]
+        _cut(node)
+        subtree = _merge_pairs(node.child)
+        if subtree is not None:
+            self.root = _link(self.root, subtree)
+        return node.task
+
+    def increase_key(self, task_id: int, new_priority: int):
+        """
+        Increase the priority of a task by task_id.
+        Time complexity: O(1) for lookup + O(log n) amortized.
+        """
+        node = self.nodes.get(task_id)
+        if node is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        if new_priority < node.task.priority:
+            raise ValueError("New priority must be higher than current priority")
+
+        node.task.priority = new_priority
+        self._rekey(node)
+
+    def decrease_key(self, task_id: int, new_priority: int):
+        """
+        Decrease the priority of a task by task_id.
+        Time complexity: O(1) for lookup + O(log n) amortized.
+        """
+        node = self.nodes.get(task_id)
+        if node is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        if new_priority > node.task.priority:
+            raise ValueError("New priority must be lower than current priority")
+
+        node.task.priority = new_priority
+        self._rekey(node)
+
+    def update_priority(self, task_id: int, new_priority: int):
+        """
+        Set the priority of a task by task_id, moving it up or down as needed.
+        Time complexity: O(log n) amortized
+        """
+        node = self.nodes.get(task_id)
+        if node is None:
+            raise ValueError(f"Task with id {task_id} not found")
+
+        node.task.priority = new_priority
+        self._rekey(node)
+
+    def meld(self, other: "PairingHeap"):
+        """
+        Move every task of other into this queue, leaving other empty.
+        Time complexity: O(1) to link the two heaps, plus a C-level copy of
+        the smaller id index (O(min(n, m))).
+        """
+        if other is self:
+            raise ValueError("Cannot meld a queue with itself")
+        if other.policy is not self.policy:
+            raise ValueError("Cannot meld queues with different policies")
+        if other.root is None:
+            return
+        if not self.nodes.keys().isdisjoint(other.nodes.keys()):
+            raise ValueError("Task ids must be unique")
+        # Copy the smaller index into the larger one.
+        if len(other.nodes) > len(self.nodes):
+            self.nodes, other.nodes = other.nodes, self.nodes
+        self.nodes.update(other.nodes)
+        self.root = other.root if self.root is None else _link(self.root, other.root)
+        other.clear()
+
+    def _rekey(self, node: _Node):
+        """Recompute the key of node and restore heap order around it."""
+        old_key = node.key
+        new_key = node.key = self.policy(node.task)
+        if node is self.root:
+            if new_key < old_key and node.child is not None:
+                # The root may no longer be the maximum: split it off its
+                # children and link it back with them.
+                children = _merge_pairs(node.child)
+                node.child = None
+                self.root = _link(children, node)
+        elif new_key > old_key:
+            # Children stay smaller; only the edge to the parent can break.
+            _cut(node)
+            self.root = _link(self.root, node)
+        elif new_key < old_key and node.child is not None:
+            # The parent stays larger; only the edges to children can break.
+            children = _merge_pairs(node.child)
+            node.child = None
+            self.root = _link(self.root, children)
+
+
+def _link(first: _Node, second: _Node) -> _Node:
+    """Make the root with the smaller key the leftmost child of the other."""
+    if second.key > first.key:
+        first, second = second, first
+    child = first.child
+    second.sibling = child
+    if child is not None:
+        child.prev = second
+    second.prev = first
+    first.child = second
+    first.sibling = None
+    first.prev = None
+    return first
+
+
+def _cut(node: _Node):
+    """Detach node (with its subtree) from its parent or left sibling."""
+    prev = node.prev
+    sibling = node.sibling
+    if prev.child is node:
+        prev.child = sibling
+    else:
+        prev.sibling = sibling
+    if sibling is not None:
+        sibling.prev = prev
+    node.prev = None
+    node.sibling = None
+
+
+def _merge_pairs(first: Optional[_Node]) -> Optional[_Node]:
+    """
+    Two-pass pairing of a sibling list: link neighbours left to right, then
+    fold the pairs into one heap right to left. Iterative, so long sibling
+    lists cannot overflow the stack.
+    """
+    if first is None:
+        return None
+    pairs = []
+    node = first
+    while node is not None:
+        second = node.sibling
+        if second is None:
+            node.prev = None
+            pairs.append(node)
+            break
+        following = second.sibling
+        node.sibling = second.sibling = None
+        pairs.append(_link(node, second))
+        node = following
+    root = pairs.pop()
+    while pairs:
+        root = _link(pairs.pop(), root)
+    return root
@@ -0,0 +1,78 @@
+# policies.py
+
+import math
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+if TYPE_CHECKING:
+    from .priority_queue import Task
+
+# A policy maps a task to its sort key; the queue serves the largest key
+# first. Keys are computed once when a task is inserted (or reprioritized)
+# and stored next to it, so they must be cheap to compare: numbers or tuples.
+Policy = Callable[["Task"], Any]
+
+
+def max_priority(task: "Task") -> int:
+    """Highest priority first; ties in no particular order."""
+    return task.priority
+
+
+def earliest_deadline(task: "Task") -> float:
+    """Earliest deadline first (EDF); tasks without a deadline go last."""
+    return -task.deadline if task.deadline is not None else -math.inf
+
+
+def priority_fifo(task: "Task") -> tuple:
+    """Highest priority first, then earliest arrival (stable FIFO per priority)."""
+    arrival = task.arrival_time if task.arrival_time is not None else math.inf
+    return (task.priority, -arrival)
+
+
+def least_slack(task: "Task") -> float:
+    """
+    Least slack first. Slack at time t is deadline - t - service_time; t is the
+    same for every queued task, so ordering by deadline - service_time gives
+    the same order without recomputing keys as time advances. A task without
+    a service_time is treated as needing none.
+    """
+    if task.deadline is None:
+        return -math.inf
+    service_time = task.service_time if task.service_time is not None else 0.0
+    return service_time - task.deadline
+
+
+def _weighted(priority_weight: float, deadline_weight: float, task: "Task") -> float:
+    deadline = task.deadline if task.deadline is not None else math.inf
+    return priority_weight * task.priority - deadline_weight * deadline
+
+
+def weighted(priority_weight: float = 1.0, deadline_weight: float = 1.0) -> Policy:
+    """
+    Weighted blend of priority and deadline: the key is
+    priority_weight * priority - deadline_weight * deadline, so one unit of
+    priority is worth priority_weight / deadline_weight time units of deadline.
+    """
+    return partial(_weighted, priority_weight, deadline_weight)
+
+
+POLICIES: dict[str, Policy] = {
+    "max_priority": max_priority,
+    "edf": earliest_deadline,
+    "priority_fifo": priority_fifo,
+    "least_slack": least_slack,
+    "weighted": weighted(),
+}
+
+
+def get_policy(policy: Optional[Union[str, Policy]]) -> Policy:
+    """Resolve a policy name, a key function, or None (max_priority)."""
+    if policy is None:
+        return max_priority
+    if callable(policy):
+        return policy
+    if policy not in POLICIES:
+        raise ValueError(
+            f"Unknown policy {policy!r}; expected one of {', '.join(POLICIES)}"
+        )
+    return POLICIES[policy]
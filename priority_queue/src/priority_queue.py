@@ -1,25 +1,54 @@
 # priority_queue.py
 
+import gc
+import heapq
+import math
+import mmap
+import struct
+import sys
+from array import array
 from dataclasses import dataclass
-from typing import Optional
+from operator import attrgetter
+from typing import Iterable, Optional, Union
+from .policies import POLICIES, Policy, get_policy
 
+# Snapshot file layout (little-endian): a 40-byte header (magic, arity, flags,
+# task count, policy name), then one fixed-width column per Task field in
+# heap order: priority and task_id as int64, arrival_time, deadline and
+# service_time as float64 with NaN standing for None. Bit i of flags is set
+# if column i holds any None, so restore only scans those columns for NaN.
+SNAPSHOT_MAGIC = b"PQSNAP01"
+_SNAPSHOT_HEADER = struct.Struct("<8sIIQ16s")
+_SNAPSHOT_COLUMNS = (
+    ("priority", "q"),
+    ("task_id", "q"),
+    ("arrival_time", "d"),
+    ("deadline", "d"),
+    ("service_time", "d"),
+)
+_SNAPSHOT_RECORD_SIZE = 8 * len(_SNAPSHOT_COLUMNS)
 
-@dataclass(order=True)
+
+@dataclass(order=True, slots=True)
 class Task:
     """
     Represents a schedulable task.
 
+    Declared with __slots__ so queued tasks carry no per-instance __dict__.
+
     Attributes:
         priority (int): The priority of the task. Higher value means higher priority.
         task_id (int): Unique identifier for the task.
         arrival_time (Optional[float]): Time at which the task arrives.
         deadline (Optional[float]): Deadline by which the task must be completed.
+        service_time (Optional[float]): Expected processing time, if known.
     """
 
     priority: int
     task_id: int
     arrival_time: Optional[float] = None
     deadline: Optional[float] = None
+    service_time: Optional[float] = None
 
     def __repr__(self):
         return (
@@ -31,44 +60,351 @@ class Task:
 class PriorityQueue:
     """
     Implements a max-heap priority queue for Task objects.
+
+    The heap is d-ary: each node has `arity` children (2 by default). Wider
+    heaps are shallower, so inserts and increase_key move tasks through fewer
+    levels, at the cost of more comparisons per level on the way down.
+
+    A task_id -> heap index map is kept in sync with every move inside the
+    heap, so tasks can be looked up, reprioritized and removed by id without
+    scanning the heap.
+
+    cancel(task_id) only marks a task as dead (a tombstone). Dead tasks stay
+    in the heap until they reach the root, where extraction discards them, or
+    until more than `max_dead_fraction` of the heap is dead, at which point
+    the heap is compacted in O(n).
+
+    The order is set by a policy (see policies.py): a function mapping a task
+    to a key, where the largest key is served first. The default is
+    max_priority. Keys are computed once when a task is inserted or
+    reprioritized and kept in `keys`, a list parallel to `heap`, so the sift
+    loops compare plain numbers or tuples instead of calling the policy.
     """
 
-    def __init__(self):
+    # insert_many rebuilds the whole heap in O(n + k) instead of sifting each
+    # new task up when the batch is at least this fraction of the queue size.
+    REBUILD_RATIO = 1.0
+
+    def __init__(
+        self,
+        arity: int = 2,
+        max_dead_fraction: float = 0.5,
+        policy: Optional[Union[str, Policy]] = None,
+    ):
+        if arity < 2:
+            raise ValueError("Heap arity must be at least 2")
+        if not 0 < max_dead_fraction <= 1:
+            raise ValueError("max_dead_fraction must be in (0, 1]")
+        self.arity = arity
+        self.max_dead_fraction = max_dead_fraction
+        self.policy = get_policy(policy)
         self.heap: list[Task] = []
+        self.keys: list = []
         self.task_index_map: dict[int, int] = {}
+        self.cancelled: set[int] = set()
+        self.compactions = 0
+
+    @classmethod
+    def from_tasks(
+        cls,
+        tasks: Iterable[Task],
+        arity: int = 2,
+        max_dead_fraction: float = 0.5,
+        policy: Optional[Union[str, Policy]] = None,
+    ) -> "PriorityQueue":
+        """
+        Build a priority queue from an iterable of tasks.
+        Time complexity: O(n) (bottom-up heap construction)
+        """
+        pq = cls(arity, max_dead_fraction, policy)
+        pq.heap = list(tasks)
+        pq.keys = list(map(pq.policy, pq.heap))
+        pq._build_heap()
+        return pq
+
+    def snapshot(self, path: str) -> int:
+        """
+        Write the queue to path in the binary snapshot format, one column per
+        Task field in heap order. Cancelled tasks are compacted away first, so
+        the file always holds a valid heap. Returns the number of tasks.
+        Time complexity: O(n)
+        """
+        if self.cancelled:
+            self.compact()
+        heap = self.heap
+        flags = 0
+        with open(path, "wb") as output:
+            output.seek(_SNAPSHOT_HEADER.size)
+            # One column at a time, so at most one extra column is in memory.
+            for bit, (field, typecode) in enumerate(_SNAPSHOT_COLUMNS):
+                values = list(map(attrgetter(field), heap))
+                if typecode == "d" and None in values:
+                    flags |= 1 << bit
+                    values = [math.nan if v is None else v for v in values]
+                column = array(typecode, values)
+                del values
+                if sys.byteorder == "big":
+                    column.byteswap()
+                column.tofile(output)
+            output.seek(0)
+            output.write(
+                _SNAPSHOT_HEADER.pack(
+                    SNAPSHOT_MAGIC,
+                    self.arity,
+                    flags,
+                    len(heap),
+                    _policy_name(self.policy).encode(),
+                )
+            )
+        return len(heap)
+
+    @classmethod
+    def restore(
+        cls,
+        path: str,
+        max_dead_fraction: float = 0.5,
+        policy: Optional[Union[str, Policy]] = None,
+    ) -> "PriorityQueue":
+        """
+        Rebuild a queue from a file written by snapshot().
+
+        The file is memory-mapped and each column is read straight out of the
+        mapping. The heap array is restored as saved, so nothing is sifted:
+        only the tasks, their keys and the task_id index are rebuilt.
+
+        Args:
+            path (str): Snapshot file.
+            max_dead_fraction (float): As for the constructor.
+            policy (str or callable): Ordering policy. Defaults to the policy
+                recorded in the snapshot; a snapshot taken with a custom
+                policy function must be restored with the same function.
+
+        Raises:
+            ValueError: If the file is not a snapshot, is truncated, or its
+                policy does not match.
+
+        Time complexity: O(n)
+        """
+        with open(path, "rb") as snapshot:
+            if snapshot.seek(0, 2) < _SNAPSHOT_HEADER.size:
+                raise ValueError(f"{path}: not a priority queue snapshot")
+            with mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, arity, flags, count, name = _SNAPSHOT_HEADER.unpack_from(mapped)
+                if magic != SNAPSHOT_MAGIC:
+                    raise ValueError(f"{path}: not a priority queue snapshot")
+                size = _SNAPSHOT_HEADER.size + count * _SNAPSHOT_RECORD_SIZE
+                if len(mapped) != size:
+                    raise ValueError(f"{path}: truncated snapshot")
+                policy = _snapshot_policy(name.rstrip(b"\0").decode(), policy)
+                pq = cls(arity, max_dead_fraction, policy)
+
+                columns = []
+                offset = _SNAPSHOT_HEADER.size
+                with memoryview(mapped) as view:
+                    for bit, (_, typecode) in enumerate(_SNAPSHOT_COLUMNS):
+                        end = offset + 8 * count
+                        values = _read_column(view[offset:end], typecode)
+                        if flags & (1 << bit):
+                            values = [None if v != v else v for v in values]
+                        columns.append(values)
+                        offset = end
+
+        # Building a million tasks would otherwise trigger repeated cyclic GC
+        # passes over them; none of them can be part of a cycle.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            pq.heap = list(map(Task, *columns))
+            pq.keys = list(map(pq.policy, pq.heap))
+            pq.task_index_map = dict(zip(columns[1], range(count)))
+        finally:
+            if gc_enabled:
+                gc.enable()
+        if len(pq.task_index_map) != count:
+            raise ValueError(f"{path}: task ids must be unique")
+        return pq
+
+    def __len__(self) -> int:
+        return len(self.heap) - len(self.cancelled)
+
+    def __contains__(self, task_id: int) -> bool:
+        return self._find_task_index(task_id) is not None
+
+    @property
+    def live_count(self) -> int:
+        """Number of queued tasks that have not been cancelled."""
+        return len(self.heap) - len(self.cancelled)
+
+    @property
+    def dead_count(self) -> int:
+        """Number of cancelled tasks still held in the heap."""
+        return len(self.cancelled)
 
     def is_empty(self) -> bool:
         """Return True if the queue is empty."""
-        return len(self.heap) == 0
+        return len(self.heap) == len(self.cancelled)
+
+    def clear(self):
+        """Remove every task from the queue."""
+        self.heap.clear()
+        self.keys.clear()
+        self.task_index_map.clear()
+        self.cancelled.clear()
+
+    def contains(self, task_id: int) -> bool:
+        """
+        Return True if a task with task_id is queued.
+        Time complexity: O(1)
+        """
+        return self._find_task_index(task_id) is not None
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """
+        Return the queued task with task_id without removing it, or None.
+        Time complexity: O(1)
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            return None
+        return self.heap[index]
 
     def insert(self, task: Task):
         """
         Insert a new task into the priority queue.
         Time complexity: O(log n)
         """
+        if task.task_id in self.task_index_map:
+            if task.task_id not in self.cancelled:
+                raise ValueError(f"Task with id {task.task_id} already in queue")
+            self._discard_dead(task.task_id)
         self.heap.append(task)
+        self.keys.append(self.policy(task))
         self.task_index_map[task.task_id] = len(self.heap) - 1
         self._heapify_up(len(self.heap) - 1)
 
+    def insert_many(self, tasks: Iterable[Task]):
+        """
+        Insert a batch of tasks into the priority queue.
+        Time complexity: O(k log n) for a small batch of k tasks, O(n + k) when
+        the batch is large enough that rebuilding the heap is cheaper.
+        """
+        tasks = list(tasks)
+        task_ids = {task.task_id for task in tasks}
+        index_map = self.task_index_map
+        cancelled = self.cancelled
+        if len(task_ids) != len(tasks) or any(
+            task_id in index_map and task_id not in cancelled for task_id in task_ids
+        ):
+            raise ValueError("Task ids must be unique")
+
+        if len(tasks) < self.REBUILD_RATIO * len(self.heap):
+            for task in tasks:
+                self.insert(task)
+        else:
+            # The heap is rebuilt anyway, so drop dead tasks on the way.
+            if cancelled:
+                self._drop_cancelled()
+                self.compactions += 1
+            self.heap.extend(tasks)
+            self.keys.extend(map(self.policy, tasks))
+            self._build_heap()
+
     def extract_max(self) -> Optional[Task]:
         """
         Remove and return the task with the highest priority.
         Time complexity: O(log n)
         """
-        if self.is_empty():
+        if self.cancelled:
+            self._drop_dead_root()
+        if not self.heap:
             return None
-        if len(self.heap) == 1:
-            return self.heap.pop()
+        return self._remove_at(0)
+
+    def peek_max(self) -> Optional[Task]:
+        """
+        Return the task with the highest priority without removing it.
+        Time complexity: O(1), plus dropping any dead tasks at the root.
+        """
+        if self.cancelled:
+            self._drop_dead_root()
+        return self.heap[0] if self.heap else None
+
+    def extract_many(self, k: int) -> list[Task]:
+        """
+        Remove and return up to k tasks in priority order (highest first).
+        Time complexity: O(k log n)
+        """
+        extract_max = self.extract_max
+        return [extract_max() for _ in range(min(k, len(self)))]
+
+    def peek_top(self, k: int) -> list[Task]:
+        """
+        Return up to k tasks in policy order (highest key first) without
+        removing them.
+        Time complexity: O(k log k)
+        """
+        heap = self.heap
+        keys = self.keys
+        size = len(heap)
+        arity = self.arity
+        cancelled = self.cancelled
+        top: list[Task] = []
+        if k <= 0 or size == 0:
+            return top
+
+        # Frontier of candidate heap indices, largest key first. Dead tasks
+        # are skipped, but their children are still candidates.
+        frontier = [_Candidate(keys[0], 0)]
+        while frontier and len(top) < k:
+            index = heapq.heappop(frontier).index
+            if heap[index].task_id not in cancelled:
+                top.append(heap[index])
+            first = arity * index + 1
+            for child in range(first, min(first + arity, size)):
+                heapq.heappush(frontier, _Candidate(keys[child], child))
+        return top
+
+    def remove(self, task_id: int) -> Task:
+        """
+        Remove and return the task with task_id.
+        Time complexity: O(log n)
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        return self._remove_at(index)
 
-        max_task = self.heap[0]
-        self.heap[0] = self.heap.pop()
-        self._heapify_down(0)
-        return max_task
+    def cancel(self, task_id: int) -> Task:
+        """
+        Cancel the task with task_id and return it. The task is only marked
+        dead; it is dropped when it reaches the root or at the next compaction.
+        Time complexity: O(1) amortized
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        task = self.heap[index]
+        self.cancelled.add(task_id)
+        if len(self.cancelled) > self.max_dead_fraction * len(self.heap):
+            self.compact()
+        return task
+
+    def compact(self):
+        """
+        Drop every cancelled task and rebuild the heap.
+        Time complexity: O(n)
+        """
+        cancelled = self.cancelled
+        if not cancelled:
+            return
+        self._drop_cancelled()
+        self._build_heap()
+        self.compactions += 1
 
     def increase_key(self, task_id: int, new_priority: int):
         """
         Increase the priority of a task by task_id.
-        Time complexity: O(n) for lookup + O(log n) for heapify.
+        Time complexity: O(1) for lookup + O(log n) for heapify.
         """
         index = self._find_task_index(task_id)
         if index is None:
@@ -77,12 +413,12 @@ class PriorityQueue:
             raise ValueError("New priority must be higher than current priority")
 
         self.heap[index].priority = new_priority
-        self._heapify_up(index)
+        self._rekey(index)
 
     def decrease_key(self, task_id: int, new_priority: int):
         """
         Decrease the priority of a task by task_id.
-        Time complexity: O(n) for lookup + O(log n) for heapify.
+        Time complexity: O(1) for lookup + O(log n) for heapify.
         """
         index = self._find_task_index(task_id)
         if index is None:
@@ -91,43 +427,223 @@ class PriorityQueue:
             raise ValueError("New priority must be lower than current priority")
 
         self.heap[index].priority = new_priority
-        self._heapify_down(index)
+        self._rekey(index)
+
+    def update_priority(self, task_id: int, new_priority: int):
+        """
+        Set the priority of a task by task_id, moving it up or down as needed.
+        Time complexity: O(log n)
+        """
+        index = self._find_task_index(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+
+        self.heap[index].priority = new_priority
+        self._rekey(index)
+
+    def _rekey(self, index: int):
+        """Recompute the key of the task at index and sift it into place."""
+        old_key = self.keys[index]
+        new_key = self.keys[index] = self.policy(self.heap[index])
+        if new_key > old_key:
+            self._heapify_up(index)
+        elif new_key < old_key:
+            self._heapify_down(index)
 
     def _find_task_index(self, task_id: int) -> Optional[int]:
-        """Helper method to find the index of a task by task_id. O(n)"""
-        for i, task in enumerate(self.heap):
-            if task.task_id == task_id:
-                return i
-        return None
+        """Helper method to find the index of a live task by task_id. O(1)"""
+        if self.cancelled and task_id in self.cancelled:
+            return None
+        return self.task_index_map.get(task_id)
+
+    def _drop_dead_root(self):
+        """Discard cancelled tasks from the root until a live task is on top."""
+        heap = self.heap
+        cancelled = self.cancelled
+        while heap and heap[0].task_id in cancelled:
+            cancelled.discard(heap[0].task_id)
+            self._remove_at(0)
+
+    def _discard_dead(self, task_id: int):
+        """Physically remove a cancelled task so its id can be reused."""
+        self.cancelled.discard(task_id)
+        self._remove_at(self.task_index_map[task_id])
+
+    def _drop_cancelled(self):
+        """Filter cancelled tasks (and their keys) out of the heap arrays."""
+        cancelled = self.cancelled
+        live = [i for i, task in enumerate(self.heap) if task.task_id not in cancelled]
+        self.heap = [self.heap[i] for i in live]
+        self.keys = [self.keys[i] for i in live]
+        cancelled.clear()
+
+    def _build_heap(self):
+        """
+        Heapify self.heap and self.keys bottom-up in O(n), then rebuild the
+        index map.
+
+        The sift loop here skips the index map bookkeeping of _heapify_down;
+        the map is written once at the end instead.
+        """
+        heap = self.heap
+        keys = self.keys
+        size = len(heap)
+        arity = self.arity
+        for start in range((size - 2) // arity, -1, -1):
+            index = start
+            task = heap[index]
+            key = keys[index]
+            while True:
+                first = arity * index + 1
+                if first >= size:
+                    break
+                largest = first
+                largest_key = keys[first]
+                for child_index in range(first + 1, min(first + arity, size)):
+                    child_key = keys[child_index]
+                    if child_key > largest_key:
+                        largest = child_index
+                        largest_key = child_key
+                if largest_key <= key:
+                    break
+                heap[index] = heap[largest]
+                keys[index] = largest_key
+                index = largest
+            heap[index] = task
+            keys[index] = key
+
+        self.task_index_map = {task.task_id: i for i, task in enumerate(heap)}
+        if len(self.task_index_map) != size:
+            raise ValueError("Task ids must be unique")
+
+    def _remove_at(self, index: int) -> Task:
+        """Remove the task at index, fill the gap with the last task and re-sift."""
+        removed = self.heap[index]
+        del self.task_index_map[removed.task_id]
+
+        last = self.heap.pop()
+        last_key = self.keys.pop()
+        if index < len(self.heap):
+            self.heap[index] = last
+            self.keys[index] = last_key
+            self.task_index_map[last.task_id] = index
+            parent_index = (index - 1) // self.arity
+            if index > 0 and last_key > self.keys[parent_index]:
+                self._heapify_up(index)
+            else:
+                self._heapify_down(index)
+        return removed
 
     def _heapify_up(self, index: int):
-        """Restore heap property by moving task at index up."""
-        parent_index = (index - 1) // 2
-        while (
-            index > 0 and self.heap[index].priority > self.heap[parent_index].priority
-        ):
-            self.heap[index], self.heap[parent_index] = (
-                self.heap[parent_index],
-                self.heap[index],
-            )
+        """
+        Restore heap property by moving task at index up.
+
+        Parents are shifted down into the hole left by the task instead of
+        being swapped, and every moved task has its index map entry updated.
+        """
+        heap = self.heap
+        keys = self.keys
+        index_map = self.task_index_map
+        arity = self.arity
+        task = heap[index]
+        key = keys[index]
+
+        while index > 0:
+            parent_index = (index - 1) // arity
+            parent_key = keys[parent_index]
+            if key <= parent_key:
+                break
+            parent = heap[parent_index]
+            heap[index] = parent
+            keys[index] = parent_key
+            index_map[parent.task_id] = index
             index = parent_index
-            parent_index = (index - 1) // 2
+
+        heap[index] = task
+        keys[index] = key
+        index_map[task.task_id] = index
 
     def _heapify_down(self, index: int):
-        """Restore heap property by moving task at index down."""
-        size = len(self.heap)
-        while True:
-            left = 2 * index + 1
-            right = 2 * index + 2
-            largest = index
+        """
+        Restore heap property by moving task at index down.
 
-            if left < size and self.heap[left].priority > self.heap[largest].priority:
-                largest = left
-            if right < size and self.heap[right].priority > self.heap[largest].priority:
-                largest = right
+        The largest child is shifted up into the hole at each level, and every
+        moved task has its index map entry updated.
+        """
+        heap = self.heap
+        keys = self.keys
+        index_map = self.task_index_map
+        arity = self.arity
+        size = len(heap)
+        task = heap[index]
+        key = keys[index]
 
-            if largest == index:
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            largest = first
+            largest_key = keys[first]
+            for child_index in range(first + 1, min(first + arity, size)):
+                child_key = keys[child_index]
+                if child_key > largest_key:
+                    largest = child_index
+                    largest_key = child_key
+            if largest_key <= key:
                 break
 
-            self.heap[index], self.heap[largest] = self.heap[largest], self.heap[index]
+            child = heap[largest]
+            heap[index] = child
+            keys[index] = largest_key
+            index_map[child.task_id] = index
             index = largest
+
+        heap[index] = task
+        keys[index] = key
+        index_map[task.task_id] = index
+
+
+class _Candidate:
+    """A peek_top frontier entry; heapq pops the largest key first."""
+
+    __slots__ = ("key", "index")
+
+    def __init__(self, key, index: int):
+        self.key = key
+        self.index = index
+
+    def __lt__(self, other: "_Candidate") -> bool:
+        return self.key > other.key
+
+
+def _policy_name(policy: Policy) -> str:
+    """Name under which policy is registered in POLICIES, or "" if custom."""
+    for name, registered in POLICIES.items():
+        if registered is policy:
+            return name
+    return ""
+
+
+def _snapshot_policy(recorded: str, policy: Optional[Union[str, Policy]]) -> Policy:
+    """Resolve the policy to restore a snapshot with, checking it matches."""
+    if policy is None:
+        if not recorded:
+            raise ValueError(
+                "Snapshot was taken with a custom policy; pass it to restore"
+            )
+        return POLICIES[recorded]
+    resolved = get_policy(policy)
+    if recorded and resolved is not POLICIES[recorded]:
+        raise ValueError(f"Snapshot was taken with the {recorded!r} policy")
+    return resolved
+
+
+def _read_column(view: memoryview, typecode: str) -> list:
+    """Decode one little-endian snapshot column."""
+    if sys.byteorder == "little":
+        with view.cast(typecode) as column:
+            return column.tolist()
+    column = array(typecode)
+    column.frombytes(view)
+    column.byteswap()
+    return column.tolist()
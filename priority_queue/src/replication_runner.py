@@ -0,0 +1,119 @@
+# replication_runner.py
+
+import math
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+from .scheduler_simulation import SchedulerSimulation
+
+# Two-sided 95% Student t critical values by degrees of freedom. Beyond the
+# table the normal value 1.96 is close enough.
+# fmt: off
+T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160,
+    14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093,
+    20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060,
+    26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+}
+# fmt: on
+
+METRICS = ("mean_wait", "deadline_miss_rate", "throughput", "utilization")
+
+
+def run_replication(config: dict, seed: int) -> dict:
+    """
+    Run one seeded SchedulerSimulation and return its summary statistics.
+
+    Args:
+        config (dict): SchedulerSimulation keyword arguments, plus `num_tasks`
+            and optionally `horizon` for generate_tasks.
+        seed (int): Seed for this replication.
+
+    Returns:
+        dict: The simulation summary with deadline_miss_rate (missed plus
+        expired tasks over generated tasks) and throughput (completed tasks
+        per unit of simulated time) added. Per-task data is not returned.
+    """
+    options = dict(config)
+    num_tasks = options.pop("num_tasks")
+    horizon = options.pop("horizon", 10.0)
+    options["record_completed"] = False
+    options["verbose"] = False
+
+    sim = SchedulerSimulation(seed=seed, **options)
+    sim.generate_tasks(num_tasks, horizon=horizon)
+    sim.run()
+
+    stats = sim.summary()
+    stats["seed"] = seed
+    stats["deadline_miss_rate"] = (
+        (stats["missed_deadlines"] + stats["expired"]) / num_tasks if num_tasks else 0.0
+    )
+    stats["throughput"] = (
+        stats["completed"] / stats["end_time"] if stats["end_time"] else 0.0
+    )
+    return stats
+
+
+def confidence_interval(values: list[float]) -> dict:
+    """
+    Return the mean, sample standard deviation and a two-sided 95% confidence
+    interval for the mean of values (Student t).
+    """
+    n = len(values)
+    mean = statistics.fmean(values)
+    if n < 2:
+        return {"mean": mean, "stdev": 0.0, "ci_low": mean, "ci_high": mean}
+    stdev = statistics.stdev(values)
+    half_width = T_CRITICAL_95.get(n - 1, 1.96) * stdev / math.sqrt(n)
+    return {
+        "mean": mean,
+        "stdev": stdev,
+        "ci_low": mean - half_width,
+        "ci_high": mean + half_width,
+    }
+
+
+def run_replications(
+    config: dict, seeds: Iterable[int], max_workers: Optional[int] = None
+) -> dict:
+    """
+    Run one replication per seed, in parallel, and merge the results.
+
+    Replications are spread over a ProcessPoolExecutor with max_workers
+    processes (os.cpu_count() by default; 1 runs them in this process).
+    Results come back in seed order, so the merged statistics depend only on
+    config and seeds, not on scheduling.
+
+    Returns:
+        dict: The number of replications, the per-replication summaries, and
+        a confidence interval for each of mean_wait, deadline_miss_rate,
+        throughput and utilization.
+    """
+    seeds = list(seeds)
+    if not seeds:
+        raise ValueError("At least one seed is required")
+    max_workers = max_workers or os.cpu_count() or 1
+
+    if max_workers == 1:
+        results = [run_replication(config, seed) for seed in seeds]
+    else:
+        # A few replications per task keeps inter-process overhead low
+        # without leaving workers idle at the end.
+        chunksize = max(1, len(seeds) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    run_replication,
+                    [config] * len(seeds),
+                    seeds,
+                    chunksize=chunksize,
+                )
+            )
+
+    merged = {"replications": len(results), "results": results}
+    for metric in METRICS:
+        merged[metric] = confidence_interval([r[metric] for r in results])
+    return merged
@@ -1,8 +1,44 @@
 # scheduling_simulation.py
 
+import heapq
 import random
-from typing import List, Tuple
-from priority_queue import PriorityQueue, Task
+from functools import partial
+from itertools import count
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+from .metrics import SchedulerMetrics, format_quantiles
+from .policies import Policy
+from .priority_queue import PriorityQueue, Task
+
+# Event kinds. At equal timestamps, completions are handled before deadline
+# expiries and arrivals, so a worker freed at time t can take a task that
+# arrives at time t.
+COMPLETION = 0
+DEADLINE = 1
+ARRIVAL = 2
+
+ServiceTime = Union[float, Callable[[random.Random], float]]
+
+
+def _exponential(rate: float, rng: random.Random) -> float:
+    return rng.expovariate(rate)
+
+
+def _uniform(low: float, high: float, rng: random.Random) -> float:
+    return rng.uniform(low, high)
+
+
+# The distributions are partials of module-level functions rather than
+# lambdas so simulations can be pickled and sent to worker processes.
+
+
+def exponential_service(mean: float) -> Callable[[random.Random], float]:
+    """Service times drawn from an exponential distribution with the given mean."""
+    return partial(_exponential, 1.0 / mean)
+
+
+def uniform_service(low: float, high: float) -> Callable[[random.Random], float]:
+    """Service times drawn uniformly from [low, high]."""
+    return partial(_uniform, low, high)
 
 
 class SchedulerSimulation:
@@ -10,81 +46,286 @@ class SchedulerSimulation:
     Simulates a scheduling system using a max-heap priority queue.
 
     Tasks are generated with random priorities, arrival times, and deadlines.
-    The scheduler processes tasks in order of priority once they arrive,
-    simulating task execution and tracking deadline misses and wait times.
+    The simulation is event driven: an event queue holds task arrivals, task
+    completions and (optionally) deadline expiries, and simulated time jumps
+    from one event to the next. Waiting tasks sit in a PriorityQueue and are
+    dispatched to `num_workers` parallel workers in the order set by the
+    queue's policy (highest priority first by default).
+
+    Args:
+        num_workers (int): Number of tasks that can be processed at once.
+        service_time (float or callable): Processing time per task, either a
+            constant or a function taking a random.Random and returning a
+            duration (see exponential_service and uniform_service). A task
+            that already has a service_time keeps it.
+        preemptive (bool): If True, a waiting task that the policy ranks above
+            a running task takes over that task's worker; the preempted task
+            goes back to the queue with its remaining service time.
+        drop_expired (bool): If True, a task still waiting when its deadline
+            passes is cancelled instead of being processed late.
+        verbose (bool): Print a line for every dispatch, deadline miss and
+            expiry. Off by default, since printing dominates large runs; the
+            same events are always counted in `metrics`.
+        record_completed (bool): Keep every (task, completion time) pair in
+            completed_tasks. Off by default: the aggregate statistics in
+            `metrics` (a SchedulerMetrics) take bounded memory, this list does
+            not.
+        seed (Optional[int]): Seed for task generation and service times.
+        arity (int): Arity of the underlying PriorityQueue.
+        policy (str or callable): Ordering policy of the PriorityQueue, a name
+            from policies.POLICIES or a key function (default max_priority).
+        sample_interval (float): Simulated time between queue depth samples
+            in `metrics`.
     """
 
-    def __init__(self):
-        self.pq = PriorityQueue()
-        self.completed_tasks: List[Tuple[Task, float]] = []
+    def __init__(
+        self,
+        num_workers: int = 1,
+        service_time: ServiceTime = 1.0,
+        preemptive: bool = False,
+        drop_expired: bool = False,
+        verbose: bool = False,
+        record_completed: bool = False,
+        seed: Optional[int] = None,
+        arity: int = 2,
+        policy: Optional[Union[str, Policy]] = None,
+        sample_interval: float = 1.0,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self.pq = PriorityQueue(arity=arity, policy=policy)
+        self.num_workers = num_workers
+        self.service_time = service_time
+        self.preemptive = preemptive
+        self.drop_expired = drop_expired
+        self.verbose = verbose
+        self.record_completed = record_completed
+        self.sample_interval = sample_interval
+        self.rng = random.Random(seed)
+        self.tasks: List[Task] = []
+        self._reset_statistics()
 
-    def generate_tasks(self, num_tasks: int):
+    def generate_tasks(self, num_tasks: int, horizon: float = 10.0):
         """
-        Generate random tasks with priority, arrival time, and deadline.
+        Generate random tasks with priority, arrival time, deadline and
+        service time. Arrival times are spread uniformly over [0, horizon].
+        Service times are drawn up front so policies such as least_slack can
+        use them while the task waits.
         """
-        for i in range(1, num_tasks + 1):
-            priority = random.randint(1, 10)  # Priority from 1 (low) to 10 (high)
-            arrival_time = random.uniform(
-                0, 10
-            )  # Tasks arrive anytime in first 10 seconds
-            deadline = arrival_time + random.uniform(
+        rng = self.rng
+        first_id = len(self.tasks) + 1
+        for i in range(first_id, first_id + num_tasks):
+            priority = rng.randint(1, 10)  # Priority from 1 (low) to 10 (high)
+            arrival_time = rng.uniform(0, horizon)  # Arrives within the horizon
+            deadline = arrival_time + rng.uniform(
                 5, 15
             )  # Deadline 5-15 seconds after arrival
-            task = Task(
-                priority=priority,
-                task_id=i,
-                arrival_time=arrival_time,
-                deadline=deadline,
+            self.tasks.append(
+                Task(
+                    priority=priority,
+                    task_id=i,
+                    arrival_time=arrival_time,
+                    deadline=deadline,
+                    service_time=self._draw_service_time(),
+                )
             )
-            self.pq.insert(task)
 
-    def run(self):
+    def run(self, source: Optional[Iterable[Task]] = None):
         """
         Run the scheduling simulation.
         Processes tasks in priority order as they arrive over time.
+
+        Args:
+            source (Optional[Iterable[Task]]): Tasks to simulate, in
+                non-decreasing arrival order, e.g. a generator from
+                task_sources. It is consumed lazily: a task is pulled only
+                when simulated time reaches the previous arrival, so memory
+                follows the live backlog instead of the trace length. Pair it
+                with record_completed=False for long traces. Defaults to
+                self.tasks, which is sorted by arrival first.
         """
-        print("Starting Scheduler Simulation...")
-        # Extract all tasks, sorted by arrival time for simulating time flow
-        tasks = sorted(self.pq.heap, key=lambda t: t.arrival_time)
-        self.pq.heap.clear()
-
-        current_time = 0
-        i = 0  # Index to track next task arrival
-
-        while i < len(tasks) or not self.pq.is_empty():
-            # Add all tasks that have arrived by current_time
-            while i < len(tasks) and tasks[i].arrival_time <= current_time:
-                self.pq.insert(tasks[i])
-                i += 1
-
-            if self.pq.is_empty():
-                # If no tasks are available, jump to next arrival time
-                if i < len(tasks):
-                    current_time = tasks[i].arrival_time
+        if self.verbose:
+            print("Starting Scheduler Simulation...")
+        if source is None:
+            self.tasks.sort(key=lambda t: t.arrival_time)
+            source = self.tasks
+        self._reset_statistics()
+
+        pq = self.pq
+        metrics = self.metrics
+        arrivals = iter(source)
+        next_task = next(arrivals, None)
+        events = self._events = []
+        sequence = self._sequence = count()
+        # Worker slots hold (task, finish time, total service time, token) for
+        # the running task, or None when idle. The token lets a completion
+        # event recognise that its task was preempted in the meantime.
+        workers = self._workers = [None] * self.num_workers
+        idle_workers = list(range(self.num_workers - 1, -1, -1))
+        # task_id -> (remaining service time, service time so far) for tasks
+        # that were preempted and are waiting to resume.
+        preempted = self._preempted = {}
+        now = 0.0
+
+        if next_task is not None:
+            heapq.heappush(
+                events, (next_task.arrival_time, ARRIVAL, next(sequence), None)
+            )
+
+        while events:
+            now = events[0][0]
+            if now >= metrics.next_sample_time:
+                metrics.sample_queue_depth(now, len(pq))
+            # Handle every event at this timestamp before dispatching.
+            while events and events[0][0] == now:
+                _, kind, _, data = heapq.heappop(events)
+                if kind == COMPLETION:
+                    worker, token = data
+                    running = workers[worker]
+                    if running is None or running[3] != token:
+                        continue  # Stale: the task was preempted.
+                    workers[worker] = None
+                    idle_workers.append(worker)
+                    self._complete(running[0], now)
+                elif kind == DEADLINE:
+                    if pq.contains(data):
+                        task = pq.cancel(data)
+                        preempted.pop(data, None)
+                        metrics.record_cancel(task)
+                        if self.verbose:
+                            print(
+                                f"--> Task {task.task_id} expired in the queue "
+                                f"at time {now:.2f}"
+                            )
                 else:
+                    # Pull every task arriving at this instant as one batch,
+                    # then schedule only the next arrival.
+                    batch = []
+                    while next_task is not None and next_task.arrival_time <= now:
+                        if next_task.arrival_time < now:
+                            raise ValueError(
+                                f"Task {next_task.task_id} is out of arrival order"
+                            )
+                        batch.append(next_task)
+                        next_task = next(arrivals, None)
+                    metrics.record_arrivals(len(batch))
+                    if len(batch) == 1:
+                        pq.insert(batch[0])
+                    else:
+                        pq.insert_many(batch)
+                    if self.drop_expired:
+                        for task in batch:
+                            if task.deadline is not None:
+                                event = (
+                                    task.deadline,
+                                    DEADLINE,
+                                    next(sequence),
+                                    task.task_id,
+                                )
+                                heapq.heappush(events, event)
+                    if next_task is not None:
+                        heapq.heappush(
+                            events,
+                            (next_task.arrival_time, ARRIVAL, next(sequence), None),
+                        )
+
+            # Dispatch waiting tasks to idle workers, then preempt if allowed.
+            while idle_workers and not pq.is_empty():
+                self._start(pq.extract_max(), idle_workers.pop(), now)
+            while self.preemptive and not pq.is_empty():
+                policy = pq.policy
+                victim = min(
+                    range(self.num_workers), key=lambda w: policy(workers[w][0])
+                )
+                running_task, finish_time, service_total, _ = workers[victim]
+                if policy(pq.peek_top(1)[0]) <= policy(running_task):
                     break
-                continue
+                remaining = finish_time - now
+                preempted[running_task.task_id] = (
+                    remaining,
+                    service_total - remaining,
+                )
+                metrics.record_preemption(running_task)
+                metrics.busy_time -= remaining
+                self._start(pq.extract_max(), victim, now)
+                pq.insert(running_task)
+                if self.verbose:
+                    print(
+                        f"--> Task {running_task.task_id} preempted at time {now:.2f}"
+                    )
 
-            # Extract highest priority task and process it
-            task = self.pq.extract_max()
-            print(f"Time {current_time:.2f}: Processing {task}")
+        metrics.end_time = now
+        if self.verbose:
+            self.print_summary()
 
-            # Simulate processing time of 1 unit
-            current_time += 1
+    def _start(self, task: Task, worker: int, now: float):
+        """Start (or resume) task on worker and schedule its completion."""
+        resumed = self._preempted.pop(task.task_id, None)
+        if resumed is not None:
+            service, service_before = resumed
+        else:
+            service = task.service_time
+            if service is None:
+                service = self._draw_service_time()
+            service_before = 0.0
+            self.metrics.record_dispatch(task, now - task.arrival_time)
+        self.metrics.busy_time += service
 
-            # Check for deadline miss
-            if current_time > task.deadline:
-                print(
-                    f"--> Task {task.task_id} missed its deadline at time {current_time:.2f}"
-                )
+        token = next(self._sequence)
+        finish_time = now + service
+        self._workers[worker] = (task, finish_time, service_before + service, token)
+        heapq.heappush(self._events, (finish_time, COMPLETION, token, (worker, token)))
+        if self.verbose:
+            print(f"Time {now:.2f}: Processing {task}")
+
+    def _complete(self, task: Task, now: float):
+        """Record a finished task."""
+        missed = self.metrics.record_completion(task, now)
+        if missed and self.verbose:
+            print(f"--> Task {task.task_id} missed its deadline at time {now:.2f}")
 
-            self.completed_tasks.append((task, current_time))
+    def _draw_service_time(self) -> float:
+        """Return the processing time for a newly started task."""
+        if callable(self.service_time):
+            return self.service_time(self.rng)
+        return self.service_time
 
-        self.print_summary()
+    def _reset_statistics(self):
+        """Start a fresh SchedulerMetrics before a run."""
+        self.metrics = SchedulerMetrics(
+            record_tasks=self.record_completed, sample_interval=self.sample_interval
+        )
+
+    @property
+    def completed_tasks(self) -> List[Tuple[Task, float]]:
+        """(task, completion time) pairs, kept only with record_completed."""
+        return self.metrics.completed_tasks
+
+    def summary(self) -> dict:
+        """
+        Return aggregate statistics for the last run.
+
+        Wait time is the time from arrival until a task first starts.
+        Utilization is the share of worker time spent processing tasks.
+        The full breakdown (quantiles, per-priority figures, queue depth) is
+        in `metrics`.
+        """
+        metrics = self.metrics
+        return {
+            "arrived": metrics.arrived,
+            "completed": metrics.completed,
+            "missed_deadlines": metrics.missed,
+            "expired": metrics.cancelled,
+            "preemptions": metrics.preempted,
+            "mean_wait": metrics.wait.mean,
+            "end_time": metrics.end_time,
+            "utilization": metrics.utilization(self.num_workers),
+        }
 
     def print_summary(self):
         """
-        Prints a summary of tasks and their wait times.
+        Prints a summary of wait times and deadline misses, with one line per
+        task when completed tasks are recorded.
         """
         print("\n--- Simulation Summary ---")
         for task, completion_time in self.completed_tasks:
@@ -92,9 +333,24 @@ class SchedulerSimulation:
             print(
                 f"Task {task.task_id} with priority {task.priority} waited {wait_time:.2f} seconds."
             )
+        stats = self.summary()
+        print(
+            f"Completed {stats['completed']} tasks by time {stats['end_time']:.2f}: "
+            f"{stats['missed_deadlines']} missed deadlines, {stats['expired']} "
+            f"expired, mean wait {stats['mean_wait']:.2f}."
+        )
+        metrics = self.metrics
+        print(f"Wait: {format_quantiles(metrics.wait)}")
+        print(f"Lateness: {format_quantiles(metrics.lateness)}")
+        for priority, stats in sorted(metrics.by_priority.items(), reverse=True):
+            print(
+                f"Priority {priority}: {stats.completed} completed, "
+                f"{stats.missed} missed, {stats.cancelled} expired, "
+                f"mean wait {stats.wait.mean:.2f}"
+            )
 
 
 if __name__ == "__main__":
-    sim = SchedulerSimulation()
+    sim = SchedulerSimulation(verbose=True, record_completed=True)
     sim.generate_tasks(5)
     sim.run()
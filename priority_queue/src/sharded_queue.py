@@ -0,0 +1,417 @@
+# sharded_queue.py
+
+import itertools
+import multiprocessing
+import queue
+import random
+import threading
+from bisect import bisect_right
+from contextlib import ExitStack
+from typing import Any, Callable, Iterable, Optional, Union
+from .policies import Policy
+from .priority_queue import PriorityQueue, Task
+
+ASSIGNMENTS = ("hash", "round_robin")
+SELECTIONS = ("two_choice", "top_of_shards")
+
+
+class ShardedPriorityQueue:
+    """
+    Priority queue split into K PriorityQueue shards, each behind its own
+    lock, so concurrent producers and consumers mostly touch different locks.
+
+    Tasks go to a shard by task_id hash or round-robin. extract_max returns
+    an approximate global maximum:
+
+    - "two_choice" (the MultiQueue scheme) peeks at the roots of two random
+      shards and extracts the better one. It takes two locks regardless of K,
+      and the rank error (how many queued tasks rank above the extracted one)
+      stays O(K) in expectation.
+    - "top_of_shards" compares the roots of all K shards and extracts the
+      best, which is exact when no other thread interleaves, at the cost of K
+      peeks per extraction.
+
+    extract_from(shard) serves a worker that owns one shard; with
+    work_stealing it refills an empty shard by moving the top half of the
+    fullest shard into it.
+
+    Args:
+        num_shards (int): Number of shards (K).
+        assignment (str): "hash" (task_id modulo K) or "round_robin".
+        selection (str): "two_choice" or "top_of_shards".
+        work_stealing (bool): Let extract_from steal from other shards.
+        arity (int): Arity of each shard's heap.
+        policy (str or callable): Ordering policy shared by all shards.
+        seed (Optional[int]): Seed for two-choice sampling.
+    """
+
+    def __init__(
+        self,
+        num_shards: int = 4,
+        assignment: str = "hash",
+        selection: str = "two_choice",
+        work_stealing: bool = True,
+        arity: int = 2,
+        policy: Optional[Union[str, Policy]] = None,
+        seed: Optional[int] = None,
+    ):
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        if assignment not in ASSIGNMENTS:
+            raise ValueError(f"assignment must be one of {', '.join(ASSIGNMENTS)}")
+        if selection not in SELECTIONS:
+            raise ValueError(f"selection must be one of {', '.join(SELECTIONS)}")
+        self.num_shards = num_shards
+        self.assignment = assignment
+        self.selection = selection
+        self.work_stealing = work_stealing
+        self.shards = [
+            PriorityQueue(arity=arity, policy=policy) for _ in range(num_shards)
+        ]
+        self.locks = [threading.Lock() for _ in range(num_shards)]
+        self.policy = self.shards[0].policy
+        self.rng = random.Random(seed)
+        self.steals = 0
+        # Round-robin placement cannot be recomputed from the id, so it is
+        # recorded. next() on itertools.count is atomic under the GIL.
+        self._round_robin = itertools.count()
+        self._owner: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def is_empty(self) -> bool:
+        """Return True if every shard is empty."""
+        return all(shard.is_empty() for shard in self.shards)
+
+    def shard_of(self, task_id: int) -> Optional[int]:
+        """Return the index of the shard that holds (or would hold) task_id."""
+        if self.assignment == "hash":
+            return hash(task_id) % self.num_shards
+        return self._owner.get(task_id)
+
+    def insert(self, task: Task):
+        """
+        Insert a task into its shard.
+        Time complexity: O(log(n / K))
+        """
+        if self.assignment == "hash":
+            index = hash(task.task_id) % self.num_shards
+        else:
+            if task.task_id in self._owner:
+                raise ValueError(f"Task with id {task.task_id} already in queue")
+            index = next(self._round_robin) % self.num_shards
+            self._owner[task.task_id] = index
+        with self.locks[index]:
+            self.shards[index].insert(task)
+
+    def insert_many(self, tasks: Iterable[Task]):
+        """
+        Insert a batch of tasks, taking each shard's lock once.
+
+        The whole batch is checked before anything is inserted (with
+        round-robin assignment, before any owner is recorded), so a rejected
+        batch leaves the queue unchanged.
+        """
+        tasks = list(tasks)
+        task_ids = {task.task_id for task in tasks}
+        if len(task_ids) != len(tasks):
+            raise ValueError("Task ids must be unique")
+        batches: list[list[Task]] = [[] for _ in range(self.num_shards)]
+        if self.assignment == "hash":
+            for task in tasks:
+                batches[hash(task.task_id) % self.num_shards].append(task)
+        else:
+            if not task_ids.isdisjoint(self._owner):
+                raise ValueError("Task ids must be unique")
+            for task in tasks:
+                index = next(self._round_robin) % self.num_shards
+                self._owner[task.task_id] = index
+                batches[index].append(task)
+        indices = [index for index, batch in enumerate(batches) if batch]
+        with ExitStack() as stack:
+            # Locks are taken in index order, so concurrent batches cannot
+            # deadlock; every other method holds one lock at a time.
+            for index in indices:
+                stack.enter_context(self.locks[index])
+            if self.assignment == "hash" and any(
+                self.shards[index].contains(task.task_id)
+                for index in indices
+                for task in batches[index]
+            ):
+                raise ValueError("Task ids must be unique")
+            for index in indices:
+                self.shards[index].insert_many(batches[index])
+
+    def extract_max(self) -> Optional[Task]:
+        """
+        Remove and return an approximately highest-priority task, or None if
+        every shard is empty.
+        Time complexity: O(log(n / K)) for two_choice, O(K + log(n / K)) for
+        top_of_shards
+        """
+        num_shards = self.num_shards
+        while True:
+            if self.selection == "top_of_shards" or num_shards == 1:
+                candidates = range(num_shards)
+            else:
+                candidates = self.rng.sample(range(num_shards), 2)
+            best = self._best_root(candidates)
+            if best is None and self.selection == "two_choice":
+                # Both samples were empty; fall back to any non-empty shard.
+                best = self._best_root(range(num_shards))
+            if best is None:
+                return None
+            with self.locks[best]:
+                task = self.shards[best].extract_max()
+            if task is not None:
+                self._forget(task.task_id)
+                return task
+            # Another consumer emptied the shard in the meantime; retry.
+
+    def extract_from(self, index: int) -> Optional[Task]:
+        """
+        Remove and return the highest-priority task of shard index. If the
+        shard is empty and work stealing is on, first move the top half of
+        the fullest other shard into it.
+        """
+        with self.locks[index]:
+            task = self.shards[index].extract_max()
+        if task is None and self.work_stealing and self.steal(index):
+            with self.locks[index]:
+                task = self.shards[index].extract_max()
+        if task is not None:
+            self._forget(task.task_id)
+        return task
+
+    def steal(self, thief: int, victim: Optional[int] = None) -> int:
+        """
+        Move the top half of shard victim (the fullest other shard by
+        default) into shard thief. Returns the number of tasks moved.
+        """
+        if victim is None:
+            others = [i for i in range(self.num_shards) if i != thief]
+            if not others:
+                return 0
+            victim = max(others, key=lambda i: len(self.shards[i]))
+        with self.locks[victim]:
+            victim_shard = self.shards[victim]
+            stolen = victim_shard.extract_many((len(victim_shard) + 1) // 2)
+        if not stolen:
+            return 0
+        with self.locks[thief]:
+            self.shards[thief].insert_many(stolen)
+        if self.assignment == "round_robin":
+            for task in stolen:
+                self._owner[task.task_id] = thief
+        self.steals += 1
+        return len(stolen)
+
+    def contains(self, task_id: int) -> bool:
+        """Return True if a task with task_id is queued."""
+        index = self._find_shard(task_id)
+        return index is not None
+
+    def cancel(self, task_id: int) -> Task:
+        """Cancel the task with task_id (a tombstone in its shard)."""
+        index = self._find_shard(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        with self.locks[index]:
+            task = self.shards[index].cancel(task_id)
+        self._forget(task_id)
+        return task
+
+    def update_priority(self, task_id: int, new_priority: int):
+        """Set the priority of a task by task_id."""
+        index = self._find_shard(task_id)
+        if index is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        with self.locks[index]:
+            self.shards[index].update_priority(task_id, new_priority)
+
+    def _find_shard(self, task_id: int) -> Optional[int]:
+        """Shard index of a queued task, or None. Scans shards after a steal."""
+        index = self.shard_of(task_id)
+        if index is not None and self.shards[index].contains(task_id):
+            return index
+        if self.steals:
+            for index, shard in enumerate(self.shards):
+                if shard.contains(task_id):
+                    return index
+        return None
+
+    def _forget(self, task_id: int):
+        if self.assignment == "round_robin":
+            self._owner.pop(task_id, None)
+
+    def _best_root(self, candidates: Iterable[int]) -> Optional[int]:
+        """Index of the candidate shard whose root has the largest key."""
+        best = None
+        best_key = None
+        for index in candidates:
+            with self.locks[index]:
+                shard = self.shards[index]
+                if shard.peek_max() is None:
+                    continue
+                key = shard.keys[0]
+            if best is None or key > best_key:
+                best = index
+                best_key = key
+        return best
+
+
+def rank_error(queued_keys: list, key) -> int:
+    """
+    Number of keys in queued_keys (sorted ascending) strictly greater than
+    key: 0 means the extracted task was a true maximum.
+    """
+    return len(queued_keys) - bisect_right(queued_keys, key)
+
+
+def _shard_worker(
+    index: int,
+    tasks: list[Task],
+    handler: Callable[[Task], Any],
+    policy: Optional[Union[str, Policy]],
+    inboxes: list,
+    requests,
+    idle,
+    num_workers: int,
+    work_stealing: bool,
+    check_every: int,
+) -> tuple[int, int, int, list]:
+    """
+    Process one shard in priority order (see run_sharded). Returns the worker
+    index, the number of tasks processed, the number of donations received,
+    and the handler results in processing order.
+    """
+    pq = PriorityQueue.from_tasks(tasks, policy=policy)
+    results = []
+    received = 0
+    while True:
+        processed_since_check = 0
+        while not pq.is_empty():
+            results.append(handler(pq.extract_max()))
+            processed_since_check += 1
+            if work_stealing and processed_since_check >= check_every:
+                processed_since_check = 0
+                _serve_steal_request(pq, inboxes, requests, idle)
+
+        if not work_stealing:
+            return index, len(results), received, results
+
+        # Out of work: register as idle and ask for a donation.
+        with idle.get_lock():
+            idle.value += 1
+        requests.put(index)
+        while True:
+            try:
+                donation = inboxes[index].get(timeout=0.01)
+            except queue.Empty:
+                if idle.value == num_workers:
+                    return index, len(results), received, results
+                continue
+            # The donor already took this worker off the idle count.
+            pq.insert_many(donation)
+            received += 1
+            break
+
+
+def _serve_steal_request(pq: PriorityQueue, inboxes: list, requests, idle):
+    """Hand the top half of pq to one waiting idle worker, if any."""
+    try:
+        thief = requests.get_nowait()
+    except queue.Empty:
+        return
+    if len(pq) < 2:
+        requests.put(thief)
+        return
+    donation = pq.extract_many(len(pq) // 2)
+    # Count the thief as busy before the tasks are in flight, so the idle
+    # count can only reach num_workers when no work is left anywhere.
+    with idle.get_lock():
+        idle.value -= 1
+    inboxes[thief].put(donation)
+
+
+class _SharedCounter:
+    """A manager Value and Lock with the get_lock()/value API of mp.Value."""
+
+    def __init__(self, value, lock):
+        self._value = value
+        self._lock = lock
+
+    def get_lock(self):
+        return self._lock
+
+    @property
+    def value(self) -> int:
+        return self._value.value
+
+    @value.setter
+    def value(self, new_value: int):
+        self._value.value = new_value
+
+
+def run_sharded(
+    tasks: Iterable[Task],
+    handler: Callable[[Task], Any],
+    num_workers: int = 4,
+    assignment: str = "hash",
+    work_stealing: bool = True,
+    policy: Optional[Union[str, Policy]] = None,
+    check_every: int = 64,
+) -> list[tuple[int, int, int, list]]:
+    """
+    Process tasks on num_workers processes, one PriorityQueue shard each.
+
+    Tasks are split into shards by task_id hash or round-robin, and every
+    worker handles its own shard in priority order, calling handler(task)
+    (a picklable, module-level function). With work_stealing, a worker that
+    runs out of tasks posts a request; a busy worker checks for requests every
+    check_every tasks and sends the top half of its queue to the requester.
+
+    Returns:
+        list: One (worker index, tasks processed, donations received, handler
+        results) tuple per worker, in worker order.
+    """
+    if num_workers < 1:
+        raise ValueError("num_workers must be at least 1")
+    if assignment not in ASSIGNMENTS:
+        raise ValueError(f"assignment must be one of {', '.join(ASSIGNMENTS)}")
+    shards: list[list[Task]] = [[] for _ in range(num_workers)]
+    for position, task in enumerate(tasks):
+        if assignment == "hash":
+            shards[hash(task.task_id) % num_workers].append(task)
+        else:
+            shards[position % num_workers].append(task)
+
+    context = multiprocessing.get_context()
+    manager = context.Manager()
+    with manager:
+        inboxes = [manager.Queue() for _ in range(num_workers)]
+        requests = manager.Queue()
+        idle = manager.Value("i", 0)
+        lock = manager.Lock()
+        shared_idle = _SharedCounter(idle, lock)
+        with context.Pool(num_workers) as pool:
+            pending = [
+                pool.apply_async(
+                    _shard_worker,
+                    (
+                        index,
+                        shards[index],
+                        handler,
+                        policy,
+                        inboxes,
+                        requests,
+                        shared_idle,
+                        num_workers,
+                        work_stealing,
+                        check_every,
+                    ),
+                )
+                for index in range(num_workers)
+            ]
+            return [result.get() for result in pending]
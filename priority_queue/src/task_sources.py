@@ -0,0 +1,180 @@
+# task_sources.py
+
+import csv
+import json
+import math
+import random
+from typing import Callable, Iterable, Iterator, Optional, Union
+from .priority_queue import Task
+
+# A task source is any iterable of Tasks in non-decreasing arrival order.
+# SchedulerSimulation.run pulls from it only as simulated time reaches each
+# arrival, so a generator over a trace file keeps just the live backlog in
+# memory, however long the trace is.
+TaskSource = Iterable[Task]
+
+TRACE_FIELDS = ("task_id", "priority", "arrival", "deadline", "service_time")
+
+
+def random_tasks(
+    num_tasks: int,
+    horizon: float = 10.0,
+    seed: Optional[int] = None,
+    service_time: Optional[Union[float, Callable[[random.Random], float]]] = None,
+    first_id: int = 1,
+) -> Iterator[Task]:
+    """
+    Generate random tasks lazily, in arrival order.
+
+    Priorities (1-10) and deadlines (arrival + 5-15) are drawn as in
+    SchedulerSimulation.generate_tasks, but arrivals form a Poisson process
+    with num_tasks / horizon arrivals per time unit, so no task has to be
+    generated before the previous one has arrived.
+
+    Args:
+        num_tasks (int): Number of tasks to generate.
+        horizon (float): Expected arrival time of the last task.
+        seed (Optional[int]): Seed for the generator.
+        service_time (float or callable): Service time attached to each task,
+            a constant or a function of a random.Random. None leaves it unset,
+            so the simulation draws it when the task starts.
+        first_id (int): task_id of the first task.
+    """
+    rng = random.Random(seed)
+    rate = num_tasks / horizon if horizon > 0 else math.inf
+    arrival_time = 0.0
+    for task_id in range(first_id, first_id + num_tasks):
+        if rate != math.inf:
+            arrival_time += rng.expovariate(rate)
+        priority = rng.randint(1, 10)
+        deadline = arrival_time + rng.uniform(5, 15)
+        if callable(service_time):
+            service = service_time(rng)
+        else:
+            service = service_time
+        yield Task(
+            priority=priority,
+            task_id=task_id,
+            arrival_time=arrival_time,
+            deadline=deadline,
+            service_time=service,
+        )
+
+
+def _optional_float(value) -> Optional[float]:
+    """Parse a trace field that may be empty or missing."""
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _check_order(tasks: Iterator[Task], source: str) -> Iterator[Task]:
+    """Pass tasks through, raising ValueError if arrivals go backwards."""
+    last_arrival = -math.inf
+    for line_number, task in enumerate(tasks, start=1):
+        if task.arrival_time < last_arrival:
+            raise ValueError(
+                f"{source}: task {task.task_id} (record {line_number}) arrives at "
+                f"{task.arrival_time}, before the previous task ({last_arrival}); "
+                "traces must be sorted by arrival"
+            )
+        last_arrival = task.arrival_time
+        yield task
+
+
+def csv_tasks(path: str) -> Iterator[Task]:
+    """
+    Stream tasks from a CSV trace with a header row naming the columns
+    task_id, priority, arrival, deadline and service_time (in any order;
+    deadline and service_time may be left empty). Rows must be sorted by
+    arrival. The file is read one row at a time.
+    """
+
+    def parse() -> Iterator[Task]:
+        with open(path, newline="") as trace:
+            reader = csv.reader(trace)
+            header = next(reader, None)
+            if header is None:
+                return
+            column = {name.strip(): i for i, name in enumerate(header)}
+            missing = {"task_id", "priority", "arrival"} - column.keys()
+            if missing:
+                raise ValueError(f"{path}: missing columns {sorted(missing)}")
+            id_col = column["task_id"]
+            priority_col = column["priority"]
+            arrival_col = column["arrival"]
+            deadline_col = column.get("deadline")
+            service_col = column.get("service_time")
+            for row in reader:
+                if not row:
+                    continue
+                deadline = row[deadline_col] if deadline_col is not None else None
+                service = row[service_col] if service_col is not None else None
+                yield Task(
+                    priority=int(row[priority_col]),
+                    task_id=int(row[id_col]),
+                    arrival_time=float(row[arrival_col]),
+                    deadline=_optional_float(deadline),
+                    service_time=_optional_float(service),
+                )
+
+    return _check_order(parse(), path)
+
+
+def jsonl_tasks(path: str) -> Iterator[Task]:
+    """
+    Stream tasks from a JSON Lines trace, one object per line with the keys
+    task_id, priority, arrival and optionally deadline and service_time
+    (null or absent for none). Lines must be sorted by arrival.
+    """
+
+    def parse() -> Iterator[Task]:
+        with open(path) as trace:
+            for line in trace:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                yield Task(
+                    priority=int(record["priority"]),
+                    task_id=int(record["task_id"]),
+                    arrival_time=float(record["arrival"]),
+                    deadline=_optional_float(record.get("deadline")),
+                    service_time=_optional_float(record.get("service_time")),
+                )
+
+    return _check_order(parse(), path)
+
+
+def _trace_record(task: Task) -> tuple:
+    return (
+        task.task_id,
+        task.priority,
+        task.arrival_time,
+        task.deadline,
+        task.service_time,
+    )
+
+
+def write_csv_trace(tasks: Iterable[Task], path: str) -> int:
+    """Write tasks as a CSV trace readable by csv_tasks. Returns the row count."""
+    count = 0
+    with open(path, "w", newline="") as trace:
+        writer = csv.writer(trace)
+        writer.writerow(TRACE_FIELDS)
+        for task in tasks:
+            writer.writerow(
+                ["" if value is None else value for value in _trace_record(task)]
+            )
+            count += 1
+    return count
+
+
+def write_jsonl_trace(tasks: Iterable[Task], path: str) -> int:
+    """Write tasks as a JSONL trace readable by jsonl_tasks. Returns the row count."""
+    count = 0
+    with open(path, "w") as trace:
+        for task in tasks:
+            trace.write(json.dumps(dict(zip(TRACE_FIELDS, _trace_record(task)))))
+            trace.write("\n")
+            count += 1
+    return count
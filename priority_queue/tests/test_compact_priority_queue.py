@@ -0,0 +1,116 @@
+import random
+import unittest
+from src import compact_priority_queue, priority_queue
+
+
+class TestCompactPriorityQueue(unittest.TestCase):
+
+    def assert_heap_invariants(self, pq):
+        for i, task_id in enumerate(pq.task_ids):
+            self.assertEqual(pq.task_index_map[task_id], i)
+            if i > 0:
+                parent = (i - 1) // pq.arity
+                self.assertLessEqual(pq.priorities[i], pq.priorities[parent])
+        self.assertEqual(len(pq.task_index_map), len(pq.task_ids))
+
+    def test_insert_and_extract_max(self):
+        pq = compact_priority_queue.CompactPriorityQueue()
+        pq.insert(priority_queue.Task(priority=3, task_id=1))
+        pq.insert(priority_queue.Task(priority=5, task_id=2, arrival_time=1.5))
+        pq.insert(priority_queue.Task(priority=1, task_id=3, deadline=9.0))
+
+        first = pq.extract_max()
+        self.assertEqual((first.priority, first.task_id), (5, 2))
+        self.assertEqual(first.arrival_time, 1.5)
+        self.assertIsNone(first.deadline)
+        self.assertEqual(pq.extract_max().priority, 3)
+        last = pq.extract_max()
+        self.assertIsNone(last.arrival_time)
+        self.assertEqual(last.deadline, 9.0)
+        self.assertIsNone(pq.extract_max())
+        self.assertTrue(pq.is_empty())
+
+    def test_key_updates(self):
+        pq = compact_priority_queue.CompactPriorityQueue()
+        pq.insert(priority_queue.Task(priority=3, task_id=1))
+        pq.insert(priority_queue.Task(priority=2, task_id=2))
+        pq.insert(priority_queue.Task(priority=7, task_id=3))
+
+        pq.increase_key(2, 8)
+        pq.decrease_key(3, 1)
+        self.assertEqual([t.task_id for t in pq.extract_many(3)], [2, 1, 3])
+
+        pq.insert(priority_queue.Task(priority=3, task_id=1))
+        with self.assertRaises(ValueError):
+            pq.increase_key(1, 1)
+        with self.assertRaises(ValueError):
+            pq.decrease_key(1, 10)
+        with self.assertRaises(ValueError):
+            pq.update_priority(5, 10)
+        with self.assertRaises(ValueError):
+            pq.insert(priority_queue.Task(priority=4, task_id=1))
+
+    def test_matches_priority_queue(self):
+        for arity in (2, 4):
+            with self.subTest(arity=arity):
+                rng = random.Random(arity)
+                tasks = [
+                    priority_queue.Task(
+                        priority=rng.randint(0, 40),
+                        task_id=task_id,
+                        arrival_time=float(task_id),
+                        deadline=task_id + 10.0,
+                    )
+                    for task_id in range(300)
+                ]
+                pq = compact_priority_queue.CompactPriorityQueue.from_tasks(
+                    tasks[:100], arity=arity
+                )
+                self.assert_heap_invariants(pq)
+                pq.insert_many(tasks[100:120])
+                pq.insert_many(tasks[120:])
+                for task_id in rng.sample(range(300), 50):
+                    pq.update_priority(task_id, rng.randint(0, 40))
+                for task_id in rng.sample(range(300), 50):
+                    removed = pq.remove(task_id)
+                    self.assertEqual(removed.task_id, task_id)
+                    self.assertFalse(pq.contains(task_id))
+                self.assert_heap_invariants(pq)
+
+                some_id = pq.task_ids[len(pq) // 2]
+                self.assertEqual(pq.get(some_id).task_id, some_id)
+                self.assertIsNone(pq.get(-1))
+
+                peeked = [task.priority for task in pq.peek_top(20)]
+                extracted = pq.extract_many(250)
+                priorities = [task.priority for task in extracted]
+                self.assertEqual(peeked, priorities[:20])
+                self.assertEqual(priorities, sorted(priorities, reverse=True))
+                for task in extracted:
+                    self.assertEqual(task.deadline, task.arrival_time + 10.0)
+
+    def test_cancel(self):
+        pq = compact_priority_queue.CompactPriorityQueue.from_tasks(
+            (priority_queue.Task(priority=i % 7, task_id=i) for i in range(100)),
+            max_dead_fraction=0.25,
+        )
+        self.assertEqual(pq.cancel(3).task_id, 3)
+        self.assertFalse(pq.contains(3))
+        self.assertEqual((pq.live_count, pq.dead_count), (99, 1))
+        pq.insert(priority_queue.Task(priority=50, task_id=3))
+        self.assertEqual(pq.dead_count, 0)
+
+        for task_id in range(0, 100, 2):
+            pq.cancel(task_id)
+        self.assertGreaterEqual(pq.compactions, 1)
+        self.assertEqual(len(pq), 50)
+        self.assert_heap_invariants(pq)
+
+        remaining = pq.extract_many(100)
+        self.assertEqual(remaining[0].task_id, 3)
+        self.assertEqual(sorted(t.task_id for t in remaining), list(range(1, 100, 2)))
+        self.assertIsNone(pq.extract_max())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+import unittest
+from src import compact_priority_queue, concurrent_priority_queue, priority_queue
+
+
+class TestThreadSafePriorityQueue(unittest.TestCase):
+
+    def test_put_and_get_in_priority_order(self):
+        pq = concurrent_priority_queue.ThreadSafePriorityQueue()
+        pq.put(priority_queue.Task(priority=3, task_id=1))
+        pq.put_many(
+            [
+                priority_queue.Task(priority=5, task_id=2),
+                priority_queue.Task(priority=1, task_id=3),
+            ]
+        )
+        pq.increase_key(3, 9)
+        pq.decrease_key(2, 2)
+
+        self.assertEqual([pq.get().task_id for _ in range(3)], [3, 1, 2])
+        self.assertIsNone(pq.get(block=False))
+
+    def test_get_timeout(self):
+        pq = concurrent_priority_queue.ThreadSafePriorityQueue()
+        start_time = time.monotonic()
+        self.assertIsNone(pq.get(timeout=0.05))
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.05)
+
+    def test_blocked_consumer_is_woken(self):
+        pq = concurrent_priority_queue.ThreadSafePriorityQueue(
+            compact_priority_queue.CompactPriorityQueue()
+        )
+        received = []
+        consumer = threading.Thread(target=lambda: received.append(pq.get()))
+        consumer.start()
+        time.sleep(0.02)
+        pq.put(priority_queue.Task(priority=4, task_id=7))
+        consumer.join(timeout=5)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(received[0].task_id, 7)
+
+    def test_producers_and_consumers(self):
+        pq = concurrent_priority_queue.ThreadSafePriorityQueue()
+        received = []
+        received_lock = threading.Lock()
+
+        def produce(offset):
+            for i in range(500):
+                pq.put(priority_queue.Task(priority=i % 17, task_id=offset + i))
+
+        def consume():
+            while True:
+                task = pq.get()
+                if task is None:
+                    return
+                with received_lock:
+                    received.append(task.task_id)
+
+        producers = [
+            threading.Thread(target=produce, args=(n * 500,)) for n in range(4)
+        ]
+        consumers = [threading.Thread(target=consume) for _ in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        pq.close()
+        for thread in consumers:
+            thread.join(timeout=5)
+
+        self.assertEqual(sorted(received), list(range(2000)))
+        with self.assertRaises(ValueError):
+            pq.put(priority_queue.Task(priority=1, task_id=5000))
+
+
+class TestAsyncPriorityQueue(unittest.TestCase):
+
+    def test_get_waits_for_put(self):
+        async def scenario():
+            pq = concurrent_priority_queue.AsyncPriorityQueue()
+            getter = asyncio.create_task(pq.get())
+            await asyncio.sleep(0)
+            self.assertFalse(getter.done())
+
+            await pq.put(priority_queue.Task(priority=2, task_id=1))
+            await pq.put(priority_queue.Task(priority=6, task_id=2))
+            pq.increase_key(1, 8)
+            first = await getter
+            second = await pq.get()
+            return first.task_id, second.task_id
+
+        self.assertEqual(asyncio.run(scenario()), (1, 2))
+
+    def test_cancelled_getter_does_not_lose_wakeup(self):
+        async def scenario():
+            pq = concurrent_priority_queue.AsyncPriorityQueue()
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(pq.get(), timeout=0.01)
+
+            waiting = asyncio.create_task(pq.get())
+            await asyncio.sleep(0)
+            pq.put_nowait(priority_queue.Task(priority=1, task_id=1))
+            return await asyncio.wait_for(waiting, timeout=1)
+
+        self.assertEqual(asyncio.run(scenario()).task_id, 1)
+
+    def test_close_wakes_consumers(self):
+        async def scenario():
+            pq = concurrent_priority_queue.AsyncPriorityQueue()
+            consumers = [asyncio.create_task(pq.get()) for _ in range(3)]
+            await asyncio.sleep(0)
+            pq.put_many([priority_queue.Task(priority=1, task_id=1)])
+            pq.close()
+            return await asyncio.gather(*consumers)
+
+        results = asyncio.run(scenario())
+        self.assertEqual(sum(task is not None for task in results), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
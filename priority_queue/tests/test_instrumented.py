@@ -0,0 +1,61 @@
+import os
+import random
+import tempfile
+import unittest
+from src.instrumented import CountingPriorityQueue, SiftCounts
+from src.priority_queue import PriorityQueue, Task
+
+
+class TestCountingPriorityQueue(unittest.TestCase):
+
+    def tasks(self, count):
+        rng = random.Random(0)
+        return [
+            Task(priority=rng.randint(0, 50), task_id=i, arrival_time=float(i))
+            for i in range(count)
+        ]
+
+    def test_same_order_as_priority_queue(self):
+        tasks = self.tasks(500)
+        for arity in (2, 4):
+            counting = CountingPriorityQueue.from_tasks(
+                tasks, arity=arity, policy="priority_fifo"
+            )
+            plain = PriorityQueue.from_tasks(tasks, arity=arity, policy="priority_fifo")
+            counting.increase_key(10, 100)
+            plain.increase_key(10, 100)
+            counting.cancel(20)
+            plain.cancel(20)
+            self.assertEqual(
+                [task.task_id for task in counting.extract_many(len(tasks))],
+                [task.task_id for task in plain.extract_many(len(tasks))],
+            )
+
+    def test_counts(self):
+        pq = CountingPriorityQueue()
+        pq.insert(Task(priority=1, task_id=1))
+        self.assertEqual(pq.reset_counts(), SiftCounts(sifts=1, comparisons=0, moves=1))
+        pq.insert(Task(priority=2, task_id=2))
+        # One comparison with the root, which moves down, then the new task
+        # is written at the root.
+        self.assertEqual(pq.counts, SiftCounts(sifts=1, comparisons=1, moves=2))
+
+        pq = CountingPriorityQueue.from_tasks(self.tasks(1000))
+        build = pq.reset_counts()
+        self.assertEqual(build.sifts, 500)
+        self.assertLess(build.comparisons, 2 * 1000)
+        pq.extract_many(1000)
+        self.assertGreater(pq.counts.comparisons, 1000 * 9)
+        self.assertEqual(pq.counts.sifts, 999)
+
+    def test_snapshot_records_policy(self):
+        pq = CountingPriorityQueue.from_tasks(self.tasks(10), policy="priority_fifo")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "queue.snapshot")
+            pq.snapshot(path)
+            restored = CountingPriorityQueue.restore(path)
+        self.assertEqual(restored.peek_max(), pq.peek_max())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import csv
+import json
+import math
+import os
+import random
+import tempfile
+import unittest
+from src import metrics, scheduler_simulation
+from src.priority_queue import Task
+
+
+class TestStreamingHistogram(unittest.TestCase):
+
+    def test_quantiles_within_relative_error(self):
+        rng = random.Random(1)
+        values = [rng.lognormvariate(0, 2) for _ in range(20_000)]
+        histogram = metrics.StreamingHistogram(relative_error=0.01)
+        for value in values:
+            histogram.add(value)
+
+        values.sort()
+        for q in (0.01, 0.5, 0.9, 0.99, 0.999):
+            exact = values[math.ceil(q * len(values)) - 1]
+            self.assertLessEqual(abs(histogram.quantile(q) - exact), 0.01 * exact)
+        self.assertEqual(histogram.quantile(1.0), values[-1])
+        self.assertAlmostEqual(histogram.mean, sum(values) / len(values))
+        # Bounded by the value range, not the number of values.
+        self.assertLess(len(histogram.buckets), 1_000)
+
+    def test_zero_bucket_and_merge(self):
+        left = metrics.StreamingHistogram()
+        right = metrics.StreamingHistogram()
+        for value in (0.0, 0.0, 0.0, 5.0):
+            left.add(value)
+        for value in (10.0, 10.0):
+            right.add(value)
+        left.merge(right)
+
+        self.assertEqual(left.count, 6)
+        self.assertEqual(left.quantile(0.5), 0.0)
+        self.assertAlmostEqual(left.quantile(0.9), 10.0, delta=0.1)
+        self.assertEqual((left.min, left.max), (0.0, 10.0))
+        with self.assertRaises(ValueError):
+            left.merge(metrics.StreamingHistogram(relative_error=0.05))
+
+
+class TestSchedulerMetrics(unittest.TestCase):
+
+    def test_queue_depth_samples_stay_bounded(self):
+        collector = metrics.SchedulerMetrics(sample_interval=1.0, max_samples=64)
+        for step in range(10_000):
+            collector.sample_queue_depth(step * 0.5, step)
+
+        samples = collector.queue_depth
+        self.assertLess(len(samples), 64)
+        times = [time for time, _ in samples]
+        self.assertEqual(times, sorted(times))
+        self.assertGreater(times[-1], 4_000)
+        self.assertGreater(collector.sample_interval, 1.0)
+
+    def test_simulation_metrics_and_export(self):
+        sim = scheduler_simulation.SchedulerSimulation(
+            num_workers=2,
+            service_time=scheduler_simulation.exponential_service(1.0),
+            drop_expired=True,
+            seed=3,
+        )
+        sim.generate_tasks(2_000, horizon=900.0)
+        sim.run()
+        collector = sim.metrics
+
+        self.assertEqual(sim.completed_tasks, [])
+        self.assertEqual(collector.arrived, 2_000)
+        self.assertEqual(collector.completed + collector.cancelled, 2_000)
+        self.assertEqual(
+            sum(stats.completed for stats in collector.by_priority.values()),
+            collector.completed,
+        )
+        self.assertEqual(collector.lateness.count, collector.completed)
+        self.assertGreater(len(collector.queue_depth), 100)
+        self.assertEqual(sim.summary()["missed_deadlines"], collector.missed)
+
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "metrics.json")
+            csv_path = os.path.join(directory, "metrics.csv")
+            collector.write_json(json_path)
+            collector.write_csv(csv_path)
+            with open(json_path) as source:
+                data = json.load(source)
+            with open(csv_path, newline="") as source:
+                rows = list(csv.DictReader(source))
+
+        self.assertEqual(data["counters"]["completed"], collector.completed)
+        self.assertEqual(set(data["by_priority"]), {str(p) for p in range(1, 11)})
+        values = {(row["metric"], row["priority"]): row["value"] for row in rows}
+        self.assertEqual(int(values[("missed", "all")]), collector.missed)
+        self.assertAlmostEqual(
+            float(values[("wait_p99", "all")]), collector.wait.quantile(0.99)
+        )
+
+    def test_task_retention_is_opt_in(self):
+        collector = metrics.SchedulerMetrics(record_tasks=True)
+        task = Task(priority=1, task_id=1, arrival_time=0.0, deadline=1.0)
+        self.assertTrue(collector.record_completion(task, 2.5))
+        self.assertEqual(collector.completed_tasks, [(task, 2.5)])
+        self.assertAlmostEqual(collector.lateness.max, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import random
+import unittest
+from src import pairing_heap
+from src.priority_queue import Task
+
+
+def assert_heap_order(test, heap):
+    """Every node's key is at least its children's, and prev links agree."""
+    test.assertTrue(heap.root is None or heap.root.prev is None)
+    count = 0
+    stack = [heap.root] if heap.root is not None else []
+    while stack:
+        node = stack.pop()
+        count += 1
+        test.assertIs(heap.nodes[node.task.task_id], node)
+        child = node.child
+        previous = node
+        while child is not None:
+            test.assertLessEqual(child.key, node.key)
+            test.assertIs(child.prev, previous)
+            stack.append(child)
+            previous = child
+            child = child.sibling
+    test.assertEqual(count, len(heap))
+
+
+class TestPairingHeap(unittest.TestCase):
+
+    def test_insert_and_extract_max(self):
+        heap = pairing_heap.PairingHeap()
+        for task_id, priority in enumerate([3, 5, 1, 4]):
+            heap.insert(Task(priority=priority, task_id=task_id))
+
+        self.assertEqual(heap.peek_max().priority, 5)
+        self.assertEqual([t.priority for t in heap.extract_many(4)], [5, 4, 3, 1])
+        self.assertIsNone(heap.extract_max())
+        self.assertTrue(heap.is_empty())
+
+    def test_key_changes_and_remove(self):
+        heap = pairing_heap.PairingHeap()
+        for i in range(10):
+            heap.insert(Task(priority=i, task_id=i))
+
+        heap.increase_key(2, 20)
+        heap.decrease_key(9, 0)
+        heap.update_priority(5, 15)
+        self.assertEqual(heap.remove(7).task_id, 7)
+        with self.assertRaises(ValueError):
+            heap.increase_key(3, 1)
+        with self.assertRaises(ValueError):
+            heap.decrease_key(3, 4)
+        with self.assertRaises(ValueError):
+            heap.remove(7)
+        with self.assertRaises(ValueError):
+            heap.insert(Task(priority=1, task_id=2))
+
+        order = [task.task_id for task in heap.extract_many(len(heap))]
+        self.assertEqual(order[:7], [2, 5, 8, 6, 4, 3, 1])
+        self.assertEqual(set(order[7:]), {0, 9})
+
+    def test_meld(self):
+        left = pairing_heap.PairingHeap.from_tasks(
+            Task(priority=i, task_id=i) for i in range(0, 100, 2)
+        )
+        right = pairing_heap.PairingHeap.from_tasks(
+            Task(priority=i, task_id=i) for i in range(1, 100, 2)
+        )
+        left.meld(right)
+
+        self.assertTrue(right.is_empty())
+        self.assertEqual(len(left), 100)
+        assert_heap_order(self, left)
+        self.assertEqual(
+            [t.priority for t in left.extract_many(100)], list(range(99, -1, -1))
+        )
+
+        clash = pairing_heap.PairingHeap.from_tasks([Task(priority=1, task_id=1)])
+        other = pairing_heap.PairingHeap.from_tasks([Task(priority=2, task_id=1)])
+        with self.assertRaises(ValueError):
+            clash.meld(other)
+        self.assertEqual((len(clash), len(other)), (1, 1))
+        with self.assertRaises(ValueError):
+            clash.meld(pairing_heap.PairingHeap(policy="edf"))
+
+    def test_random_operations_match_sorted_order(self):
+        rng = random.Random(11)
+        heaps = [pairing_heap.PairingHeap() for _ in range(4)]
+        priorities = {}
+        next_id = 0
+        for _ in range(4_000):
+            heap = rng.choice(heaps)
+            op = rng.random()
+            if op < 0.5 or not heap.nodes:
+                priority = rng.randint(0, 1_000)
+                heap.insert(Task(priority=priority, task_id=next_id))
+                priorities[next_id] = priority
+                next_id += 1
+            elif op < 0.65:
+                expected = max(heap.root.key, *(n.key for n in heap.nodes.values()))
+                task = heap.extract_max()
+                self.assertEqual(task.priority, expected)
+                del priorities[task.task_id]
+            elif op < 0.85:
+                task_id = rng.choice(list(heap.nodes))
+                priorities[task_id] = rng.randint(0, 1_000)
+                heap.update_priority(task_id, priorities[task_id])
+            elif op < 0.95:
+                del priorities[heap.remove(rng.choice(list(heap.nodes))).task_id]
+            else:
+                other = rng.choice(heaps)
+                if other is not heap:
+                    heap.meld(other)
+
+        for heap in heaps:
+            assert_heap_order(self, heap)
+        merged = heaps[0]
+        for heap in heaps[1:]:
+            merged.meld(heap)
+        drained = [task.priority for task in merged.extract_many(len(merged))]
+        self.assertEqual(drained, sorted(priorities.values(), reverse=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
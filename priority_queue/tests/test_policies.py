@@ -0,0 +1,70 @@
+import random
+import unittest
+from src import policies, priority_queue
+from src.priority_queue import Task
+
+
+def drain(pq):
+    return [task.task_id for task in iter(pq.extract_max, None)]
+
+
+class TestPolicies(unittest.TestCase):
+
+    def test_default_policy_is_max_priority(self):
+        pq = priority_queue.PriorityQueue()
+        self.assertIs(pq.policy, policies.max_priority)
+        with self.assertRaises(ValueError):
+            priority_queue.PriorityQueue(policy="no_such_policy")
+
+    def test_earliest_deadline_first(self):
+        pq = priority_queue.PriorityQueue(policy="edf")
+        pq.insert(Task(priority=9, task_id=1, deadline=30.0))
+        pq.insert(Task(priority=1, task_id=2, deadline=10.0))
+        pq.insert(Task(priority=5, task_id=3))
+        pq.insert(Task(priority=5, task_id=4, deadline=20.0))
+
+        self.assertEqual([t.task_id for t in pq.peek_top(2)], [2, 4])
+        self.assertEqual(drain(pq), [2, 4, 1, 3])
+
+    def test_priority_fifo_breaks_ties_by_arrival(self):
+        tasks = [
+            Task(priority=1, task_id=i, arrival_time=float(10 - i)) for i in range(10)
+        ]
+        tasks.append(Task(priority=2, task_id=10, arrival_time=50.0))
+        pq = priority_queue.PriorityQueue.from_tasks(tasks, policy="priority_fifo")
+
+        self.assertEqual(drain(pq), [10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0])
+
+    def test_least_slack_and_weighted(self):
+        slack = priority_queue.PriorityQueue(policy=policies.least_slack)
+        slack.insert(Task(priority=1, task_id=1, deadline=10.0, service_time=1.0))
+        slack.insert(Task(priority=1, task_id=2, deadline=12.0, service_time=5.0))
+        self.assertEqual(drain(slack), [2, 1])
+
+        # Two units of priority outweigh three time units of deadline.
+        weighted = priority_queue.PriorityQueue(
+            policy=policies.weighted(priority_weight=2.0, deadline_weight=1.0)
+        )
+        weighted.insert(Task(priority=1, task_id=1, deadline=10.0))
+        weighted.insert(Task(priority=3, task_id=2, deadline=13.0))
+        self.assertEqual(drain(weighted), [2, 1])
+
+    def test_key_updates_follow_policy(self):
+        pq = priority_queue.PriorityQueue(policy="priority_fifo", arity=3)
+        rng = random.Random(7)
+        for i in range(200):
+            pq.insert(Task(priority=rng.randint(1, 5), task_id=i, arrival_time=i))
+        for i in rng.sample(range(200), 50):
+            pq.update_priority(i, rng.randint(1, 5))
+        for i in rng.sample(range(200), 30):
+            pq.cancel(i)
+
+        self.assertEqual(len(pq.keys), len(pq.heap))
+        for index, task in enumerate(pq.heap):
+            self.assertEqual(pq.keys[index], policies.priority_fifo(task))
+        order = [(t.priority, -t.arrival_time) for t in pq.extract_many(len(pq))]
+        self.assertEqual(order, sorted(order, reverse=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,6 @@
+import os
+import random
+import tempfile
 import unittest
 from src import priority_queue
 
@@ -54,6 +57,252 @@ class TestPriorityQueue(unittest.TestCase):
         with self.assertRaises(ValueError):
             pq.decrease_key(1, 10)  # higher new priority is invalid
 
+    def assert_heap_invariants(self, pq):
+        for i, task in enumerate(pq.heap):
+            self.assertEqual(pq.task_index_map[task.task_id], i)
+            if i > 0:
+                parent = pq.heap[(i - 1) // pq.arity]
+                self.assertLessEqual(task.priority, parent.priority)
+        self.assertEqual(len(pq.task_index_map), len(pq.heap))
+
+    def test_index_map_tracks_every_move(self):
+        rng = random.Random(7)
+        pq = priority_queue.PriorityQueue()
+        for task_id in range(200):
+            pq.insert(priority_queue.Task(priority=rng.randint(0, 50), task_id=task_id))
+        self.assert_heap_invariants(pq)
+
+        for _ in range(50):
+            pq.extract_max()
+            self.assert_heap_invariants(pq)
+
+    def test_contains_and_get(self):
+        pq = priority_queue.PriorityQueue()
+        task = priority_queue.Task(priority=3, task_id=1)
+        pq.insert(task)
+
+        self.assertTrue(pq.contains(1))
+        self.assertIn(1, pq)
+        self.assertIs(pq.get(1), task)
+        self.assertFalse(pq.contains(2))
+        self.assertIsNone(pq.get(2))
+
+        pq.extract_max()
+        self.assertFalse(pq.contains(1))
+        self.assertIsNone(pq.get(1))
+
+    def test_remove(self):
+        rng = random.Random(11)
+        pq = priority_queue.PriorityQueue()
+        for task_id in range(100):
+            pq.insert(priority_queue.Task(priority=rng.randint(0, 20), task_id=task_id))
+
+        for task_id in rng.sample(range(100), 60):
+            removed = pq.remove(task_id)
+            self.assertEqual(removed.task_id, task_id)
+            self.assertFalse(pq.contains(task_id))
+            self.assert_heap_invariants(pq)
+
+        self.assertEqual(len(pq), 40)
+        with self.assertRaises(ValueError):
+            pq.remove(1000)
+
+    def test_update_priority(self):
+        rng = random.Random(3)
+        pq = priority_queue.PriorityQueue()
+        for task_id in range(100):
+            pq.insert(priority_queue.Task(priority=rng.randint(0, 20), task_id=task_id))
+
+        for _ in range(300):
+            pq.update_priority(rng.randrange(100), rng.randint(0, 20))
+            self.assert_heap_invariants(pq)
+
+        priorities = [pq.extract_max().priority for _ in range(100)]
+        self.assertEqual(priorities, sorted(priorities, reverse=True))
+        with self.assertRaises(ValueError):
+            pq.update_priority(1, 5)
+
+    def test_duplicate_insert(self):
+        pq = priority_queue.PriorityQueue()
+        pq.insert(priority_queue.Task(priority=3, task_id=1))
+        with self.assertRaises(ValueError):
+            pq.insert(priority_queue.Task(priority=4, task_id=1))
+
+    def test_from_tasks(self):
+        rng = random.Random(5)
+        tasks = [
+            priority_queue.Task(priority=rng.randint(0, 30), task_id=task_id)
+            for task_id in range(150)
+        ]
+        pq = priority_queue.PriorityQueue.from_tasks(tasks)
+        self.assert_heap_invariants(pq)
+        self.assertEqual(len(pq), 150)
+
+        with self.assertRaises(ValueError):
+            priority_queue.PriorityQueue.from_tasks(tasks + tasks[:1])
+
+    def test_insert_many(self):
+        rng = random.Random(9)
+        pq = priority_queue.PriorityQueue()
+        next_id = 0
+        # Mix small batches (sifted one by one) and large ones (rebuilt).
+        for batch_size in (50, 3, 100, 1, 400):
+            batch = []
+            for _ in range(batch_size):
+                priority = rng.randint(0, 30)
+                batch.append(priority_queue.Task(priority=priority, task_id=next_id))
+                next_id += 1
+            pq.insert_many(batch)
+            self.assert_heap_invariants(pq)
+        self.assertEqual(len(pq), next_id)
+
+        with self.assertRaises(ValueError):
+            pq.insert_many([priority_queue.Task(priority=1, task_id=0)])
+        self.assertEqual(len(pq), next_id)
+
+    def test_extract_many_and_peek_top(self):
+        rng = random.Random(13)
+        priorities = [rng.randint(0, 100) for _ in range(200)]
+        pq = priority_queue.PriorityQueue.from_tasks(
+            priority_queue.Task(priority=p, task_id=i) for i, p in enumerate(priorities)
+        )
+        expected = sorted(priorities, reverse=True)
+
+        peeked = [task.priority for task in pq.peek_top(64)]
+        self.assertEqual(peeked, expected[:64])
+        self.assertEqual(len(pq), 200)
+
+        extracted = [task.priority for task in pq.extract_many(64)]
+        self.assertEqual(extracted, expected[:64])
+        self.assertEqual(len(pq), 136)
+        self.assert_heap_invariants(pq)
+
+        self.assertEqual(len(pq.peek_top(1000)), 136)
+        self.assertEqual(len(pq.extract_many(1000)), 136)
+        self.assertEqual(pq.extract_many(5), [])
+        self.assertEqual(pq.peek_top(5), [])
+
+    def test_arity(self):
+        for arity in (2, 3, 4, 8):
+            with self.subTest(arity=arity):
+                rng = random.Random(arity)
+                tasks = [
+                    priority_queue.Task(priority=rng.randint(0, 40), task_id=task_id)
+                    for task_id in range(300)
+                ]
+                pq = priority_queue.PriorityQueue.from_tasks(tasks[:100], arity=arity)
+                self.assertEqual(pq.arity, arity)
+                self.assert_heap_invariants(pq)
+
+                for task in tasks[100:]:
+                    pq.insert(task)
+                for task_id in rng.sample(range(300), 50):
+                    pq.update_priority(task_id, rng.randint(0, 40))
+                for task_id in rng.sample(range(300), 50):
+                    pq.remove(task_id)
+                self.assert_heap_invariants(pq)
+
+                peeked = [task.priority for task in pq.peek_top(20)]
+                priorities = [task.priority for task in pq.extract_many(250)]
+                self.assertEqual(peeked, priorities[:20])
+                self.assertEqual(priorities, sorted(priorities, reverse=True))
+
+    def test_invalid_arity(self):
+        with self.assertRaises(ValueError):
+            priority_queue.PriorityQueue(arity=1)
+
+    def test_cancel(self):
+        pq = priority_queue.PriorityQueue(max_dead_fraction=0.9)
+        for task_id in range(10):
+            pq.insert(priority_queue.Task(priority=task_id, task_id=task_id))
+
+        cancelled = pq.cancel(9)
+        self.assertEqual(cancelled.task_id, 9)
+        pq.cancel(4)
+        self.assertEqual((pq.live_count, pq.dead_count), (8, 2))
+        self.assertEqual(len(pq), 8)
+        self.assertFalse(pq.contains(9))
+        self.assertIsNone(pq.get(4))
+        with self.assertRaises(ValueError):
+            pq.cancel(9)
+        with self.assertRaises(ValueError):
+            pq.increase_key(4, 20)
+
+        self.assertEqual([t.task_id for t in pq.peek_top(3)], [8, 7, 6])
+        self.assertEqual(pq.extract_max().task_id, 8)
+        self.assertEqual(pq.dead_count, 1)
+
+        # A cancelled id can be reused straight away.
+        pq.insert(priority_queue.Task(priority=1, task_id=4))
+        self.assertEqual(pq.dead_count, 0)
+        self.assert_heap_invariants(pq)
+
+        priorities = [task.priority for task in pq.extract_many(100)]
+        self.assertEqual(priorities, [7, 6, 5, 3, 2, 1, 1, 0])
+        self.assertTrue(pq.is_empty())
+        self.assertIsNone(pq.extract_max())
+
+    def test_cancel_compaction(self):
+        pq = priority_queue.PriorityQueue.from_tasks(
+            (priority_queue.Task(priority=i % 7, task_id=i) for i in range(100)),
+            max_dead_fraction=0.25,
+        )
+        for task_id in range(0, 100, 2):
+            pq.cancel(task_id)
+
+        self.assertGreaterEqual(pq.compactions, 1)
+        self.assertLessEqual(pq.dead_count, 0.25 * len(pq.heap))
+        self.assertEqual(pq.live_count, 50)
+        self.assert_heap_invariants(pq)
+
+        remaining = pq.extract_many(100)
+        self.assertEqual(sorted(t.task_id for t in remaining), list(range(1, 100, 2)))
+
+        with self.assertRaises(ValueError):
+            priority_queue.PriorityQueue(max_dead_fraction=0)
+
+    def test_snapshot_and_restore(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "queue.snapshot")
+
+        rng = random.Random(5)
+        tasks = [
+            priority_queue.Task(
+                priority=rng.randint(-50, 50),
+                task_id=i,
+                arrival_time=rng.random(),
+                deadline=None if i % 3 else rng.uniform(5, 15),
+                service_time=None if i % 2 else 0.5,
+            )
+            for i in range(200)
+        ]
+        pq = priority_queue.PriorityQueue.from_tasks(tasks, arity=4)
+        pq.cancel(7)
+        self.assertEqual(pq.snapshot(path), 199)
+
+        restored = priority_queue.PriorityQueue.restore(path)
+        self.assertEqual(restored.arity, 4)
+        self.assertEqual(restored.heap, pq.heap)
+        self.assertEqual(restored.keys, pq.keys)
+        self.assertEqual(restored.task_index_map, pq.task_index_map)
+        self.assert_heap_invariants(restored)
+        self.assertEqual(
+            [t.task_id for t in restored.extract_many(199)],
+            [t.task_id for t in pq.extract_many(199)],
+        )
+
+        edf = priority_queue.PriorityQueue.from_tasks(tasks, policy="edf")
+        edf.snapshot(path)
+        self.assertEqual(priority_queue.PriorityQueue.restore(path).keys, edf.keys)
+        with self.assertRaises(ValueError):
+            priority_queue.PriorityQueue.restore(path, policy="max_priority")
+
+        with open(path, "r+b") as snapshot:
+            snapshot.truncate(100)
+        with self.assertRaises(ValueError):
+            priority_queue.PriorityQueue.restore(path)
+
 
 if __name__ == "__main__":
     unittest.main()
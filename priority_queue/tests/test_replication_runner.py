@@ -0,0 +1,46 @@
+import unittest
+from src import replication_runner, scheduler_simulation
+
+CONFIG = {
+    "num_tasks": 200,
+    "horizon": 60.0,
+    "num_workers": 2,
+    "service_time": scheduler_simulation.exponential_service(0.5),
+    "drop_expired": True,
+}
+
+
+class TestReplicationRunner(unittest.TestCase):
+
+    def test_parallel_matches_serial(self):
+        seeds = range(8)
+        serial = replication_runner.run_replications(CONFIG, seeds, max_workers=1)
+        parallel = replication_runner.run_replications(CONFIG, seeds, max_workers=2)
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial["replications"], 8)
+        self.assertEqual([r["seed"] for r in serial["results"]], list(seeds))
+
+    def test_summary_statistics(self):
+        merged = replication_runner.run_replications(CONFIG, [1, 2, 3], max_workers=1)
+        for metric in replication_runner.METRICS:
+            interval = merged[metric]
+            self.assertLessEqual(interval["ci_low"], interval["mean"])
+            self.assertLessEqual(interval["mean"], interval["ci_high"])
+        rate = merged["deadline_miss_rate"]["mean"]
+        self.assertTrue(0.0 <= rate <= 1.0)
+
+        with self.assertRaises(ValueError):
+            replication_runner.run_replications(CONFIG, [], max_workers=1)
+
+    def test_confidence_interval(self):
+        interval = replication_runner.confidence_interval([1.0, 2.0, 3.0, 4.0])
+        self.assertAlmostEqual(interval["mean"], 2.5)
+        # t(3) = 3.182, stdev = 1.291, n = 4
+        self.assertAlmostEqual(interval["ci_high"] - 2.5, 3.182 * 1.2910 / 2, 3)
+        single = replication_runner.confidence_interval([5.0])
+        self.assertEqual((single["ci_low"], single["ci_high"]), (5.0, 5.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import contextlib
+import io
+import unittest
+from src import priority_queue, scheduler_simulation
+
+
+def make_simulation(tasks, **options):
+    options.setdefault("record_completed", True)
+    sim = scheduler_simulation.SchedulerSimulation(**options)
+    sim.tasks = [
+        priority_queue.Task(
+            priority=priority, task_id=i, arrival_time=arrival, deadline=deadline
+        )
+        for i, (priority, arrival, deadline) in enumerate(tasks, start=1)
+    ]
+    return sim
+
+
+class TestSchedulerSimulation(unittest.TestCase):
+
+    def test_single_worker_priority_order(self):
+        sim = make_simulation([(1, 0.0, 10.0), (5, 0.5, 10.0), (9, 0.5, 2.0)])
+        sim.run()
+
+        order = [(task.task_id, time) for task, time in sim.completed_tasks]
+        self.assertEqual(order, [(1, 1.0), (3, 2.0), (2, 3.0)])
+        stats = sim.summary()
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["missed_deadlines"], 0)
+        self.assertAlmostEqual(stats["mean_wait"], (0.0 + 0.5 + 1.5) / 3)
+        self.assertEqual(stats["end_time"], 3.0)
+
+    def test_parallel_workers(self):
+        sim = make_simulation(
+            [(1, 0.0, 10.0), (2, 0.0, 10.0), (3, 0.0, 10.0)],
+            num_workers=2,
+            service_time=2.0,
+        )
+        sim.run()
+
+        finished = {task.task_id: time for task, time in sim.completed_tasks}
+        self.assertEqual(finished, {3: 2.0, 2: 2.0, 1: 4.0})
+        self.assertAlmostEqual(sim.summary()["utilization"], 6.0 / 8.0)
+
+    def test_preemption(self):
+        sim = make_simulation(
+            [(1, 0.0, 100.0), (9, 1.0, 100.0)], service_time=3.0, preemptive=True
+        )
+        sim.run()
+
+        finished = [(task.task_id, time) for task, time in sim.completed_tasks]
+        # Task 2 takes over at t=1; task 1 resumes with 2 units left.
+        self.assertEqual(finished, [(2, 4.0), (1, 6.0)])
+        self.assertEqual(sim.metrics.preempted, 1)
+        self.assertEqual(sim.metrics.by_priority[1].preempted, 1)
+        self.assertEqual(sim.metrics.by_priority[9].preempted, 0)
+        self.assertAlmostEqual(sim.summary()["utilization"], 1.0)
+
+    def test_deadline_misses_and_expiry(self):
+        tasks = [(5, 0.0, 100.0), (1, 0.0, 1.5), (1, 0.0, 100.0)]
+        late = make_simulation(tasks)
+        late.run()
+        self.assertEqual(late.summary()["missed_deadlines"], 1)
+
+        dropped = make_simulation(tasks, drop_expired=True)
+        dropped.run()
+        stats = dropped.summary()
+        self.assertEqual((stats["completed"], stats["expired"]), (2, 1))
+        self.assertEqual(stats["missed_deadlines"], 0)
+
+    def test_edf_policy(self):
+        tasks = [(1, 0.0, 100.0), (9, 0.5, 50.0), (1, 0.5, 2.5)]
+        by_priority = make_simulation(tasks)
+        by_priority.run()
+        self.assertEqual(by_priority.summary()["missed_deadlines"], 1)
+
+        edf = make_simulation(tasks, policy="edf")
+        edf.run()
+        order = [task.task_id for task, _ in edf.completed_tasks]
+        self.assertEqual(order, [1, 3, 2])
+        self.assertEqual(edf.summary()["missed_deadlines"], 0)
+
+    def test_generated_run_is_quiet_and_reproducible(self):
+        results = []
+        for _ in range(2):
+            sim = scheduler_simulation.SchedulerSimulation(
+                num_workers=3,
+                service_time=scheduler_simulation.exponential_service(0.5),
+                seed=42,
+                record_completed=False,
+            )
+            sim.generate_tasks(500, horizon=50.0)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                sim.run()
+            self.assertEqual(output.getvalue(), "")
+            self.assertEqual(sim.completed_tasks, [])
+            results.append(sim.summary())
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0]["completed"], 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import random
+import time
+import unittest
+from src import sharded_queue
+from src.priority_queue import Task
+
+
+def label(task: Task) -> int:
+    return task.task_id
+
+
+def slow_label(task: Task) -> int:
+    """label, slowed so a busy worker is still busy when the others ask."""
+    time.sleep(0.001)
+    return task.task_id
+
+
+def drain_rank_errors(queue, tasks: list[Task]) -> list[int]:
+    """Extract everything, recording each extraction's rank error."""
+    queued = sorted(task.priority for task in tasks)
+    errors = []
+    while True:
+        task = queue.extract_max()
+        if task is None:
+            return errors
+        errors.append(sharded_queue.rank_error(queued, task.priority))
+        queued.remove(task.priority)
+
+
+class TestShardedPriorityQueue(unittest.TestCase):
+
+    def make_tasks(self, count: int, seed: int = 0) -> list[Task]:
+        rng = random.Random(seed)
+        return [Task(priority=rng.randint(1, 10_000), task_id=i) for i in range(count)]
+
+    def test_top_of_shards_is_exact(self):
+        tasks = self.make_tasks(500)
+        for assignment in sharded_queue.ASSIGNMENTS:
+            with self.subTest(assignment=assignment):
+                queue = sharded_queue.ShardedPriorityQueue(
+                    num_shards=8, assignment=assignment, selection="top_of_shards"
+                )
+                queue.insert_many(tasks)
+                self.assertEqual(len(queue), 500)
+                errors = drain_rank_errors(queue, tasks)
+                self.assertEqual(len(errors), 500)
+                self.assertEqual(max(errors), 0)
+
+    def test_two_choice_rank_error_is_bounded(self):
+        num_shards = 8
+        tasks = self.make_tasks(2_000)
+        queue = sharded_queue.ShardedPriorityQueue(num_shards=num_shards, seed=1)
+        for task in tasks:
+            queue.insert(task)
+        errors = drain_rank_errors(queue, tasks)
+
+        # Every task comes out exactly once, and the mean deviation from the
+        # exact order stays within the O(K) bound of two-choice sampling.
+        self.assertEqual(len(errors), 2_000)
+        self.assertTrue(queue.is_empty())
+        self.assertLessEqual(sum(errors) / len(errors), num_shards)
+
+    def test_rejected_batch_records_no_owner(self):
+        queue = sharded_queue.ShardedPriorityQueue(
+            assignment="round_robin", selection="top_of_shards"
+        )
+        queue.insert(Task(priority=1, task_id=5))
+        for batch in (
+            [Task(priority=1, task_id=1), Task(priority=2, task_id=1)],
+            [Task(priority=1, task_id=2), Task(priority=2, task_id=5)],
+        ):
+            with self.assertRaises(ValueError):
+                queue.insert_many(batch)
+        self.assertEqual(len(queue), 1)
+        self.assertIsNone(queue.shard_of(1))
+        self.assertIsNone(queue.shard_of(2))
+        queue.insert_many([Task(priority=3, task_id=1), Task(priority=4, task_id=2)])
+        self.assertEqual(queue.extract_max().task_id, 2)
+
+    def test_rejected_hash_batch_inserts_nothing(self):
+        queue = sharded_queue.ShardedPriorityQueue(selection="top_of_shards")
+        queue.insert(Task(priority=1, task_id=1))
+        for batch in (
+            [Task(priority=5, task_id=0), Task(priority=5, task_id=1)],
+            [Task(priority=5, task_id=2), Task(priority=6, task_id=2)],
+        ):
+            with self.assertRaises(ValueError):
+                queue.insert_many(batch)
+        self.assertEqual(len(queue), 1)
+        self.assertFalse(queue.contains(0))
+        queue.insert_many([Task(priority=5, task_id=0), Task(priority=6, task_id=2)])
+        self.assertEqual(queue.extract_max().task_id, 2)
+
+    def test_by_id_operations_and_stealing(self):
+        queue = sharded_queue.ShardedPriorityQueue(
+            num_shards=2, assignment="round_robin"
+        )
+        queue.insert_many(Task(priority=p, task_id=i) for i, p in enumerate(range(10)))
+        with self.assertRaises(ValueError):
+            queue.insert(Task(priority=1, task_id=3))
+
+        queue.cancel(4)
+        queue.update_priority(1, 100)
+        self.assertFalse(queue.contains(4))
+        self.assertEqual(queue.steal(thief=0, victim=1), 3)
+        self.assertEqual(len(queue.shards[1]), 2)
+        self.assertTrue(queue.contains(9))
+
+        # Shard 0 drains first, then steals what is left of shard 1.
+        drained = [queue.extract_from(0) for _ in range(9)]
+        self.assertEqual(drained[0].task_id, 1)
+        drained_ids = sorted(task.task_id for task in drained)
+        self.assertEqual(drained_ids, [0, 1, 2, 3, 5, 6, 7, 8, 9])
+        self.assertIsNone(queue.extract_from(0))
+        with self.assertRaises(ValueError):
+            queue.cancel(4)
+
+
+class TestRunSharded(unittest.TestCase):
+
+    def test_every_task_is_processed_once(self):
+        # Ids that all hash to worker 0, so the other workers only get work by
+        # stealing it.
+        tasks = [Task(priority=i % 7, task_id=3 * i) for i in range(600)]
+        results = sharded_queue.run_sharded(
+            tasks, slow_label, num_workers=3, work_stealing=True, check_every=8
+        )
+
+        processed = [task_id for _, _, _, labels in results for task_id in labels]
+        self.assertEqual(sorted(processed), [task.task_id for task in tasks])
+        self.assertEqual([index for index, *_ in results], [0, 1, 2])
+        self.assertEqual(sum(count for _, count, _, _ in results), 600)
+        for _, count, received, _ in results[1:]:
+            self.assertGreater(received, 0)
+            self.assertGreater(count, 0)
+
+    def test_without_stealing_workers_keep_their_shard(self):
+        tasks = [Task(priority=i, task_id=i) for i in range(40)]
+        results = sharded_queue.run_sharded(
+            tasks, label, num_workers=2, assignment="round_robin", work_stealing=False
+        )
+        for index, count, received, labels in results:
+            self.assertEqual(count, 20)
+            self.assertEqual(received, 0)
+            # Each worker serves its own shard in priority order.
+            self.assertEqual(labels, sorted(labels, reverse=True))
+            self.assertTrue(all(task_id % 2 == index for task_id in labels))
+
+
+if __name__ == "__main__":
+    unittest.main()
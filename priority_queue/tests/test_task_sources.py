@@ -0,0 +1,87 @@
+import itertools
+import os
+import tempfile
+import unittest
+from src import scheduler_simulation, task_sources
+from src.priority_queue import Task
+
+
+class TestTaskSources(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_random_tasks_are_lazy_and_ordered(self):
+        source = task_sources.random_tasks(10**12, horizon=10**11, seed=3)
+        tasks = list(itertools.islice(source, 1_000))
+
+        arrivals = [task.arrival_time for task in tasks]
+        self.assertEqual(arrivals, sorted(arrivals))
+        self.assertEqual([task.task_id for task in tasks], list(range(1, 1_001)))
+        again = task_sources.random_tasks(10**12, horizon=10**11, seed=3)
+        self.assertEqual(tasks, list(itertools.islice(again, 1_000)))
+
+    def test_trace_round_trip(self):
+        tasks = list(task_sources.random_tasks(50, seed=1, service_time=0.5))
+        tasks.append(Task(priority=3, task_id=51, arrival_time=99.0))
+
+        for writer, reader, name in [
+            (task_sources.write_csv_trace, task_sources.csv_tasks, "trace.csv"),
+            (task_sources.write_jsonl_trace, task_sources.jsonl_tasks, "trace.jsonl"),
+        ]:
+            with self.subTest(name=name):
+                self.assertEqual(writer(tasks, self.path(name)), 51)
+                self.assertEqual(list(reader(self.path(name))), tasks)
+
+    def test_unsorted_trace_is_rejected(self):
+        with open(self.path("bad.csv"), "w") as trace:
+            trace.write("task_id,priority,arrival\n1,5,2.0\n2,5,1.0\n")
+        with self.assertRaises(ValueError):
+            list(task_sources.csv_tasks(self.path("bad.csv")))
+
+    def test_simulation_pulls_arrivals_lazily(self):
+        pulled = []
+
+        def source():
+            for task in task_sources.random_tasks(1_000, horizon=1_000.0, seed=5):
+                pulled.append(task.task_id)
+                yield task
+
+        sim = scheduler_simulation.SchedulerSimulation(
+            num_workers=2, service_time=1.0, record_completed=False
+        )
+        seen_at_first_completion = []
+        complete = sim._complete
+
+        def record(task, now):
+            if not seen_at_first_completion:
+                seen_at_first_completion.append(len(pulled))
+            complete(task, now)
+
+        sim._complete = record
+        sim.run(source())
+
+        self.assertLess(seen_at_first_completion[0], 10)
+        self.assertEqual(sim.summary()["arrived"], 1_000)
+        self.assertEqual(sim.summary()["completed"], 1_000)
+
+    def test_trace_replay_matches_in_memory_run(self):
+        tasks = list(task_sources.random_tasks(300, horizon=100.0, seed=9))
+        task_sources.write_jsonl_trace(tasks, self.path("trace.jsonl"))
+
+        in_memory = scheduler_simulation.SchedulerSimulation(num_workers=2, seed=4)
+        in_memory.tasks = list(tasks)
+        in_memory.run()
+        streamed = scheduler_simulation.SchedulerSimulation(num_workers=2, seed=4)
+        streamed.run(task_sources.jsonl_tasks(self.path("trace.jsonl")))
+
+        self.assertEqual(streamed.summary(), in_memory.summary())
+        self.assertEqual(streamed.tasks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()